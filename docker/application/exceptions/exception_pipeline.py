@@ -0,0 +1,35 @@
+from typing import Dict, List
+
+
+class PipelineNodeSkippedError(Exception):
+    """
+    Raised for a pipeline node that was not executed because one of its dependencies failed.
+    """
+
+    def __init__(self, node_key: str, dependency_key: str, error: Exception):
+        """
+        Args:
+            node_key (str): The key of the skipped node.
+            dependency_key (str): The key of the failed dependency.
+            error (Exception): The error raised by the dependency.
+        """
+        super().__init__(f"Node '{node_key}' skipped because dependency '{dependency_key}' failed: {error}")
+        self.node_key = node_key
+        self.dependency_key = dependency_key
+        self.original_exception = error
+
+
+class PipelineFailedError(Exception):
+    """
+    Raised when nodes of a pipeline failed, the nodes depending on them were skipped.
+    """
+
+    def __init__(self, failed: Dict[str, Exception], skipped: List[str]):
+        """
+        Args:
+            failed (Dict[str, Exception]): The error of every node that failed.
+            skipped (List[str]): The keys of the nodes skipped because of them.
+        """
+        super().__init__(f"Pipeline nodes failed: {sorted(failed)}, skipped: {sorted(skipped)}")
+        self.failed = failed
+        self.skipped = skipped
@@ -0,0 +1,15 @@
+from typing import Dict
+
+
+class ReadinessTimeoutError(Exception):
+    """
+    Raised when VMs or services did not become ready before their deadline.
+    """
+
+    def __init__(self, waiting: Dict[str, str]):
+        """
+        Args:
+            waiting (Dict[str, str]): The name of the probe every timed out VM was still waiting for.
+        """
+        super().__init__(f"Not ready before the deadline: {waiting}")
+        self.waiting = waiting
@@ -0,0 +1,15 @@
+from typing import Dict
+
+
+class SwarmJoinError(Exception):
+    """
+    Raised when workers could not join the swarm.
+    """
+
+    def __init__(self, errors: Dict[str, Exception]):
+        """
+        Args:
+            errors (Dict[str, Exception]): The error of every worker that did not join.
+        """
+        super().__init__(f"Workers failed to join the swarm: {sorted(errors)}")
+        self.errors = errors
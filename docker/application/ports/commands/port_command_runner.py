@@ -1,4 +1,6 @@
+import time
 from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
 
 
 class PortCommandRunner(ABC):
@@ -8,6 +10,28 @@ class PortCommandRunner(ABC):
             "current_step": "Initialized",
             "result": "Pending",
         }
+        self.output_listeners: List[Callable[[str], None]] = []
+        # Monotonic time the process of the last command was started, None if the runner does not spawn processes
+        self.spawned_at: Optional[float] = None
+
+    def add_output_listener(self, listener: Callable[[str], None]):
+        """Registers a callback receiving every output line while the command is running."""
+        self.output_listeners.append(listener)
+
+    def remove_output_listener(self, listener: Callable[[str], None]):
+        """Unregisters a callback, a runner reused by a later command must not feed it anymore."""
+        if listener in self.output_listeners:
+            self.output_listeners.remove(listener)
+
+    def mark_spawned(self):
+        """Records that the process of the command is running, for the spawn latency of the timing report."""
+        self.spawned_at = time.monotonic()
+
+    def emit_output(self, line: str):
+        """Forwards an output line to all registered listeners."""
+        for listener in self.output_listeners:
+            listener(line)
+
     @abstractmethod
-    async def run(self, command: str) -> str:
+    async def run(self, command: str, timeout: int = 120) -> str:
         pass
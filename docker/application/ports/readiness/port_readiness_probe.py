@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class PortReadinessProbe(ABC):
+    """
+    Checks once whether a VM or service is ready, e.g. reachable, a unit active or an endpoint answering.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Describes what the probe waits for, shown in the UI and in errors."""
+        pass
+
+    @abstractmethod
+    async def check(self) -> bool:
+        """
+        Returns True if ready. Not being ready is reported by False, not by an exception.
+        """
+        pass
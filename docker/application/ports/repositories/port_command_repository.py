@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 from domain.command.command_entity import CommandEntity
 
@@ -9,6 +9,13 @@ class PortCommandRepository(ABC):
     Interface for a task repository.
     """
 
+    @property
+    def name(self) -> Optional[str]:
+        """
+        Name identifying the repository in a CommandPlan, None if its commands cannot be planned.
+        """
+        return None
+
     @abstractmethod
     def get_all_commands(self) -> Dict[int, CommandEntity]:
         """
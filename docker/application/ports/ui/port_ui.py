@@ -1,30 +1,122 @@
 import asyncio
+import queue
 import threading
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from domain.command.command_executer.status_event import StatusEvent
 
 
 class PortUI(ABC):
 
-    def __init__(self, instances, test_mode=False):
-        """test_mode: If True, the UI will exit after 2 seconds."""
+    def __init__(self, instances, test_mode=False, persistent=False):
+        """
+        test_mode: If True, the UI will exit after 2 seconds.
+        persistent: If True, the UI stays open after all instances completed until close() is called.
+        """
         self.instances = instances
         self.status = {instance: {"current_task": "Starting...", "current_step": "Initializing...", "result": "Pending"}
                        for instance in instances}
+        # Pipeline stage per instance, one UI shows all stages of a run
+        self.stages: Dict[str, str] = {instance: "" for instance in instances}
         self.lock = threading.Lock()
+        self.events: "queue.Queue[StatusEvent]" = queue.Queue()
         self.ui_thread = None
         self.test_mode = test_mode
+        self.persistent = persistent
+        self.closed = threading.Event()
 
     def update_status(self, instance, task, step, result=None):
         """
         Updates the status of an instance.
         """
+        self.publish(StatusEvent(instance=instance, task=task, step=step, result=result))
+
+    def publish(self, event: StatusEvent):
+        """
+        Applies a status transition and queues it for the render loop.
+        Publishing never blocks, so the execution does not depend on the display speed.
+        """
+        if self.apply(event):
+            self.events.put(event)
+
+    def apply(self, event: StatusEvent) -> bool:
+        """Applies a status transition to the status of the instances, False if the instance is unknown."""
+        with self.lock:
+            if event.instance not in self.status:
+                return False
+            if event.stage is not None:
+                self.stages[event.instance] = event.stage
+                return True
+            self.status[event.instance]["current_task"] = event.task
+            self.status[event.instance]["current_step"] = event.step
+            if event.result:
+                self.status[event.instance]["result"] = event.result
+        return True
+
+    def attach(self, instances: List[str], stage: Optional[str] = None):
+        """
+        Attaches an executor to the UI. Instances the UI does not show yet get a column.
+
+        :param stage: Stage the instances enter, the stage is kept if None.
+        """
         with self.lock:
-            if instance in self.status:
-                self.status[instance]["current_task"] = task
-                self.status[instance]["current_step"] = step
-                if result:
-                    self.status[instance]["result"] = result
+            for instance in instances:
+                if instance not in self.status:
+                    self.status[instance] = {"current_task": "Starting...", "current_step": "Initializing...",
+                                             "result": "Pending"}
+                    # Replaced instead of appended, so a render loop iterating the old list is not disturbed
+                    self.instances = self.instances + [instance]
+        if stage is not None:
+            for instance in instances:
+                self.publish(StatusEvent(instance=instance, stage=stage))
+
+    def detach(self, instances: List[str], stage: Optional[str] = None):
+        """
+        Detaches an executor from the UI, the instances leave the stage unless another stage was entered meanwhile.
+        """
+        if stage is None:
+            return
+        for instance in instances:
+            if self.stage_of(instance) == stage:
+                self.publish(StatusEvent(instance=instance, stage=""))
+
+    def stage_of(self, instance: str) -> str:
+        with self.lock:
+            return self.stages.get(instance, "")
+
+    def drain_events(self) -> List[StatusEvent]:
+        """Returns all queued status transitions without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def wait_for_events(self, timeout: float) -> List[StatusEvent]:
+        """Blocks until at least one status transition is queued or the timeout expired."""
+        try:
+            first = self.events.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        return [first] + self.drain_events()
+
+    def close(self):
+        """Signals the UI to finish, used for persistent UIs shared by several runs."""
+        self.closed.set()
+        # Wake up a render loop waiting for events
+        self.events.put(StatusEvent(instance="", task="closing"))
+
+    def is_finished(self) -> bool:
+        """Returns True if the UI loop should end."""
+        if self.closed.is_set():
+            return True
+        if self.persistent:
+            return False
+        return all(self.status[instance]["result"] in ["Success", "Error"] for instance in self.instances)
+
     def start_in_thread(self):
         """Starts the UI in a separate thread asynchronously using asyncio."""
         try:
@@ -39,4 +131,4 @@ class PortUI(ABC):
     @abstractmethod
     def start(self):
         """run: Runs the UI."""
-        pass
\ No newline at end of file
+        pass
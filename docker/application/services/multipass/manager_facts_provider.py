@@ -0,0 +1,45 @@
+import asyncio
+from typing import Optional
+
+from application.ports.ui.port_ui import PortUI
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.swarm.manager_facts import ManagerFacts
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.ui.command_sync_runner_ui import SyncCommandRunnerUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+FACTS_COMMANDS = "command_multipass_docker_swarm_manager_facts.yaml"
+
+
+class ManagerFactsProvider:
+    """
+    Gathers IP, join tokens and nodes of the swarm manager with one remote call and keeps them for the run.
+    Concurrent callers share the same query.
+    """
+
+    def __init__(self, ui: Optional[PortUI] = None):
+        self.ui = ui
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self._facts: Optional[asyncio.Task] = None
+
+    async def get(self) -> ManagerFacts:
+        """Returns the facts, querying the manager on the first call."""
+        if self._facts is None or (self._facts.done() and self._facts.exception() is not None):
+            self._facts = asyncio.ensure_future(self._query())
+        return await asyncio.shield(self._facts)
+
+    def invalidate(self):
+        """Forgets the facts, e.g. after the swarm changed, so the next call queries the manager again."""
+        self._facts = None
+
+    async def _query(self) -> ManagerFacts:
+        self.logger.info("Getting manager facts")
+        command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=FACTS_COMMANDS))
+        command_list = command_builder.get_command_list()
+        result = await SyncCommandRunnerUI(command_list, ui=self.ui).run()
+        outputs = [output for vm_result in result if isinstance(vm_result, dict) for output in vm_result.values()]
+        if not outputs:
+            raise ValueError("Querying the manager facts failed")
+        facts = ManagerFacts.parse(outputs[0])
+        self.logger.info(f"Manager facts: ip={facts.ip} nodes={facts.nodes}")
+        return facts
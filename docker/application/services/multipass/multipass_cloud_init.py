@@ -0,0 +1,61 @@
+from typing import List, Optional
+
+from application.ports.ui.port_ui import PortUI
+from application.services.multipass.multipass_package_cache import MultipassPackageCache
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.multipass.vm_entity import VmEntity
+from domain.multipass.vm_type import VmType
+from domain.network.ip_value import IpValue
+from domain.network.network import Network
+from infrastructure.adapters.repositories.cloud_init_repository_yaml import PortCloudInitRepositoryYaml
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.repositories.vm_repository_yaml import PortVmRepositoryYaml
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+LAUNCH_COMMANDS = "command_multipass_cloud_init_launch_yaml.yaml"
+
+
+class MultipassCloudInit:
+    """
+    Launches the VMs with a cloud-init user-data that sets up the network and docker during the first boot,
+    instead of configuring them with `multipass exec` calls and restarts afterwards.
+    """
+
+    def __init__(self, ui: Optional[PortUI] = None, package_cache: Optional[MultipassPackageCache] = None):
+        """
+        :param package_cache: Caches the workers download through, the upstream sources if None.
+                              They have to run when a worker is launched.
+        """
+        self.ui = ui
+        self.package_cache = package_cache
+        self.vm_repository = PortVmRepositoryYaml()
+        self.cloud_init_repository = PortCloudInitRepositoryYaml()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    def render(self, vm: VmEntity) -> None:
+        """Renders and saves the user-data of the VM."""
+        # As in the exec based setup only the manager gets a static address, it comes from the VM repository here
+        network = None
+        if vm.vm_type == VmType.MANAGER and vm.ipaddress and vm.gateway:
+            network = Network(vm_instance=vm.vm_instance, ip_address=IpValue(ip_address=vm.ipaddress.split("/")[0]),
+                              gateway=IpValue(ip_address=vm.gateway))
+        # The manager runs the caches, it cannot use them while it boots
+        cache = self.package_cache.cache if self.package_cache and vm.vm_type == VmType.WORKER else None
+        user_data = self.cloud_init_repository.create(network=network, cache=cache)
+        self.cloud_init_repository.save(vm.vm_instance, user_data)
+
+    async def launch(self, instances: Optional[List[str]] = None):
+        """
+        :param instances: VM instances to launch. All configured instances if None.
+        """
+        for vm in self.vm_repository.get_all_vms():
+            if instances is None or vm.vm_instance in instances:
+                self.render(vm)
+
+        self.logger.info(f"Launching with cloud-init: {instances}")
+        command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=LAUNCH_COMMANDS))
+        runner_ui = AsyncCommandRunnerUI(command_builder.get_command_list(instances), ui=self.ui)
+        result = await runner_ui.run()
+        self.logger.info(f"Launching with cloud-init: {result}")
+        runner_ui.raise_for_failures(result)
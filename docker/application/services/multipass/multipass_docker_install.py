@@ -1,4 +1,9 @@
+from typing import Dict, List, Optional
+
+from application.ports.ui.port_ui import PortUI
+from application.services.multipass.multipass_package_cache import MultipassPackageCache
 from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
 from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
 from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
 from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
@@ -6,28 +11,49 @@ from infrastructure.logging.logger_factory import LoggerFactory
 
 
 class MultipassDockerInstall:
-    def __init__(self, command_runner_factory=None):
+    def __init__(self, command_runner_factory=None, ui: Optional[PortUI] = None,
+                 package_cache: Optional[MultipassPackageCache] = None):
+        """
+        :param package_cache: Caches the apt sources are fetched through, the upstream sources if None.
+                              They have to run when the install starts.
+        """
         self.command_runner_factory = command_runner_factory or CommandRunnerFactory()
-        self.ui = None
+        self.ui = ui
+        self.package_cache = package_cache
         self.command_execute = None
         self.logger = LoggerFactory.get_logger(self.__class__)
 
-    async def run(self):
+    async def run(self, instances: Optional[List[str]] = None):
+        """
+        :param instances: VM instances to install docker on. All configured instances if None.
+        """
         self.logger.info("Install docker on multipass")
 
         multipass_command_repository = PortCommandRepositoryYaml(filename="command_multipass_docker_install_yaml.yaml")
-        command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
-        command_list = command_builder.get_command_list()
+        command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository, batch=True)
+        command_list = self._use_package_cache(command_builder.get_command_list(instances))
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"Install docker on multipass: {result}")
+        runner_ui.raise_for_failures(result)
 
         self.logger.info("Setting docker group on multipass")
         multipass_command_repository = PortCommandRepositoryYaml(filename="command_multipass_docker_prepare_repository_yaml.yaml")
-        command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
-        command_list = command_builder.get_command_list()
+        command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository, batch=True)
+        command_list = command_builder.get_command_list(instances)
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"Setting docker group on multipass: {result}")
+        runner_ui.raise_for_failures(result)
+
+    def _use_package_cache(self, command_list: Dict[str, Dict[int, ExecutableCommandEntity]]) \
+            -> Dict[str, Dict[int, ExecutableCommandEntity]]:
+        """Rewrites the apt sources of the commands to the package cache, fused commands included."""
+        if self.package_cache is None:
+            return command_list
+        cache = self.package_cache.cache
+        return {vm: {key: command.model_copy(update={"command": cache.rewrite(command.command)})
+                     for key, command in commands.items()}
+                for vm, commands in command_list.items()}
@@ -1,66 +1,79 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from application.exceptions.exception_swarm import SwarmJoinError
+from application.ports.ui.port_ui import PortUI
+from application.services.multipass.manager_facts_provider import ManagerFactsProvider
 from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
 from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
 from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
 from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
 from infrastructure.adapters.ui.command_sync_runner_ui import SyncCommandRunnerUI
 from infrastructure.logging.logger_factory import LoggerFactory
 
+# Workers joining at the same time, joins are independent once token and manager IP are known
+JOIN_MAX_PARALLEL = 4
+# Executions of the join per worker
+JOIN_ATTEMPTS = 3
+
 
 class MultipassDockerSwarmInit:
-    def __init__(self):
+    def __init__(self, ui: Optional[PortUI] = None):
         self.command_runner_factory = CommandRunnerFactory()
-        self.ui = None
+        self.ui = ui
         self.command_execute = None
         self.logger = LoggerFactory.get_logger(self.__class__)
         self.parameter: Dict[ParameterType, str] = {}
+        self.manager_facts = ManagerFactsProvider(ui=ui)
 
     async def run(self):
+        await self.init_manager()
+        await self.join_workers()
 
+    async def init_manager(self):
+        """Initializes the swarm on the manager and collects the parameters needed by the workers to join."""
         self.logger.info("Initializing Docker Swarm on Manager")
         command_list = self._setup_commands_init("command_multipass_docker_swarm_manager_init.yaml", None)
-        runner_ui = SyncCommandRunnerUI(command_list)
+        runner_ui = SyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"Initializing Docker Swarm on Manager: {result}")
+        runner_ui.raise_for_failures(result)
 
-        self.logger.info("Getting join-token for the worker")
-        command_list = self._setup_commands_init("command_multipass_docker_swarm_manager_join_token.yaml",None)
-        runner_ui = SyncCommandRunnerUI(command_list)
-        result = await runner_ui.run()
-        self.logger.info(f"Getting join-token for the worker: {result}")
-
-        self.logger.info("Getting Manager IP")
-        command_list = self._setup_commands_init("command_multipass_docker_swarm_manager_ip.yaml", None)
-        runner_ui = SyncCommandRunnerUI(command_list)
-        result = await runner_ui.run()
-        ipaddress = list(result[0].values())[0].split()[0]
-        self.parameter[ParameterType.SWARM_MANAGER_IP] = ipaddress
-        self.parameter[ParameterType.SWARM_MANAGER_PORT] = "2377"
-        self.logger.info(f"Getting Manager IP: {result}")
+        # The swarm has just been (re)initialized, facts gathered before are outdated
+        self.manager_facts.invalidate()
+        facts = await self.manager_facts.get()
+        self.parameter.update(facts.as_parameters())
+        self.logger.info(f"Manager IP {facts.ip}, swarm nodes {facts.nodes}")
 
-        self.logger.info("Getting join token")
-        command_list = self._setup_commands_init("command_multipass_docker_swarm_manager_join_token.yaml",None)
-        runner_ui = SyncCommandRunnerUI(command_list)
-        result = await runner_ui.run()
-        token = result[0][1]
-        self.parameter[ParameterType.SWARM_TOKEN] = token
-        self.logger.info(f"Getting join token: {token}")
+    async def join_workers(self, instances: Optional[List[str]] = None):
+        """
+        Joins the workers concurrently, bounded by JOIN_MAX_PARALLEL, retrying a failed join per worker.
 
+        :param instances: Worker instances to join. All configured workers if None.
+        :raises SwarmJoinError: If a worker did not join in any attempt.
+        """
         self.logger.info("Join worker to Swarm")
-        command_list = self._setup_commands_init("command_multipass_docker_swarm_join_worker.yaml", self.parameter)
-        runner_ui = SyncCommandRunnerUI(command_list)
+        command_list = self._setup_commands_init("command_multipass_docker_swarm_join_worker.yaml", self.parameter,
+                                                 instances)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui, max_parallel=JOIN_MAX_PARALLEL,
+                                         attempts=JOIN_ATTEMPTS)
         result = await runner_ui.run()
         self.logger.info(f"Join worker to Swarm: {result}")
 
-    def _setup_commands_init(self, config_file: str, parameter: Optional[Dict[ParameterType, str]]) -> Dict[
-        str, Dict[int, ExecutableCommandEntity]]:
+        errors = {vm: error for vm, error in zip(runner_ui.instances, result) if isinstance(error, Exception)}
+        if errors:
+            raise SwarmJoinError(errors)
+
+    def _setup_commands_init(self, config_file: str, parameter: Optional[Dict[ParameterType, str]],
+                             instances: Optional[List[str]] = None) -> Dict[str, Dict[int, ExecutableCommandEntity]]:
         """
         Sets up the initial multipass commands by reading from the YAML configuration.
 
         Args:
             config_file (str): The path to the YAML configuration file.
+            parameter (Optional[Dict[ParameterType, str]]): Values for the command placeholders.
+            instances (Optional[List[str]]): Restricts the commands to these VM instances.
 
         Returns:
             Dict[str, Dict[int, ExecutableCommandEntity]]: The command list.
@@ -70,5 +83,6 @@ class MultipassDockerSwarmInit:
         self.logger.info(f"getting command list from {config_file}")
         command_builder: CommandBuilder = CommandBuilder(
             command_repository=multipass_command_repository, parameter=parameter)
-        self.logger.info(f"command builder: {command_builder.get_command_list()}")
-        return command_builder.get_command_list()
+        command_list = command_builder.get_command_list(instances)
+        self.logger.info(f"command builder: {command_list}")
+        return command_list
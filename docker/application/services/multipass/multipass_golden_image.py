@@ -0,0 +1,85 @@
+from typing import List, Optional
+
+from application.ports.ui.port_ui import PortUI
+from application.services.multipass.multipass_list_instances import MultipassListInstances
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+from domain.multipass.golden_image import GoldenImage
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
+from infrastructure.adapters.ui.command_sync_runner_ui import SyncCommandRunnerUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+LAUNCH_COMMANDS = "command_multipass_golden_image_launch_yaml.yaml"
+# The recipe of the image, the image is rebuilt when one of these files changes
+RECIPE_COMMANDS = ["command_multipass_docker_install_yaml.yaml",
+                   "command_multipass_docker_prepare_repository_yaml.yaml"]
+SEAL_COMMANDS = "command_multipass_golden_image_seal_yaml.yaml"
+REMOVE_COMMANDS = "command_multipass_golden_image_remove_yaml.yaml"
+CLONE_COMMANDS = "command_multipass_clone_repository_yaml.yaml"
+
+
+class MultipassGoldenImage:
+    """
+    Provisions docker once on a golden image and clones the workers from it,
+    so a worker needs a single boot instead of its own apt downloads and installation.
+    """
+
+    def __init__(self, ui: Optional[PortUI] = None):
+        self.ui = ui
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self.image = GoldenImage.of_recipe(
+            [PortCommandRepositoryYaml(filename=filename).content_hash for filename in RECIPE_COMMANDS])
+
+    async def ensure(self):
+        """
+        Builds the image unless an image of the current recipe exists, outdated images are deleted.
+        A failed build is deleted as well, the next run builds the image again.
+
+        :raises CommandsFailedError: If a command of the build failed.
+        :raises ValueError: If the image is not ready after the build.
+        """
+        instances = await MultipassListInstances(ui=self.ui).run()
+        for outdated in self.image.outdated(instances):
+            self.logger.info(f"Deleting outdated golden image {outdated}")
+            await self._run(REMOVE_COMMANDS, outdated)
+
+        if self.image.is_ready(instances):
+            self.logger.info(f"Golden image {self.image.name} is up to date")
+            return
+
+        self.logger.info(f"Building golden image {self.image.name}")
+        try:
+            await self._run(LAUNCH_COMMANDS, self.image.name)
+            for filename in RECIPE_COMMANDS:
+                await self._run(filename, self.image.name, batch=True)
+            await self._run(SEAL_COMMANDS, self.image.name)
+            if not self.image.is_ready(await MultipassListInstances(ui=self.ui).run()):
+                raise ValueError(f"Building golden image {self.image.name} failed")
+        except Exception:
+            # A sealed image counts as ready, a half built one must not be cloned by the next run
+            self.logger.error(f"Building golden image {self.image.name} failed, deleting it")
+            try:
+                await self._run(REMOVE_COMMANDS, self.image.name)
+            except Exception as e:
+                self.logger.error(f"Deleting golden image {self.image.name} failed: {e}")
+            raise
+
+    async def clone(self, instances: Optional[List[str]] = None):
+        """
+        :param instances: Workers to clone from the image. All configured workers if None.
+        """
+        self.logger.info(f"Cloning workers from {self.image.name}")
+        command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=CLONE_COMMANDS),
+                                         parameter={ParameterType.GOLDEN_IMAGE: self.image.name})
+        runner_ui = AsyncCommandRunnerUI(command_builder.get_command_list(instances), ui=self.ui)
+        result = await runner_ui.run()
+        self.logger.info(f"Cloning workers from {self.image.name}: {result}")
+        runner_ui.raise_for_failures(result)
+
+    async def _run(self, filename: str, vm_instance: str, batch: bool = False):
+        command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=filename), batch=batch)
+        runner_ui = SyncCommandRunnerUI(command_builder.get_command_list_for(vm_instance), ui=self.ui)
+        result = await runner_ui.run()
+        self.logger.info(f"{filename} on {vm_instance}: {result}")
+        runner_ui.raise_for_failures(result)
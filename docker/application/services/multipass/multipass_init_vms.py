@@ -1,3 +1,6 @@
+from typing import List, Optional
+
+from application.ports.ui.port_ui import PortUI
 from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
 from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
 from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
@@ -6,27 +9,38 @@ from infrastructure.logging.logger_factory import LoggerFactory
 
 
 class MultipassInitVms:
-    def __init__(self, command_runner_factory=None):
+    def __init__(self, command_runner_factory=None, ui: Optional[PortUI] = None):
         self.command_runner_factory = command_runner_factory or CommandRunnerFactory()
+        self.ui = ui
         self.command_execute = None
         self.logger = LoggerFactory.get_logger(self.__class__)
 
     async def run(self):
+        await self.clean_up()
+        await self.launch()
+
+    async def clean_up(self):
         self.logger.info("init clean up")
 
         multipass_command_repository = PortCommandRepositoryYaml(filename="command_multipass_clean_repository_yaml.yaml")
         command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
         command_list = command_builder.get_command_list()
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"multipass clean up result: {result}")
+        runner_ui.raise_for_failures(result)
 
+    async def launch(self, instances: Optional[List[str]] = None):
+        """
+        :param instances: VM instances to launch. All configured instances if None.
+        """
         self.logger.info("initialisation of multipass")
         multipass_command_repository = PortCommandRepositoryYaml(filename="command_multipass_init_repository_yaml.yaml")
         command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
-        command_list = command_builder.get_command_list()
+        command_list = command_builder.get_command_list(instances)
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"initialisation of multipass: {result}")
+        runner_ui.raise_for_failures(result)
@@ -0,0 +1,31 @@
+from typing import List, Optional
+
+from application.ports.ui.port_ui import PortUI
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.multipass.multipass_instance import MultipassInstance
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.ui.command_sync_runner_ui import SyncCommandRunnerUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+LIST_COMMANDS = "command_multipass_list_repository_yaml.yaml"
+
+
+class MultipassListInstances:
+    """Lists the instances of the host, including instances that are not part of the VM repository."""
+
+    def __init__(self, ui: Optional[PortUI] = None):
+        self.ui = ui
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    async def run(self) -> List[MultipassInstance]:
+        """
+        :raises ValueError: If multipass list failed or returned no JSON.
+        """
+        command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=LIST_COMMANDS))
+        result = await SyncCommandRunnerUI(command_builder.get_command_list(), ui=self.ui).run()
+        outputs = [output for vm_result in result if isinstance(vm_result, dict) for output in vm_result.values()]
+        if not outputs:
+            raise ValueError("Listing the multipass instances failed")
+        instances = MultipassInstance.parse_list(outputs[0])
+        self.logger.info(f"Multipass instances: {[instance.name for instance in instances]}")
+        return instances
@@ -0,0 +1,92 @@
+from typing import List, Optional
+
+from application.ports.ui.port_ui import PortUI
+from application.services.readiness.readiness_waiter import ReadinessWaiter
+from domain.cache.package_cache import PackageCache
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.network.ip_extractor.strategies.ip_extractor_swarm_manager import IpExtractorSwarmManager
+from domain.network.ip_value import IpValue
+from infrastructure.adapters.readiness.http_probe import HttpProbe
+from infrastructure.adapters.readiness.vm_probes import VmProbes
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+SERVER_COMMANDS = "command_multipass_docker_cache_server_yaml.yaml"
+CLIENT_COMMANDS = "command_multipass_docker_cache_client_yaml.yaml"
+# Gateway and `hostname -I` of the manager, the address netplan makes static
+ADDRESS_COMMANDS = "command_network_ip_yaml.yaml"
+# Seconds the caches may take to answer after they were started
+READY_DEADLINE = 120
+
+
+class MultipassPackageCache:
+    """
+    Runs the apt and registry pull-through caches on the manager and points the VMs to them.
+    The caches are addressed by the address the manager got, which serve resolves before it starts them.
+    """
+
+    def __init__(self, cache: PackageCache, ui: Optional[PortUI] = None):
+        """
+        :param cache: Configuration of the caches, its host is replaced by the address of the manager.
+        """
+        self._cache = cache
+        self._resolved = False
+        self.ui = ui
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    @property
+    def cache(self) -> PackageCache:
+        """
+        The caches at the address of the manager.
+
+        :raises ValueError: If serve did not resolve the address yet.
+        """
+        if not self._resolved:
+            raise ValueError("The address of the package caches is only known once serve ran")
+        return self._cache
+
+    async def resolve(self) -> PackageCache:
+        """Asks the manager for its address, the VM repository only holds the address it was planned with."""
+        if not self._resolved:
+            command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=ADDRESS_COMMANDS))
+            runner_ui = AsyncCommandRunnerUI(command_builder.get_command_list(), ui=self.ui)
+            result = await runner_ui.run()
+            runner_ui.raise_for_failures(result)
+            addresses = IpExtractorSwarmManager().extract(result)
+            if not addresses:
+                raise ValueError(f"No address of the manager found in {result}")
+            # hostname -I lists all addresses, the first one is the address of the default interface
+            host = IpValue(ip_address=addresses.split()[0]).ip_address
+            self._cache, self._resolved = self._cache.model_copy(update={"host": host}), True
+        return self._cache
+
+    async def serve(self):
+        """
+        Starts the caches on the manager, it needs docker for the registry mirror.
+        Returns once both caches answer, so no VM downloads through a cache that is still starting.
+        """
+        await self.resolve()
+        self.logger.info(f"Starting the package caches on {self.cache.host}")
+        command_list = await self._run(SERVER_COMMANDS, None)
+        probes = {vm_instance: [VmProbes.systemd_unit_active(vm_instance, "apt-cacher-ng"),
+                                HttpProbe(f"{self.cache.registry_mirror}/v2/")]
+                  for vm_instance in command_list}
+        await ReadinessWaiter(ui=self.ui).wait_all(probes, deadline=READY_DEADLINE)
+
+    async def configure(self, instances: Optional[List[str]] = None):
+        """
+        :param instances: VM instances using the caches. All configured instances if None.
+        """
+        self.logger.info(f"Using the package caches on {instances}")
+        await self._run(CLIENT_COMMANDS, instances)
+
+    async def _run(self, filename: str, instances: Optional[List[str]]):
+        command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=filename),
+                                         parameter=self.cache.as_parameters())
+        command_list = command_builder.get_command_list(instances)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
+        result = await runner_ui.run()
+        self.logger.info(f"{filename}: {result}")
+        runner_ui.raise_for_failures(result)
+        return command_list
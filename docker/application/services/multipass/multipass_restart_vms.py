@@ -1,28 +1,52 @@
-from typing import Dict
+from typing import Callable, List, Optional
 
+from application.ports.readiness.port_readiness_probe import PortReadinessProbe
+from application.ports.ui.port_ui import PortUI
+from application.services.readiness.readiness_waiter import ReadinessWaiter
 from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
-from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
 from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
+from infrastructure.adapters.readiness.vm_probes import VmProbes
 from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
 from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
 from infrastructure.logging.logger_factory import LoggerFactory
 
+# Seconds a VM may take to become ready after the restart
+READY_DEADLINE = 180
+
 
 class MultipassRestartVMs:
-    def __init__(self, command_runner_factory=None):
+    def __init__(self, command_runner_factory=None, ui: Optional[PortUI] = None,
+                 ready_when: Callable[[str], List[PortReadinessProbe]] = VmProbes.reachable,
+                 deadline: float = READY_DEADLINE):
+        """
+        :param ready_when: Probes of a VM that must succeed before the restart counts as done.
+        :param deadline: Seconds each VM may take to become ready.
+        """
         self.command_runner_factory = command_runner_factory or CommandRunnerFactory()
-        self.ui = None
+        self.ui = ui
+        self.ready_when = ready_when
+        self.deadline = deadline
         self.command_execute = None
         self.logger = LoggerFactory.get_logger(self.__class__)
 
-    async def run(self):
+    async def run(self, instances: Optional[List[str]] = None):
+        """
+        :param instances: VM instances to restart. All configured instances if None.
+        :raises ReadinessTimeoutError: If a VM is not ready within the deadline after the restart.
+        """
         self.logger.info("Restart VMs")
 
         multipass_command_repository = PortCommandRepositoryYaml(filename="command_multipass_restart_repository_yaml.yaml")
         command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
-        command_list = command_builder.get_command_list()
+        command_list = command_builder.get_command_list(instances)
         self.logger.info(f"command builder: {command_list}")
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"Restart VMs: {result}")
+        runner_ui.raise_for_failures(result)
+
+        # `multipass restart` returns before the services of the VM are up
+        probes = {vm_instance: self.ready_when(vm_instance) for vm_instance in command_list}
+        await ReadinessWaiter(ui=self.ui).wait_all(probes, deadline=self.deadline)
+        self.logger.info(f"VMs ready: {list(probes)}")
@@ -1,3 +1,6 @@
+from typing import Optional
+
+from application.ports.ui.port_ui import PortUI
 from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
 from domain.multipass.vm_type import VmType
 from domain.network.ip_extractor.ip_extractor_builder import IpExtractorBuilder
@@ -12,10 +15,10 @@ from infrastructure.logging.logger_factory import LoggerFactory
 
 
 class NetworkPrepareNetplan:
-    def __init__(self, command_runner_factory=None):
+    def __init__(self, command_runner_factory=None, ui: Optional[PortUI] = None):
         self.command_runner_factory = command_runner_factory or CommandRunnerFactory()
         self.vm_repository = PortVmRepositoryYaml()
-        self.ui = None
+        self.ui = ui
         self.command_execute = None
         self.ip_extractor_builder = IpExtractorBuilder()
         self.logger = LoggerFactory.get_logger(self.__class__)
@@ -27,9 +30,10 @@ class NetworkPrepareNetplan:
         command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
         command_list = command_builder.get_command_list()
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"multipass clean up result: {result}")
+        runner_ui.raise_for_failures(result)
 
         # getting the necessary IPs
         gateway_ip = self.ip_extractor_builder.build(result=result, ip_extractor_types=IpExtractorTypes.GATEWAY)
@@ -1,3 +1,6 @@
+from typing import Optional
+
+from application.ports.ui.port_ui import PortUI
 from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
 from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
 from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
@@ -5,8 +8,8 @@ from infrastructure.logging.logger_factory import LoggerFactory
 
 
 class NetworkService:
-    def __init__(self):
-        self.ui = None
+    def __init__(self, ui: Optional[PortUI] = None):
+        self.ui = ui
         self.command_execute = None
         self.logger = LoggerFactory.get_logger(self.__class__)
 
@@ -17,6 +20,7 @@ class NetworkService:
         command_builder: CommandBuilder = CommandBuilder(command_repository=multipass_command_repository)
         command_list = command_builder.get_command_list()
 
-        runner_ui = AsyncCommandRunnerUI(command_list)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=self.ui)
         result = await runner_ui.run()
         self.logger.info(f"initialisation of network : {result}")
+        runner_ui.raise_for_failures(result)
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from application.exceptions.exception_pipeline import PipelineFailedError, PipelineNodeSkippedError
+from domain.pipeline.pipeline_node import PipelineNode
+from domain.timing.stage_timing import StageTiming
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.logging.logger_factory import LoggerFactory
+
+
+class PipelineScheduler:
+    """
+    Executes a dependency graph of (stage, VM) nodes.
+    Every node is started as soon as all of its dependencies are finished, independent of the other VMs.
+    """
+
+    def __init__(self, recorder: Optional[TimingRecorder] = None):
+        """
+        :param recorder: Records when each node started and finished, the process wide recorder if None.
+        """
+        self.nodes: Dict[str, PipelineNode] = {}
+        self.recorder = recorder or TimingRecorder.shared()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    def add_node(self, node: PipelineNode) -> "PipelineScheduler":
+        """Adds a node to the graph."""
+        if node.key in self.nodes:
+            raise ValueError(f"Pipeline node '{node.key}' is already registered")
+        self.nodes[node.key] = node
+        return self
+
+    def topological_order(self) -> List[str]:
+        """
+        Returns the node keys ordered so that every node comes after its dependencies.
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph contains a cycle.
+        """
+        for node in self.nodes.values():
+            unknown = [key for key in node.depends_on if key not in self.nodes]
+            if unknown:
+                raise ValueError(f"Pipeline node '{node.key}' depends on unknown nodes: {unknown}")
+
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(key: str, path: List[str]):
+            if state.get(key) == "done":
+                return
+            if state.get(key) == "visiting":
+                raise ValueError(f"Pipeline contains a cycle: {' -> '.join(path + [key])}")
+            state[key] = "visiting"
+            for dependency in self.nodes[key].depends_on:
+                visit(dependency, path + [key])
+            state[key] = "done"
+            order.append(key)
+
+        for node_key in self.nodes:
+            visit(node_key, [])
+        return order
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Runs all nodes of the graph.
+
+        Returns:
+            Dict[str, Any]: Result or exception per node key.
+        """
+        order = self.topological_order()
+        self.logger.info(f"Starting pipeline with {len(order)} nodes")
+
+        tasks: Dict[str, asyncio.Task] = {}
+        for key in order:
+            node = self.nodes[key]
+            dependencies = {dependency: tasks[dependency] for dependency in node.depends_on}
+            tasks[key] = asyncio.create_task(self._run_node(node, dependencies), name=key)
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        run_result = dict(zip(tasks.keys(), results))
+
+        for key, result in run_result.items():
+            if isinstance(result, Exception):
+                self.logger.error(f"Pipeline node '{key}' failed: {result}")
+        self.logger.info("Pipeline finished")
+        return run_result
+
+    @staticmethod
+    def raise_for_failures(run_result: Dict[str, Any]):
+        """
+        :param run_result: Result or exception per node key, as returned by run.
+        :raises PipelineFailedError: If a node failed or was skipped.
+        """
+        skipped = [key for key, result in run_result.items() if isinstance(result, PipelineNodeSkippedError)]
+        failed = {key: result for key, result in run_result.items()
+                  if isinstance(result, BaseException) and key not in skipped}
+        if failed or skipped:
+            raise PipelineFailedError(failed, skipped)
+
+    async def _run_node(self, node: PipelineNode, dependencies: Dict[str, asyncio.Task]) -> Any:
+        for dependency_key, dependency in dependencies.items():
+            try:
+                await asyncio.shield(dependency)
+            except Exception as e:
+                self.logger.warning(f"Skipping '{node.key}', dependency '{dependency_key}' failed")
+                raise PipelineNodeSkippedError(node.key, dependency_key, e) from e
+
+        started = time.monotonic()
+        self.recorder.enter_stage(node.vm_instance, node.stage)
+        self.logger.info(f"Starting pipeline node '{node.key}'")
+        failed = True
+        try:
+            result = await node.action()
+            failed = False
+        finally:
+            self.recorder.record_stage(StageTiming(key=node.key, stage=node.stage, vm_instance=node.vm_instance,
+                                                   depends_on=node.depends_on, started=started,
+                                                   ended=time.monotonic(), failed=failed))
+        self.logger.info(f"Pipeline node '{node.key}' finished after {time.monotonic() - started:.2f}s")
+        return result
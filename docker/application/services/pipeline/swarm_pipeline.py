@@ -0,0 +1,256 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from application.services.multipass.multipass_cloud_init import MultipassCloudInit
+from application.services.multipass.multipass_docker_install import MultipassDockerInstall
+from application.services.multipass.multipass_docker_swarm_init import MultipassDockerSwarmInit
+from application.services.multipass.multipass_golden_image import MultipassGoldenImage
+from application.services.multipass.multipass_init_vms import MultipassInitVms
+from application.services.multipass.multipass_package_cache import MultipassPackageCache
+from application.services.multipass.multipass_restart_vms import MultipassRestartVMs
+from application.services.network.network_prepare_netplan import NetworkPrepareNetplan
+from application.services.network.network_service import NetworkService
+from application.ports.ui.port_ui import PortUI
+from application.services.pipeline.pipeline_scheduler import PipelineScheduler
+from domain.command.command_type_enum import CommandType
+from domain.multipass.vm_type import VmType
+from domain.pipeline.pipeline_node import PipelineNode
+from infrastructure.adapters.readiness.vm_probes import VmProbes
+from infrastructure.adapters.repositories.package_cache_repository_yaml import PortPackageCacheRepositoryYaml
+from infrastructure.adapters.repositories.vm_repository_yaml import PortVmRepositoryYaml
+from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.adapters.ui.ui_session import UiSession
+from infrastructure.logging.logger_factory import LoggerFactory
+
+HOST = CommandType.HOSTOS.value
+
+
+class SwarmPipeline:
+    """
+    Builds the swarm bring-up as a dependency graph per VM:
+
+    [fresh only: clean] -> launch -> [manager only: netplan -> restart-network] -> docker-install -> restart-docker
+    -> swarm-init (manager) / swarm-join (worker, additionally waits for swarm-init of the manager)
+
+    Steps with a check are skipped when already satisfied, so without clean up a re-run only does what is missing.
+    With a golden image the workers are cloned instead of launched and installed:
+
+    golden-image -> clone (worker) -> restart-docker -> swarm-join
+
+    With the package cache the manager runs the caches after its docker install and every VM is pointed to them
+    (cache-client) before it installs docker, respectively before docker restarts. restart-docker always runs and
+    waits until the daemon uses the registry mirror, docker only reads daemon.json when it starts.
+    With cloud-init the first boot does the network and docker setup and no restart is needed:
+
+    [fresh only: clean] -> launch -> swarm-init (manager) / swarm-join (worker)
+    """
+
+    def __init__(self, fresh: bool = False, golden_image: bool = False, package_cache: bool = False,
+                 cloud_init: bool = False):
+        """
+        :param fresh: Deletes all VMs first and builds the cluster from scratch.
+        :param golden_image: Clones the workers from an image with docker installed, needs `multipass clone`.
+        :param package_cache: Runs apt and registry caches on the manager, the workers download through them.
+        :param cloud_init: Sets up network and docker during the first boot, see MultipassCloudInit.
+        """
+        self.fresh = fresh
+        self.vm_repository = PortVmRepositoryYaml()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self.managers = self.vm_repository.find_vm_instances_by_type(VmType.MANAGER)
+        self.workers = self.vm_repository.find_vm_instances_by_type(VmType.WORKER)
+        if len(self.managers) != 1:
+            raise ValueError(f"Expected exactly one manager, found: {self.managers}")
+        self.manager = self.managers[0]
+        self.golden_image = MultipassGoldenImage() if golden_image else None
+        image_instances = [self.golden_image.image.name] if self.golden_image else []
+        self.ui = FactoryUI().get_ui(instances=[HOST] + image_instances + self.managers + self.workers,
+                                     persistent=True)
+        self.swarm_init = MultipassDockerSwarmInit(ui=self.ui)
+        if self.golden_image:
+            # The UI shows the image, so the image reports to it once the UI exists
+            self.golden_image.ui = self.ui
+        self.package_cache = MultipassPackageCache(PortPackageCacheRepositoryYaml().get_cache(), ui=self.ui) \
+            if package_cache else None
+
+        self.init_vms = MultipassInitVms(ui=self.ui)
+        # After the network restart SSH is enough, after the docker restart the daemon must answer and, with the
+        # package cache, run with the registry mirror cache-client wrote to daemon.json
+        self.restart_vms = MultipassRestartVMs(ui=self.ui)
+        self.restart_docker = MultipassRestartVMs(ui=self.ui, ready_when=self._docker_ready)
+        self.docker_install = MultipassDockerInstall(ui=self.ui)
+        # The manager installs docker before its caches run, only the workers download through them
+        self.worker_docker_install = MultipassDockerInstall(ui=self.ui, package_cache=self.package_cache)
+        self.cloud_init = MultipassCloudInit(ui=self.ui, package_cache=self.package_cache) if cloud_init else None
+
+    def build(self, workers: Optional[List[str]] = None) -> PipelineScheduler:
+        """
+        Creates the scheduler with all (stage, VM) nodes, each node shows its stage in the UI while it runs.
+
+        :param workers: Only brings up these workers and joins them to the running manager. The whole cluster if None.
+        """
+        scheduler = self._build(workers)
+        for node in scheduler.nodes.values():
+            node.action = self._staged(node)
+        return scheduler
+
+    def _build(self, workers: Optional[List[str]]) -> PipelineScheduler:
+        key = PipelineNode.key_of
+        scheduler = PipelineScheduler()
+        if workers is not None:
+            # The swarm exists, init and the caches are skipped by their checks, init only gathers the facts
+            scheduler.add_node(PipelineNode(stage="swarm-init", vm_instance=self.manager,
+                                            action=self.swarm_init.init_manager))
+            if self.package_cache:
+                scheduler.add_node(PipelineNode(stage="cache-server", vm_instance=self.manager,
+                                                action=self.package_cache.serve))
+            self._add_workers(scheduler, workers, launch_depends_on=[])
+            return scheduler
+
+        launch_depends_on = []
+        if self.fresh:
+            scheduler.add_node(PipelineNode(stage="clean", vm_instance=HOST, action=self.init_vms.clean_up))
+            launch_depends_on = [key("clean", HOST)]
+
+        if self.cloud_init:
+            self._add_cloud_init_manager(scheduler, launch_depends_on)
+            self._add_workers(scheduler, self.workers, launch_depends_on)
+            return scheduler
+
+        scheduler.add_node(PipelineNode(stage="launch", vm_instance=self.manager, depends_on=launch_depends_on,
+                                        action=self._bind(self.init_vms.launch, [self.manager])))
+
+        # Only the manager gets a static netplan configuration, which needs a restart before docker is installed
+        scheduler.add_node(PipelineNode(stage="netplan", vm_instance=self.manager,
+                                        depends_on=[key("launch", self.manager)], action=self._network))
+        scheduler.add_node(PipelineNode(stage="restart-network", vm_instance=self.manager,
+                                        depends_on=[key("netplan", self.manager)],
+                                        action=self._bind(self.restart_vms.run, [self.manager])))
+        scheduler.add_node(PipelineNode(stage="docker-install", vm_instance=self.manager,
+                                        depends_on=[key("restart-network", self.manager)],
+                                        action=self._bind(self.docker_install.run, [self.manager])))
+        installed = key("docker-install", self.manager)
+        if self.package_cache:
+            scheduler.add_node(PipelineNode(stage="cache-server", vm_instance=self.manager, depends_on=[installed],
+                                            action=self.package_cache.serve))
+            scheduler.add_node(PipelineNode(stage="cache-client", vm_instance=self.manager,
+                                            depends_on=[key("cache-server", self.manager)],
+                                            action=self._bind(self.package_cache.configure, [self.manager])))
+            installed = key("cache-client", self.manager)
+        scheduler.add_node(PipelineNode(stage="restart-docker", vm_instance=self.manager, depends_on=[installed],
+                                        action=self._bind(self.restart_docker.run, [self.manager])))
+        scheduler.add_node(PipelineNode(stage="swarm-init", vm_instance=self.manager,
+                                        depends_on=[key("restart-docker", self.manager)],
+                                        action=self.swarm_init.init_manager))
+
+        self._add_workers(scheduler, self.workers, launch_depends_on)
+        return scheduler
+
+    def _add_cloud_init_manager(self, scheduler: PipelineScheduler, launch_depends_on: List[str]):
+        """The manager boots ready for the swarm, netplan and docker come with its user-data."""
+        key = PipelineNode.key_of
+        scheduler.add_node(PipelineNode(stage="launch", vm_instance=self.manager, depends_on=launch_depends_on,
+                                        action=self._bind(self.cloud_init.launch, [self.manager])))
+        ready = key("launch", self.manager)
+        if self.package_cache:
+            scheduler.add_node(PipelineNode(stage="cache-server", vm_instance=self.manager, depends_on=[ready],
+                                            action=self.package_cache.serve))
+            ready = key("cache-server", self.manager)
+        scheduler.add_node(PipelineNode(stage="swarm-init", vm_instance=self.manager, depends_on=[ready],
+                                        action=self.swarm_init.init_manager))
+
+    def _add_workers(self, scheduler: PipelineScheduler, workers: List[str], launch_depends_on: List[str]):
+        key = PipelineNode.key_of
+        if self.golden_image and workers:
+            image = self.golden_image.image.name
+            scheduler.add_node(PipelineNode(stage="golden-image", vm_instance=image, depends_on=launch_depends_on,
+                                            action=self.golden_image.ensure))
+
+        for worker in workers:
+            if self.golden_image:
+                # Docker is already installed on the clone
+                scheduler.add_node(PipelineNode(stage="clone", vm_instance=worker,
+                                                depends_on=[key("golden-image", image)],
+                                                action=self._bind(self.golden_image.clone, [worker])))
+                provisioned = self._add_cache_client(scheduler, worker, key("clone", worker))
+            elif self.cloud_init:
+                # The caches are part of the user-data, the worker only has to boot after they run
+                cache_server = [key("cache-server", self.manager)] if self.package_cache else []
+                scheduler.add_node(PipelineNode(stage="launch", vm_instance=worker,
+                                                depends_on=launch_depends_on + cache_server,
+                                                action=self._bind(self.cloud_init.launch, [worker])))
+                scheduler.add_node(PipelineNode(stage="swarm-join", vm_instance=worker,
+                                                depends_on=[key("launch", worker), key("swarm-init", self.manager)],
+                                                action=self._bind(self.swarm_init.join_workers, [worker])))
+                continue
+            else:
+                scheduler.add_node(PipelineNode(stage="launch", vm_instance=worker, depends_on=launch_depends_on,
+                                                action=self._bind(self.init_vms.launch, [worker])))
+                scheduler.add_node(PipelineNode(stage="docker-install", vm_instance=worker,
+                                                depends_on=[self._add_cache_client(scheduler, worker,
+                                                                                   key("launch", worker))],
+                                                action=self._bind(self.worker_docker_install.run, [worker])))
+                provisioned = key("docker-install", worker)
+            scheduler.add_node(PipelineNode(stage="restart-docker", vm_instance=worker,
+                                            depends_on=[provisioned],
+                                            action=self._bind(self.restart_docker.run, [worker])))
+            scheduler.add_node(PipelineNode(stage="swarm-join", vm_instance=worker,
+                                            depends_on=[key("restart-docker", worker), key("swarm-init", self.manager)],
+                                            action=self._bind(self.swarm_init.join_workers, [worker])))
+
+    def _add_cache_client(self, scheduler: PipelineScheduler, worker: str, after: str) -> str:
+        """Points the worker to the caches once they run, returns the key the next stage waits for."""
+        if not self.package_cache:
+            return after
+        key = PipelineNode.key_of
+        scheduler.add_node(PipelineNode(stage="cache-client", vm_instance=worker,
+                                        depends_on=[after, key("cache-server", self.manager)],
+                                        action=self._bind(self.package_cache.configure, [worker])))
+        return key("cache-client", worker)
+
+    @asynccontextmanager
+    async def ui_session(self) -> AsyncIterator[PortUI]:
+        """
+        Shows the UI of the pipeline while the context is open, command runners without a UI of their own attach
+        to it, so the terminal session is set up once per run instead of once per stage.
+        """
+        async with UiSession.open(self.ui) as ui:
+            yield ui
+
+    async def run(self, workers: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Runs the pipeline with one UI for all VMs.
+
+        :param workers: Only brings up these workers, see build.
+        """
+        scheduler = self.build(workers)
+        async with self.ui_session():
+            return await scheduler.run()
+
+    def _docker_ready(self, vm_instance: str):
+        """The registry mirror is known once the caches run, which is before any docker restart using them."""
+        if self.package_cache is None:
+            return VmProbes.docker_ready(vm_instance)
+        return VmProbes.docker_ready_with_mirror(vm_instance, self.package_cache.cache.registry_mirror)
+
+    async def _network(self):
+        await NetworkPrepareNetplan(ui=self.ui).run()
+        await NetworkService(ui=self.ui).run()
+
+    def _staged(self, node: PipelineNode):
+        action = node.action
+
+        async def run_in_stage():
+            self.ui.attach([node.vm_instance], node.stage)
+            try:
+                return await action()
+            finally:
+                self.ui.detach([node.vm_instance], node.stage)
+
+        return run_in_stage
+
+    @staticmethod
+    def _bind(action, instances: List[str]):
+        async def run_for_instances():
+            return await action(instances)
+
+        return run_for_instances
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.command.command_plan.command_plan import PLAN_FORMAT, CommandPlan
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.repositories.command_plan_repository_json import PortCommandPlanRepositoryJson
+from infrastructure.logging.logger_factory import LoggerFactory
+
+
+class CommandPlanCompiler:
+    """
+    Resolves every command YAML of the configuration against the VM repository into one CommandPlan,
+    so runs with unchanged configuration take their commands from the plan instead of parsing the YAML files.
+    """
+
+    def __init__(self, plan_repository: Optional[PortCommandPlanRepositoryJson] = None):
+        self.plan_repository = plan_repository or PortCommandPlanRepositoryJson()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    def compile(self) -> CommandPlan:
+        """Compiles and saves the plan."""
+        input_hash = self.plan_repository.input_hash()
+        commands = {}
+        for path in self.plan_repository.command_files():
+            self.logger.info(f"Planning commands of {path.name}")
+            command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=path.name))
+            commands[path.name] = command_builder.plan()
+
+        plan = CommandPlan(input_hash=input_hash, commands=commands)
+        self.plan_repository.save(plan)
+        self.logger.info(f"Command plan {input_hash} compiled from {len(commands)} files")
+        return plan
+
+    def load_current(self) -> Optional[CommandPlan]:
+        """Returns the stored plan if it was compiled from the current configuration, None otherwise."""
+        plan = self.plan_repository.load()
+        if plan is None or plan.format != PLAN_FORMAT:
+            return None
+        if plan.input_hash != self.plan_repository.input_hash():
+            self.logger.info("Stored command plan is outdated")
+            return None
+        return plan
+
+    def load_or_compile(self) -> CommandPlan:
+        """Returns the stored plan if it is current, compiles a new one otherwise."""
+        return self.load_current() or self.compile()
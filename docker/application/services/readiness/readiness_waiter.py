@@ -0,0 +1,93 @@
+import asyncio
+import random
+import time
+from typing import Callable, Dict, List, Optional
+
+from application.exceptions.exception_readiness import ReadinessTimeoutError
+from application.ports.readiness.port_readiness_probe import PortReadinessProbe
+from application.ports.ui.port_ui import PortUI
+from domain.readiness.backoff import Backoff
+from infrastructure.logging.logger_factory import LoggerFactory
+
+
+class ReadinessWaiter:
+    """
+    Repeats readiness probes with exponential backoff until they succeed or the deadline is reached,
+    so the next stage starts as soon as its VM is ready instead of after a fixed wait.
+    """
+
+    def __init__(self, backoff: Optional[Backoff] = None, ui: Optional[PortUI] = None,
+                 clock: Callable[[], float] = time.monotonic, rng: Optional[random.Random] = None):
+        """
+        :param backoff: Delays between the attempts.
+        :param ui: UI the waiting VMs are shown on.
+        :param clock: Monotonic seconds, replaced in tests.
+        :param rng: Source of the jitter.
+        """
+        self.backoff = backoff or Backoff()
+        self.ui = ui
+        self.clock = clock
+        self.rng = rng
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    async def wait(self, probe: PortReadinessProbe, deadline: float, instance: Optional[str] = None) -> int:
+        """
+        Waits for one probe.
+
+        :param deadline: Seconds the probe may take in total.
+        :param instance: VM the probe belongs to, for the UI.
+        :return: Number of attempts.
+        :raises ReadinessTimeoutError: If the probe did not succeed in time.
+        """
+        end = self.clock() + deadline
+        for attempt, delay in enumerate(self.backoff.delays(self.rng), start=1):
+            remaining = end - self.clock()
+            if remaining <= 0:
+                break
+            self._show(instance, probe, f"Attempt {attempt}")
+            try:
+                if await asyncio.wait_for(probe.check(), timeout=remaining):
+                    self.logger.info(f"{probe.name} ready after {attempt} attempts")
+                    return attempt
+            except asyncio.TimeoutError:
+                break
+            remaining = end - self.clock()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+
+        self.logger.error(f"{probe.name} not ready within {deadline} seconds")
+        raise ReadinessTimeoutError({instance or probe.name: probe.name})
+
+    async def wait_all(self, probes: Dict[str, List[PortReadinessProbe]], deadline: float,
+                       deadlines: Optional[Dict[str, float]] = None):
+        """
+        Waits for the VMs concurrently, the probes of a VM in order (e.g. reachable before docker is asked).
+
+        :param probes: Probes per VM instance.
+        :param deadline: Seconds each VM may take for all its probes.
+        :param deadlines: Deadline per VM instance, overriding the common one.
+        :raises ReadinessTimeoutError: With every VM that did not become ready in time.
+        """
+        deadlines = deadlines or {}
+
+        async def wait_vm(instance: str, vm_probes: List[PortReadinessProbe]):
+            end = self.clock() + deadlines.get(instance, deadline)
+            for probe in vm_probes:
+                await self.wait(probe, end - self.clock(), instance)
+
+        instances = list(probes)
+        results = await asyncio.gather(*(wait_vm(instance, probes[instance]) for instance in instances),
+                                       return_exceptions=True)
+        waiting: Dict[str, str] = {}
+        for result in results:
+            if isinstance(result, ReadinessTimeoutError):
+                waiting.update(result.waiting)
+            elif isinstance(result, BaseException):
+                raise result
+        if waiting:
+            raise ReadinessTimeoutError(waiting)
+
+    def _show(self, instance: Optional[str], probe: PortReadinessProbe, step: str):
+        if self.ui is not None and instance is not None:
+            self.ui.update_status(instance=instance, task=f"Waiting for {probe.name}", step=step, result="Running...")
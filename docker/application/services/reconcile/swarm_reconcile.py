@@ -0,0 +1,70 @@
+from typing import Optional
+
+from application.ports.ui.port_ui import PortUI
+from application.services.multipass.multipass_list_instances import MultipassListInstances
+from application.services.pipeline.pipeline_scheduler import PipelineScheduler
+from application.services.pipeline.swarm_pipeline import SwarmPipeline
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+from domain.multipass.reconcile_plan import ReconcilePlan
+from infrastructure.adapters.repositories.command_multipass_init_repository_yaml import PortCommandRepositoryYaml
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+REMOVE_COMMANDS = "command_multipass_docker_swarm_remove_worker.yaml"
+DELETE_COMMANDS = "command_multipass_docker_swarm_delete_worker.yaml"
+
+
+class SwarmReconcile:
+    """
+    Brings the running cluster in line with the VM repository without touching the nodes that already match:
+    missing workers are launched and joined, existing workers outside of the swarm are joined, swarm workers no
+    longer configured are drained, removed and deleted.
+    """
+
+    def __init__(self, pipeline: Optional[SwarmPipeline] = None):
+        """
+        :param pipeline: Pipeline used to bring up the missing workers, a new one if None.
+        """
+        self.pipeline = pipeline or SwarmPipeline()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    async def run(self) -> ReconcilePlan:
+        """
+        Compares the cluster with the VM repository and applies the difference.
+
+        :return: The applied plan.
+        :raises ValueError: If the manager does not exist, the cluster has to be brought up by a full run then.
+        :raises CommandsFailedError: If a worker could not be removed, its VM is kept then.
+        :raises PipelineFailedError: If a worker could not be brought up.
+        """
+        async with self.pipeline.ui_session() as ui:
+            instances = await MultipassListInstances(ui=ui).run()
+            if not any(instance.name == self.pipeline.manager and instance.exists for instance in instances):
+                raise ValueError(f"Manager {self.pipeline.manager} does not exist, run without --reconcile first")
+
+            facts = await self.pipeline.swarm_init.manager_facts.get()
+            plan = ReconcilePlan.diff(self.pipeline.manager, self.pipeline.workers, instances, facts.nodes)
+            self.logger.info(f"Reconcile plan: create={plan.to_create} join={plan.to_join} "
+                             f"remove={plan.to_remove} unchanged={plan.unchanged}")
+
+            for node in plan.to_remove:
+                await self._remove_worker(node, ui)
+            if plan.to_remove:
+                self.pipeline.swarm_init.manager_facts.invalidate()
+            if plan.to_create or plan.to_join:
+                # The checks skip launch and install of the existing workers, they restart docker and join
+                result = await self.pipeline.build(plan.to_create + plan.to_join).run()
+                PipelineScheduler.raise_for_failures(result)
+        return plan
+
+    async def _remove_worker(self, node: str, ui: PortUI):
+        self.logger.info(f"Removing worker {node}")
+        # The VM is only deleted once the worker left the swarm, its tasks were rescheduled by then
+        for filename in (REMOVE_COMMANDS, DELETE_COMMANDS):
+            command_builder = CommandBuilder(command_repository=PortCommandRepositoryYaml(filename=filename),
+                                             parameter={ParameterType.SWARM_NODE: node})
+            runner_ui = AsyncCommandRunnerUI(command_builder.get_command_list(), ui=ui)
+            result = await runner_ui.run()
+            self.logger.info(f"Removing worker {node}: {result}")
+            runner_ui.raise_for_failures(result)
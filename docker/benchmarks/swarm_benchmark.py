@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+import yaml
+from pydantic import BaseModel, Field
+
+from application.services.pipeline.swarm_pipeline import SwarmPipeline
+from domain.command.command_executer.concurrency_limiter import ConcurrencyLimiter
+from domain.command.command_plan.command_plan import CommandPlan
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
+from infrastructure.adapters.command_runner.fake_multipass.fake_multipass import FakeMultipass
+from infrastructure.adapters.command_runner.fake_multipass.simulation_profile import SimulationProfile
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.adapters.file_management.path_strategies.path_factory import PathFactory
+from infrastructure.adapters.repositories.concurrency_limits_repository_yaml import PortConcurrencyLimitsRepositoryYaml
+from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config")
+VM_COUNTS = [1, 5, 20, 100]
+
+
+class BenchmarkResult(BaseModel):
+    """
+    :param vms: VMs of the swarm, one manager and vms - 1 workers
+    :param profile: Name of the simulation profile
+    :param wall: Seconds the pipeline ran
+    :param commands: Commands the services executed, including the checks
+    :param per_command_ms: Wall milliseconds per command
+    :param overhead_ms: Milliseconds per command the orchestration spent around the simulated multipass calls
+    :param simulated: Seconds the simulated multipass calls took, summed
+    :param peak_rss_mb: Peak resident memory of the process running the scenario, None if unknown
+    :param failed: Pipeline nodes that did not finish, a node fails when one of its commands failed
+    :param failed_commands: Executed commands that failed, retried ones included
+    """
+
+    vms: int
+    profile: str
+    wall: float
+    commands: int
+    per_command_ms: float
+    overhead_ms: float
+    simulated: float
+    peak_rss_mb: Optional[float] = None
+    failed: List[str] = Field(default_factory=list)
+    failed_commands: int = 0
+
+
+def _prepare_config(directory: str, vm_count: int):
+    """Copies the configuration with a VM repository of the requested size."""
+    shutil.copytree(CONFIG_DIR, os.path.join(directory, "config"))
+    vms = [{"vm_instance": "swarm-manager", "vm_type": "manager", "ipaddress": "10.42.0.2",
+            "gateway": "10.42.0.1", "memory": "2G", "disk": "10G"}]
+    vms += [{"vm_instance": f"swarm-worker-{number}", "vm_type": "worker", "ipaddress": f"10.42.1.{number}",
+             "gateway": "10.42.0.1", "memory": "2G", "disk": "10G"} for number in range(1, vm_count)]
+    with open(os.path.join(directory, "config", "multipass", "vms_repository.yaml"), "w") as file:
+        yaml.safe_dump({"vms": vms}, file, sort_keys=False)
+
+    # The simulated VMs take no host memory, the kind limits stay as configured
+    limits_path = os.path.join(directory, "config", "multipass", "concurrency_limits.yaml")
+    with open(limits_path) as file:
+        limits = yaml.safe_load(file)
+    limits["concurrency"]["resource_budget"] = False
+    with open(limits_path, "w") as file:
+        yaml.safe_dump(limits, file, sort_keys=False)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes on Linux
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(vm_count: int, profile: SimulationProfile, profile_name: str = "custom") -> BenchmarkResult:
+    """
+    Brings up a simulated swarm of vm_count VMs with the real services, from clean up to swarm join.
+    Runs in a temporary working directory, the logs and generated files of the run stay out of the repository.
+    """
+    simulation = FakeMultipass(profile)
+    recorder = TimingRecorder()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="tsw-benchmark-") as directory:
+        _prepare_config(directory, vm_count)
+        os.chdir(directory)
+        try:
+            infra_core_container.register(PathFactory, lifetime=Lifetime.SINGLETON)
+            infra_core_container.register(FileManager, lifetime=Lifetime.SINGLETON)
+            FactoryUI.configure(headless=True, progress_file=os.devnull)
+            TimingRecorder.configure(recorder)
+            ConcurrencyLimiter.configure(PortConcurrencyLimitsRepositoryYaml().get_limiter())
+            CommandPlan.activate(None)
+            CommandRunnerFactory.configure(simulation.runner)
+
+            started = time.perf_counter()
+            results = asyncio.run(SwarmPipeline(fresh=True).run())
+            wall = time.perf_counter() - started
+        finally:
+            CommandRunnerFactory.configure(None)
+            ConcurrencyLimiter.configure(None)
+            TimingRecorder.configure(None)
+            FactoryUI.configure()
+            os.chdir(cwd)
+
+    commands = [command for command in recorder.commands if not command.skipped]
+    measured = sum(command.duration for command in commands)
+    count = max(len(commands), 1)
+    return BenchmarkResult(
+        vms=vm_count,
+        profile=profile_name,
+        wall=wall,
+        commands=len(commands),
+        per_command_ms=wall / count * 1000,
+        overhead_ms=max(measured - simulation.simulated_seconds, 0.0) / count * 1000,
+        simulated=simulation.simulated_seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        failed=[key for key, result in results.items() if isinstance(result, BaseException)],
+        # The exit code of a failed command is unknown if it did not run
+        failed_commands=sum(1 for command in commands if command.exit_code != 0),
+    )
+
+
+def _run_isolated(vm_count: int, profile: SimulationProfile, profile_name: str) -> BenchmarkResult:
+    """Runs the scenario in a fresh process, so the peak RSS belongs to this size only."""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(run_scenario, (vm_count, profile, profile_name))
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    lines = [f"{'VMs':>5} {'profile':<10} {'wall':>9} {'commands':>9} {'ms/cmd':>8} {'overhead':>9} "
+             f"{'RSS MB':>8} {'failed':>7} {'cmd fail':>8}"]
+    for result in results:
+        rss = f"{result.peak_rss_mb:>8.1f}" if result.peak_rss_mb is not None else f"{'n/a':>8}"
+        lines.append(f"{result.vms:>5} {result.profile:<10} {result.wall:>8.2f}s {result.commands:>9} "
+                     f"{result.per_command_ms:>8.2f} {result.overhead_ms:>7.2f}ms {rss} {len(result.failed):>7} "
+                     f"{result.failed_commands:>8}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="swarm_benchmark",
+                                     description="Brings up simulated swarms with the real services and reports "
+                                                 "the time and memory the orchestration needs.")
+    parser.add_argument("--vms", type=int, nargs="+", default=VM_COUNTS, help=f"swarm sizes (default: {VM_COUNTS})")
+    parser.add_argument("--profile", choices=["instant", "realistic"], default="instant",
+                        help="instant: multipass takes no time, the overhead of the orchestration alone; "
+                             "realistic: scaled latencies of a laptop")
+    parser.add_argument("--time-scale", type=float, default=0.001,
+                        help="factor applied to the realistic latencies (default: 0.001)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the latencies and failures")
+    parser.add_argument("--in-process", action="store_true",
+                        help="run all sizes in this process, the peak RSS then accumulates over the sizes")
+    parser.add_argument("--json", metavar="FILE", help="also write the results to FILE")
+    args = parser.parse_args(argv)
+
+    profile = SimulationProfile.instant() if args.profile == "instant" \
+        else SimulationProfile.realistic(time_scale=args.time_scale, seed=args.seed)
+    results = []
+    for vm_count in args.vms:
+        run = run_scenario if args.in_process else _run_isolated
+        results.append(run(vm_count, profile, args.profile))
+        print(format_results(results[-1:]).splitlines()[-1] if len(results) > 1 else format_results(results),
+              flush=True)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([result.model_dump() for result in results], file, indent=2)
+    return 1 if any(result.failed or result.failed_commands for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
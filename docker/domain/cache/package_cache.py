@@ -0,0 +1,60 @@
+import re
+from typing import Dict, List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+
+# apt-cacher-ng only caches plain HTTP, HTTPS sources are requested as http://<cache>/HTTPS///<host>/<path>
+HTTPS_REMAP_PATH = "HTTPS///"
+
+
+class PackageCache(BaseModel):
+    """
+    Pull-through caches on the manager: apt-cacher-ng for the apt packages and a registry mirror for the image
+    layers, so both cross the WAN once per cluster instead of once per VM.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    host: str = Field(default="")
+    apt_port: int = Field(default=3142)
+    registry_port: int = Field(default=5000)
+    registry_upstream: str = Field(default="https://registry-1.docker.io")
+    # HTTPS apt sources fetched through the cache, e.g. https://download.docker.com
+    https_sources: List[str] = Field(default_factory=lambda: ["https://download.docker.com"])
+
+    @property
+    def apt_proxy(self) -> str:
+        return f"http://{self.host}:{self.apt_port}"
+
+    @property
+    def registry_host(self) -> str:
+        return f"{self.host}:{self.registry_port}"
+
+    @property
+    def registry_mirror(self) -> str:
+        return f"http://{self.registry_host}"
+
+    def source_url(self, url: str) -> str:
+        """Returns the URL of an HTTPS source in the apt cache."""
+        return f"{self.apt_proxy}/{HTTPS_REMAP_PATH}{url[len('https://'):]}"
+
+    def rewrite(self, command: str) -> str:
+        """
+        Points the apt source entries (`deb [options] <url>`) of a command to the apt cache.
+        Other URLs, like the download of the signing key, are left as they are.
+        """
+        for source in self.https_sources:
+            pattern = re.compile(r"(deb (?:\[[^\]]*\] )?)" + re.escape(source))
+            command = pattern.sub(lambda match: match.group(1) + self.source_url(source), command)
+        return command
+
+    def as_parameters(self) -> Dict[ParameterType, str]:
+        """Returns the cache as command template parameters."""
+        return {
+            ParameterType.CACHE_APT_PROXY: self.apt_proxy,
+            ParameterType.CACHE_REGISTRY_MIRROR: self.registry_mirror,
+            ParameterType.CACHE_REGISTRY_HOST: self.registry_host,
+            ParameterType.CACHE_REGISTRY_PORT: str(self.registry_port),
+            ParameterType.CACHE_REGISTRY_UPSTREAM: self.registry_upstream,
+        }
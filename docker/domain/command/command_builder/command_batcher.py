@@ -0,0 +1,142 @@
+import re
+import shlex
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.command.remote_command import RemoteCommand
+
+STEP_MARKER = "__TSW_STEP__"
+# Output of a step skipped because its check succeeded
+SATISFIED = "Already satisfied"
+STEP_PATTERN = re.compile(rf"^{STEP_MARKER} (BEGIN|END) (\d+)(?: (\d+))?$")
+
+
+class CommandBatcher:
+    """
+    Fuses consecutive `multipass exec` commands of the same VM and runner into one remote script.
+    Every step is framed by marker lines with its index and exit code, so the results can be split up again.
+    Checks of the steps are evaluated inside the script.
+    """
+
+    def batch(self, commands: Dict[int, ExecutableCommandEntity]) -> Dict[int, ExecutableCommandEntity]:
+        """
+        :param commands: Commands of one VM instance keyed by index.
+        :return: Commands keyed by the index of their first step, fused where possible.
+        """
+        batched: Dict[int, ExecutableCommandEntity] = {}
+        group: List[Tuple[ExecutableCommandEntity, RemoteCommand]] = []
+
+        for index in sorted(commands):
+            # The index of the entity is only set by the batcher, the strategies key the commands by it
+            command = commands[index].model_copy(update={"index": index})
+            remote_command = RemoteCommand.parse(command.command)
+            if remote_command is not None and not self._check_fits(command, remote_command):
+                # The check does not run in the same VM, the executer evaluates it for the single command
+                remote_command = None
+            if group and (remote_command is None or not self._fits(group, command, remote_command)):
+                self._flush(group, batched)
+                group = []
+            if remote_command is None:
+                batched[index] = command
+            else:
+                group.append((command, remote_command))
+        self._flush(group, batched)
+        return batched
+
+    @staticmethod
+    def _fits(group: List[Tuple[ExecutableCommandEntity, RemoteCommand]],
+              command: ExecutableCommandEntity, remote_command: RemoteCommand) -> bool:
+        first, first_remote = group[0]
+        return (remote_command.vm_instance == first_remote.vm_instance
+                and type(command.runner) is type(first.runner))
+
+    @staticmethod
+    def _check_fits(command: ExecutableCommandEntity, remote_command: RemoteCommand) -> bool:
+        if command.check is None:
+            return True
+        remote_check = RemoteCommand.parse(command.check)
+        return remote_check is not None and remote_check.vm_instance == remote_command.vm_instance
+
+    @staticmethod
+    def _step_script(command: ExecutableCommandEntity, remote_command: RemoteCommand) -> str:
+        """The script of one step, which is skipped if its check succeeds."""
+        step = f"( {remote_command.remote}\n) </dev/null 2>&1"
+        if command.check is not None:
+            remote_check = RemoteCommand.parse(command.check)
+            step = (f"if ( {remote_check.remote}\n) </dev/null >/dev/null 2>&1; then echo '{SATISFIED}'; "
+                    f"else {step}; fi")
+        return step
+
+    def _flush(self, group: List[Tuple[ExecutableCommandEntity, RemoteCommand]],
+               batched: Dict[int, ExecutableCommandEntity]):
+        if not group:
+            return
+        first, first_remote = group[0]
+        if len(group) == 1:
+            batched[first.index] = first
+            return
+
+        script = "\n".join(
+            f"echo '{STEP_MARKER} BEGIN {command.index}'\n"
+            f"{self._step_script(command, remote_command)}\n"
+            # The END marker starts a line of its own even if the output of the step does not end with a newline
+            f"printf '\\n{STEP_MARKER} END {command.index} %d\\n' \"$?\""
+            for command, remote_command in group
+        )
+        batched[first.index] = ExecutableCommandEntity(
+            index=first.index,
+            vm_instance_name=first.vm_instance_name,
+            description=f"{first.description} (+{len(group) - 1} steps)",
+            command=f"multipass exec {first_remote.vm_instance} -- bash -c {shlex.quote(script)}",
+            runner=first.runner,
+            timeout=sum(command.timeout for command, _ in group),
+            steps=[command for command, _ in group]
+        )
+
+    @staticmethod
+    def split_output(output: str) -> Dict[int, Tuple[int, str]]:
+        """
+        Splits the output of a fused command into the results of its steps.
+
+        :return: Exit code and output per step index. Steps without END marker are missing.
+        """
+        collector = BatchOutputCollector()
+        for line in output.splitlines():
+            collector.feed(line)
+        return collector.results
+
+
+class BatchOutputCollector:
+    """
+    Splits the output of a fused command into step results line by line, so it can follow a streaming runner.
+    """
+
+    def __init__(self, max_lines: int = 200):
+        """
+        :param max_lines: Number of trailing output lines kept per step.
+        """
+        self.results: Dict[int, Tuple[int, str]] = {}
+        self.current_index: Optional[int] = None
+        self.lines = deque(maxlen=max_lines)
+
+    def feed(self, line: str) -> Optional[Tuple[str, int]]:
+        """
+        Processes one output line.
+
+        :return: Marker type (BEGIN or END) and step index if the line is a marker, None otherwise.
+        """
+        match = STEP_PATTERN.match(line)
+        if not match:
+            if self.current_index is not None:
+                self.lines.append(line)
+            return None
+
+        marker, index = match.group(1), int(match.group(2))
+        if marker == "BEGIN":
+            self.current_index = index
+            self.lines.clear()
+        elif index == self.current_index:
+            self.results[index] = (int(match.group(3)), "\n".join(self.lines).strip())
+            self.current_index = None
+        return marker, index
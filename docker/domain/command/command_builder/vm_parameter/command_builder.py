@@ -1,11 +1,17 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from application.ports.repositories.port_command_repository import PortCommandRepository
+from domain.command.command_builder.command_batcher import CommandBatcher
+from domain.command.command_builder.vm_parameter.command_template import CommandTemplate
 from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
 from domain.command.command_builder.vm_parameter.strategies.manager_strategy import ManagerStrategy
 from domain.command.command_builder.vm_parameter.strategies.none_strategy import NoneStrategy
 from domain.command.command_builder.vm_parameter.strategies.worker_strategy import WorkerStrategy
+from domain.command.command_entity import CommandEntity
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.command.command_plan.command_plan import CommandPlan
+from domain.command.command_runner_type_enum import CommandRunnerType
+from domain.command.command_plan.planned_command import PlannedCommand
 from domain.multipass.vm_type import VmType
 from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
 from infrastructure.adapters.repositories.vm_repository_yaml import PortVmRepositoryYaml
@@ -15,15 +21,18 @@ class CommandBuilder:
     executable_commands: [dict[str, dict[int, ExecutableCommandEntity]]]
 
     def __init__(self,
-                 command_repository: PortCommandRepository, parameter: Optional[Dict[ParameterType,str]]=None):
+                 command_repository: PortCommandRepository, parameter: Optional[Dict[ParameterType,str]]=None,
+                 batch: bool = False):
         """
         :param command_repository: command repository of multipass init process
+        :param batch: fuse consecutive commands of a VM into one remote invocation
         """
         self.vm_repository = PortVmRepositoryYaml()
         self.command_runner_factory = CommandRunnerFactory()
         self.command_repository = command_repository
         self.executable_commands = {}
         self.parameter = parameter or {}
+        self.batch = batch
 
         self.STRATEGY_MAP = {
             VmType.MANAGER: ManagerStrategy(vm_type=VmType.MANAGER, command_runner_factory=self.command_runner_factory),
@@ -31,11 +40,110 @@ class CommandBuilder:
             VmType.NONE: NoneStrategy(vm_type=VmType.NONE, command_runner_factory=self.command_runner_factory),
         }
 
-    def get_command_list(self) -> Dict[str, Dict[int, ExecutableCommandEntity]]:
+    def get_command_list(self, instances: Optional[List[str]] = None) -> Dict[str, Dict[int, ExecutableCommandEntity]]:
+        """
+        Builds the commands from the active CommandPlan if it covers the repository, from the repository otherwise.
+
+        :param instances: Restricts the command list to these VM instances. All instances if None.
+        """
+        planned_commands = CommandPlan.active_commands(self.command_repository.name)
+        if planned_commands is not None:
+            command_list = self._from_plan(planned_commands)
+        else:
+            command_dict = self.command_repository.get_all_commands()
+            self._check_parameters(command_dict)
+
+            for key, command in command_dict.items():
+                for vm_type in command.vm_type:
+                    strategy = self.STRATEGY_MAP.get(vm_type.value)
+                    strategy.categorize(command, self.executable_commands,self.parameter)
+
+            command_list = self.executable_commands
+        if instances is not None:
+            command_list = {vm: commands for vm, commands in command_list.items() if vm in instances}
+        if self.batch:
+            command_batcher = CommandBatcher()
+            command_list = {vm: command_batcher.batch(commands) for vm, commands in command_list.items()}
+        return command_list
+
+    def get_command_list_for(self, vm_instance: str) -> Dict[str, Dict[int, ExecutableCommandEntity]]:
+        """
+        Builds all commands of the repository for an instance that is not part of the VM repository,
+        e.g. the golden image. The VM types of the commands are ignored.
+
+        :param vm_instance: Instance the commands are rendered for.
+        """
         command_dict = self.command_repository.get_all_commands()
+        self._check_parameters(command_dict)
+        parameter = dict(self.parameter)
+        parameter[ParameterType.VM_INSTANCE] = vm_instance
+        commands = {
+            key: ExecutableCommandEntity(
+                vm_instance_name=vm_instance,
+                description=command.description_template.render({ParameterType.VM_INSTANCE: vm_instance}),
+                command=command.template.render(parameter),
+                check=command.render_check(parameter),
+                timeout=command.timeout,
+                runner=self.command_runner_factory.get_runner(CommandRunnerType.get_enum_from_value(command.runner))
+            )
+            for key, command in command_dict.items()
+        }
+        if self.batch:
+            commands = CommandBatcher().batch(commands)
+        return {vm_instance: commands}
 
-        for key, command in command_dict.items():
+    def plan(self) -> Dict[str, Dict[int, PlannedCommand]]:
+        """
+        Assigns the commands of the repository to the VMs without rendering the commands, for a CommandPlan.
+        """
+        command_dict = self.command_repository.get_all_commands()
+        # Only the VM assignment and the descriptions of the strategies are kept, the parameters are rendered later
+        deferred = {parameter: "" for parameter in ParameterType}
+        executable_commands: Dict[str, Dict[int, ExecutableCommandEntity]] = {}
+        for command in command_dict.values():
             for vm_type in command.vm_type:
-                strategy = self.STRATEGY_MAP.get(vm_type.value)
-                strategy.categorize(command, self.executable_commands,self.parameter)
-        return self.executable_commands
+                self.STRATEGY_MAP.get(vm_type.value).categorize(command, executable_commands, dict(deferred))
+
+        return {
+            vm: {index: PlannedCommand(index=index, vm_instance_name=vm, description=executable.description,
+                                       template=command_dict[index].command, runner=command_dict[index].runner,
+                                       check=command_dict[index].check, timeout=command_dict[index].timeout)
+                 for index, executable in commands.items()}
+            for vm, commands in executable_commands.items()
+        }
+
+    def _from_plan(self, planned_commands: Dict[str, Dict[int, PlannedCommand]]) -> Dict[str, Dict[int, ExecutableCommandEntity]]:
+        """Renders the planned commands with the parameters of this builder."""
+        command_list: Dict[str, Dict[int, ExecutableCommandEntity]] = {}
+        for vm, commands in planned_commands.items():
+            parameter = dict(self.parameter)
+            parameter[ParameterType.VM_INSTANCE] = vm
+            for index, planned in commands.items():
+                template = CommandTemplate.compile(planned.template)
+                check = CommandTemplate.compile(planned.check) if planned.check is not None else None
+                missing = template.missing(parameter) | (check.missing(parameter) if check else frozenset())
+                if missing:
+                    names = sorted(missing_parameter.value for missing_parameter in missing)
+                    raise ValueError(f"Command {index} '{planned.description}' requires the parameters {names}.")
+                command_list.setdefault(vm, {})[index] = ExecutableCommandEntity(
+                    vm_instance_name=vm,
+                    description=planned.description,
+                    command=template.render(parameter),
+                    runner=self.command_runner_factory.get_runner(planned.runner),
+                    check=check.render(parameter) if check else None,
+                    timeout=planned.timeout
+                )
+        return command_list
+
+    def _check_parameters(self, command_dict: Dict[int, CommandEntity]):
+        """
+        Fails before any command is built if a template needs a parameter that was not provided.
+        The VM instance is provided by the strategies.
+        """
+        provided = dict(self.parameter)
+        provided[ParameterType.VM_INSTANCE] = ""
+        for key, command in command_dict.items():
+            missing = frozenset(parameter for parameter in command.placeholders if parameter not in provided)
+            if missing:
+                names = sorted(parameter.value for parameter in missing)
+                raise ValueError(f"Command {key} '{command.description}' requires the parameters {names}.")
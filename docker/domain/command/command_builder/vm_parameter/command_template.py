@@ -0,0 +1,63 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+
+_FORMATTER = Formatter()
+
+
+class CommandTemplate:
+    """
+    A command template parsed once into literal text and ParameterType placeholders.
+    Placeholders are checked against ParameterType when the template is compiled, rendering only joins the parts.
+    """
+
+    def __init__(self, template: str):
+        """
+        :param template: Text with placeholders in the format {param}, literal braces are written as {{ and }}.
+        :raises ValueError: If a placeholder is not a ParameterType.
+        """
+        self.template = template
+        parts = []
+        placeholders = set()
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+            parameter = None
+            if field_name is not None:
+                try:
+                    parameter = ParameterType(field_name)
+                except ValueError:
+                    raise ValueError(f"Unknown placeholder '{{{field_name}}}' in command template: {template}") from None
+                placeholders.add(parameter)
+            parts.append((literal, parameter, format_spec or "", conversion))
+        self.parts: Tuple[Tuple[str, Optional[ParameterType], str, Optional[str]], ...] = tuple(parts)
+        self.placeholders: FrozenSet[ParameterType] = frozenset(placeholders)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def compile(template: str) -> "CommandTemplate":
+        """Returns the compiled template, every distinct template text is parsed only once."""
+        return CommandTemplate(template)
+
+    def missing(self, params: Dict[ParameterType, str]) -> FrozenSet[ParameterType]:
+        """Returns the placeholders the parameters do not provide."""
+        return frozenset(parameter for parameter in self.placeholders if parameter not in params)
+
+    def render(self, params: Dict[ParameterType, str]) -> str:
+        """
+        Replaces the placeholders with the parameters.
+
+        :raises ValueError: If a placeholder has no parameter.
+        """
+        rendered = []
+        for literal, parameter, format_spec, conversion in self.parts:
+            rendered.append(literal)
+            if parameter is None:
+                continue
+            if parameter not in params:
+                raise ValueError(f"Missing parameter '{parameter.value}' for command template: {self.template}")
+            value = params[parameter]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            rendered.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(rendered)
@@ -5,4 +5,13 @@ class ParameterType(str, Enum):
     SWARM_MANAGER_IP = "swarm_manager_ip"
     SWARM_MANAGER_PORT = "swarm_manager_port"
     SWARM_TOKEN = "swarm_token"
+    SWARM_MANAGER_TOKEN = "swarm_manager_token"
+    SWARM_NODES = "swarm_nodes"
+    SWARM_NODE = "swarm_node"
+    GOLDEN_IMAGE = "golden_image"
+    CACHE_APT_PROXY = "cache_apt_proxy"
+    CACHE_REGISTRY_MIRROR = "cache_registry_mirror"
+    CACHE_REGISTRY_HOST = "cache_registry_host"
+    CACHE_REGISTRY_PORT = "cache_registry_port"
+    CACHE_REGISTRY_UPSTREAM = "cache_registry_upstream"
     VM_INSTANCE = "vm_instance"
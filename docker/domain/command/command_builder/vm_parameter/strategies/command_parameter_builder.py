@@ -1,5 +1,6 @@
 from typing import Dict
 
+from domain.command.command_builder.vm_parameter.command_template import CommandTemplate
 from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
 
 
@@ -33,10 +34,5 @@ class CommandParameterBuilder:
         """
         if not params:
             return command_template
-        self.validate_params(params)  # Ensure only allowed keys are used
-        string_params = {
-            key.value if isinstance(key, ParameterType) else key: value
-            for key, value in params.items()
-        }
-
-        return command_template.format(**string_params)
+        # The template is parsed and its placeholders validated once, see CommandTemplate
+        return CommandTemplate.compile(command_template).render(params)
@@ -1,5 +1,6 @@
 from typing import Dict
 
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
 from domain.command.command_builder.vm_parameter.strategies.command_builder_strategy import CommandBuilderStrategy
 from domain.command.command_entity import CommandEntity
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
@@ -14,9 +15,12 @@ class NoneStrategy(CommandBuilderStrategy):
 
     def categorize(self, command: CommandEntity, executable_commands: Dict[str, Dict[int, ExecutableCommandEntity]], parameter: Dict[str, str] = None):
         vm_instance_name = command.command_type.value
+        vm_parameter = {ParameterType.VM_INSTANCE: vm_instance_name}
         executable_commands.setdefault(vm_instance_name, {})
         executable_commands[vm_instance_name][command.index] = ExecutableCommandEntity(
             vm_instance_name=vm_instance_name,
-            description=command.description.format(vm_instance=vm_instance_name),
-            command=command.command.format(vm_instance=vm_instance_name),
+            description=command.description_template.render(vm_parameter),
+            command=command.template.render(vm_parameter),
+            check=command.render_check(vm_parameter),
+            timeout=command.timeout,
             runner=self.command_runner_factory.get_runner(CommandRunnerType.get_enum_from_value(command.runner)))
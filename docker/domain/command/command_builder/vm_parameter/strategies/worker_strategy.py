@@ -2,7 +2,6 @@ from typing import Dict
 
 from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
 from domain.command.command_builder.vm_parameter.strategies.command_builder_strategy import CommandBuilderStrategy
-from domain.command.command_builder.vm_parameter.strategies.command_parameter_builder import CommandParameterBuilder
 from domain.command.command_entity import CommandEntity
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
 from domain.command.command_runner_type_enum import CommandRunnerType
@@ -15,7 +14,6 @@ class WorkerStrategy(CommandBuilderStrategy):
     def __init__(self, vm_type: VmType, command_runner_factory=None):
         super().__init__(vm_type=vm_type, command_runner_factory=command_runner_factory)
         self.vm_repository = PortVmRepositoryYaml()
-        self.command_parameter_builder = CommandParameterBuilder()
 
     def categorize(self, command: CommandEntity, executable_commands: Dict[str, Dict[int, ExecutableCommandEntity]],
                    parameter: Dict[ParameterType, str] = None):
@@ -28,7 +26,9 @@ class WorkerStrategy(CommandBuilderStrategy):
                 executable_commands.setdefault(vm_instance_name, {})
                 executable_commands[vm_instance_name][command.index] = ExecutableCommandEntity(
                     vm_instance_name=vm_instance_name,
-                    description=command.description.format(vm_instance=vm_instance_name),
-                    command=self.command_parameter_builder.substitute_command(command.command, per_vm_params),
+                    description=command.description_template.render({ParameterType.VM_INSTANCE: vm_instance_name}),
+                    command=command.template.render(per_vm_params),
+                    check=command.render_check(per_vm_params),
+                    timeout=command.timeout,
                     runner=self.command_runner_factory.get_runner(CommandRunnerType.get_enum_from_value(command.runner))
                 )
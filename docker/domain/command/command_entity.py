@@ -1,10 +1,15 @@
-from typing import List
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from domain.command.command_builder.vm_parameter.command_template import CommandTemplate
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
 from domain.command.command_type_enum import CommandType
 from domain.multipass.vm_type import VmType
 
+# Seconds a command may run unless its YAML entry sets a timeout
+DEFAULT_TIMEOUT = 120
+
 
 class CommandEntity(BaseModel):
     """
@@ -14,6 +19,8 @@ class CommandEntity(BaseModel):
     :param runner: CommandRunner type (async, multipass, ...)
     :param command_type: Command type (HOSTOS, VM, ...)
     :param vm_type: VM types (worker, manager, ...)
+    :param check: Optional probe template, the command is skipped if the probe succeeds
+    :param timeout: Seconds the runner waits for the command
     """
     index: int = Field(default=None)
     description: str = Field(default="")
@@ -21,8 +28,37 @@ class CommandEntity(BaseModel):
     runner: str = Field(default=None)
     command_type: CommandType = Field(default=CommandType.HOSTOS)
     vm_type: List[VmType] = Field(default_factory=lambda: [VmType.NONE])
+    check: Optional[str] = Field(default=None)
+    timeout: int = Field(default=DEFAULT_TIMEOUT, gt=0)
 
     # Model configuration to allow arbitrary types
     model_config = {
         "arbitrary_types_allowed": True
     }
+
+    @field_validator("command", "description", "check")
+    @classmethod
+    def validate_template(cls, value: Optional[str]) -> Optional[str]:
+        """Compiles the template while loading, so unknown placeholders are reported before anything runs."""
+        if value is not None:
+            CommandTemplate.compile(value)
+        return value
+
+    @property
+    def template(self) -> CommandTemplate:
+        return CommandTemplate.compile(self.command)
+
+    @property
+    def description_template(self) -> CommandTemplate:
+        return CommandTemplate.compile(self.description)
+
+    @property
+    def placeholders(self) -> frozenset:
+        """The parameters the command and its check need."""
+        if self.check is None:
+            return self.template.placeholders
+        return self.template.placeholders | CommandTemplate.compile(self.check).placeholders
+
+    def render_check(self, parameter: Dict[ParameterType, str]) -> Optional[str]:
+        """Returns the rendered check, None if the command has none."""
+        return None if self.check is None else CommandTemplate.compile(self.check).render(parameter)
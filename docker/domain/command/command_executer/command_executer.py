@@ -1,18 +1,41 @@
-import asyncio
+import time
+from typing import Callable, Optional
 
 from application.ports.ui.port_ui import PortUI
+from domain.command.command_builder.command_batcher import SATISFIED, BatchOutputCollector
+from domain.command.command_executer.concurrency_limiter import ConcurrencyLimiter
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.timing.command_timing import CommandTiming
+from domain.timing.timing_recorder import TimingRecorder
 from infrastructure.logging.logger_factory import LoggerFactory
 
+# Seconds a check may take, checks are meant to be cheap probes
+CHECK_TIMEOUT = 30
+
 
 class CommandExecuter:
     executable_commands: [dict[str, dict[int, ExecutableCommandEntity]]]
 
-    def __init__(self, ui: PortUI):
+    def __init__(self, ui: PortUI, limiter: Optional[ConcurrencyLimiter] = None,
+                 recorder: Optional[TimingRecorder] = None):
+        """
+        :param ui: UI the status transitions are published to.
+        :param limiter: Bounds the commands running at the same time, the process wide limiter if None.
+        :param recorder: Records the timing of every command, the process wide recorder if None.
+        """
         self.ui = ui
+        self.limiter = limiter or ConcurrencyLimiter.shared()
+        self.recorder = recorder or TimingRecorder.shared()
         self.logger = LoggerFactory.get_logger(self.__class__)
 
     async def execute(self, commands: dict[int, ExecutableCommandEntity]):
+        """
+        Executes the commands one after another. Every status transition is published to the UI,
+        which renders it on its own thread, so the commands run back to back without any delay.
+        Each command waits for a free slot of the limiter before it is started.
+        A command with a check is skipped if its check succeeds.
+        The timing, exit code and output size of every command are recorded.
+        """
         self.logger.info("Command execution started with %d commands.", len(commands))
         current_vm = None
         run_result: dict[int, str] = {}
@@ -20,16 +43,46 @@ class CommandExecuter:
             current_vm = executable_command.vm_instance_name
             self.logger.info("Executing command on VM '%s' with task: '%s'.", current_vm,
                              executable_command.description)
+            self.ui.update_status(instance=current_vm, task=executable_command.description,
+                                  step="Executing command", result="Running...")
+            queued = time.monotonic()
+            if executable_command.check is not None and await self._is_satisfied(executable_command):
+                self.logger.info("Check of '%s' succeeded on VM '%s', skipping the command.",
+                                 executable_command.description, current_vm)
+                self._record(executable_command, queued, queued, exit_code=0, output="", skipped=True)
+                run_result[key] = SATISFIED
+                self.ui.update_status(instance=current_vm, task=executable_command.description,
+                                      step=SATISFIED, result="Skipped")
+                continue
+
+            collector = BatchOutputCollector() if executable_command.steps else None
+            # Registered for this run only, retries reuse the runner of the entity
+            listener = self._output_listener(executable_command, collector)
+            executable_command.runner.add_output_listener(listener)
+            started = None
             try:
-                self.logger.info("Before runner '%s'.", current_vm)
-                run_result[key] = await executable_command.runner.run(executable_command.command)
+                async with self.limiter.slot(executable_command):
+                    self.logger.info("Before runner '%s'.", current_vm)
+                    started = time.monotonic()
+                    run_result[key] = await executable_command.runner.run(executable_command.command,
+                                                                           timeout=executable_command.timeout)
                 self.logger.info("Command executed successfully on VM '%s'.", current_vm)
+                self._record(executable_command, queued, started, exit_code=0, output=run_result[key])
 
             except Exception as e:
                 self.logger.error("Failed to execute command on VM '%s'. Error: %s", current_vm, str(e))
+                # CommandExecutionError carries the exit code and output of the failed command
+                self._record(executable_command, queued, started or queued, exit_code=getattr(e, "returnCode", None),
+                             output=f"{getattr(e, 'stdout', '')}{getattr(e, 'stderr', '')}")
                 self.ui.update_status(instance=current_vm, task=executable_command.description, step="Error",
                                       result="Failed")
                 continue
+            finally:
+                executable_command.runner.remove_output_listener(listener)
+
+            if collector is not None:
+                self._split_batch_result(key, executable_command, collector, run_result)
+                continue
 
             self.logger.info("Updating status for VM '%s'.", current_vm)
             runner_status = executable_command.runner.status
@@ -40,9 +93,85 @@ class CommandExecuter:
             self.logger.info("Status updated for VM '%s': step='%s', result='%s'.", current_vm,
                              runner_status["current_step"], runner_status["result"])
 
-            await asyncio.sleep(2)
-
         self.ui.update_status(instance=current_vm, task="closing", step="Finishing", result="Success")
-        await asyncio.sleep(2)
         self.logger.info("All commands executed. Final status updated.")
         return run_result
+
+    def _record(self, executable_command: ExecutableCommandEntity, queued: float, started: float,
+                exit_code: Optional[int], output, skipped: bool = False):
+        vm_instance = executable_command.vm_instance_name
+        spawned = getattr(executable_command.runner, "spawned_at", None)
+        self.recorder.record_command(CommandTiming(
+            vm_instance=vm_instance, stage=self.recorder.stage_of(vm_instance),
+            description=executable_command.description, command=executable_command.command,
+            queued=queued, started=started,
+            # A runner reused from an earlier command still carries the spawn time of that command
+            spawned=spawned if isinstance(spawned, float) and spawned >= started and not skipped else None,
+            ended=time.monotonic(),
+            exit_code=exit_code if isinstance(exit_code, int) else None,
+            output_bytes=len(output.encode("utf-8")) if isinstance(output, str) else 0,
+            skipped=skipped))
+
+    async def _is_satisfied(self, executable_command: ExecutableCommandEntity) -> bool:
+        """Runs the check of the command, a failing check means the command has to run."""
+        self.ui.update_status(instance=executable_command.vm_instance_name, task=executable_command.description,
+                              step="Checking", result="Running...")
+        try:
+            await executable_command.runner.run(executable_command.check, timeout=CHECK_TIMEOUT)
+        except Exception as e:
+            self.logger.info("Check of '%s' failed, running the command: %s", executable_command.description, e)
+            return False
+        return True
+
+    @staticmethod
+    def failed_keys(commands: dict[int, ExecutableCommandEntity], run_result: dict[int, str]) -> list[int]:
+        """
+        Returns the keys of the commands without a result, for fused commands the indexes of the failed steps.
+        """
+        failed = []
+        for key, executable_command in commands.items():
+            expected = [step.index for step in executable_command.steps] if executable_command.steps else [key]
+            failed.extend(index for index in expected if index not in run_result)
+        return failed
+
+    def _output_listener(self, executable_command: ExecutableCommandEntity,
+                         collector: Optional[BatchOutputCollector]) -> Callable[[str], None]:
+        """Creates the callback showing the output lines of a running command as its current step."""
+        steps = {step.index: step for step in executable_command.steps}
+        current = {"task": executable_command.description}
+
+        def on_line(line: str):
+            if collector is not None:
+                marker = collector.feed(line)
+                if marker is not None:
+                    kind, index = marker
+                    if kind == "BEGIN" and index in steps:
+                        current["task"] = steps[index].description
+                        self.ui.update_status(instance=executable_command.vm_instance_name, task=current["task"],
+                                              step="Executing command", result="Running...")
+                    return
+            self.ui.update_status(instance=executable_command.vm_instance_name, task=current["task"],
+                                  step=line)
+
+        return on_line
+
+    def _split_batch_result(self, key: int, executable_command: ExecutableCommandEntity,
+                            collector: BatchOutputCollector, run_result: dict[int, str]):
+        """Replaces the result of a fused command by the results and status of its steps."""
+        batch_output = run_result.pop(key)
+        if not collector.results:
+            # The runner does not stream its output, split the returned output instead
+            for line in batch_output.splitlines():
+                collector.feed(line)
+
+        for step in executable_command.steps:
+            return_code, output = collector.results.get(step.index, (-1, ""))
+            if return_code != 0:
+                self.logger.error("Step %d failed on VM '%s' with return code %d: %s", step.index,
+                                  step.vm_instance_name, return_code, output)
+                self.ui.update_status(instance=step.vm_instance_name, task=step.description, step="Error",
+                                      result="Failed")
+                continue
+            run_result[step.index] = output
+            self.ui.update_status(instance=step.vm_instance_name, task=step.description,
+                                  step="Executing command", result="Success")
@@ -0,0 +1,122 @@
+import asyncio
+import re
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from domain.command.command_executer.concurrency_limits import ConcurrencyLimits
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.command.command_kind import CommandKind
+from domain.multipass.vm_entity import VmEntity
+from domain.multipass.vm_size import parse_size
+from infrastructure.logging.logger_factory import LoggerFactory
+
+MEMORY_OPTION_PATTERN = re.compile(r"(?:--memory|-m)[\s=]+(\S+)")
+DISK_OPTION_PATTERN = re.compile(r"(?:--disk|-d)[\s=]+(\S+)")
+
+
+class ResourceBudget:
+    """
+    Amount of a host resource shared by the running commands. A request larger than the whole budget
+    is shrunk to it, so it still runs, but alone.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.used = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self, amount: int) -> int:
+        """Waits until the amount fits into the budget and takes it. Returns the amount taken."""
+        amount = min(amount, self.capacity)
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.used + amount <= self.capacity)
+            self.used += amount
+        return amount
+
+    async def release(self, amount: int):
+        async with self.condition:
+            self.used -= amount
+            self.condition.notify_all()
+
+
+class ConcurrencyLimiter:
+    """
+    Bounds the commands running at the same time, in total and per CommandKind, and optionally the memory
+    and disk of the VMs launching at the same time against the free capacity of the host.
+    One limiter is shared by all CommandExecuters, so the bounds hold across runner UIs and pipeline stages.
+    """
+
+    _shared: Optional["ConcurrencyLimiter"] = None
+
+    def __init__(self, limits: ConcurrencyLimits, vms: Optional[Dict[str, VmEntity]] = None,
+                 memory_capacity: Optional[int] = None, disk_capacity: Optional[int] = None):
+        """
+        :param limits: Global and per kind limits.
+        :param vms: VMs by instance name, their memory and disk are used if a launch command does not name them.
+        :param memory_capacity: Free host memory in bytes. No memory budget if None.
+        :param disk_capacity: Free host disk in bytes. No disk budget if None.
+        """
+        self.limits = limits
+        self.vms = vms or {}
+        self.memory_capacity = memory_capacity
+        self.disk_capacity = disk_capacity
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def shared(cls) -> "ConcurrencyLimiter":
+        """Returns the process wide limiter, unlimited until one is configured."""
+        if cls._shared is None:
+            cls._shared = ConcurrencyLimiter(ConcurrencyLimits())
+        return cls._shared
+
+    @classmethod
+    def configure(cls, limiter: Optional["ConcurrencyLimiter"]):
+        """Replaces the process wide limiter."""
+        cls._shared = limiter
+
+    def _bind(self):
+        """Creates the asyncio primitives for the running event loop, they cannot be shared between loops."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._global = asyncio.Semaphore(self.limits.max_parallel) if self.limits.max_parallel else None
+        self._kinds = {kind: asyncio.Semaphore(limit) for kind, limit in self.limits.kinds.items() if limit}
+        self._memory = ResourceBudget(self.memory_capacity) if self.memory_capacity else None
+        self._disk = ResourceBudget(self.disk_capacity) if self.disk_capacity else None
+
+    def resources_of(self, command: ExecutableCommandEntity) -> tuple[int, int]:
+        """
+        Memory and disk in bytes a launch command allocates, taken from its options or else from the VM entity.
+        """
+        vm = self.vms.get(command.vm_instance_name)
+        memory = MEMORY_OPTION_PATTERN.search(command.command)
+        disk = DISK_OPTION_PATTERN.search(command.command)
+        memory_size = memory.group(1) if memory else (vm.memory if vm else "0")
+        disk_size = disk.group(1) if disk else (vm.disk if vm else "0")
+        return parse_size(memory_size), parse_size(disk_size)
+
+    @asynccontextmanager
+    async def slot(self, command: ExecutableCommandEntity) -> AsyncIterator[CommandKind]:
+        """
+        Waits for a free slot for the command and holds it while the context is open.
+        Slots are always taken in the same order (global, kind, memory, disk), so waiting commands cannot deadlock.
+
+        :return: The kind of the command.
+        """
+        self._bind()
+        kind = CommandKind.of_command(command.command)
+        async with AsyncExitStack() as stack:
+            if self._global is not None:
+                await stack.enter_async_context(self._global)
+            if kind in self._kinds:
+                await stack.enter_async_context(self._kinds[kind])
+            if kind == CommandKind.LAUNCH:
+                memory, disk = self.resources_of(command)
+                for budget, amount in ((self._memory, memory), (self._disk, disk)):
+                    if budget is not None and amount:
+                        taken = await budget.acquire(amount)
+                        stack.push_async_callback(budget.release, taken)
+            self.logger.debug("Slot acquired for %s command on '%s'.", kind.value, command.vm_instance_name)
+            yield kind
@@ -0,0 +1,20 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from domain.command.command_kind import CommandKind
+
+
+class ConcurrencyLimits(BaseModel):
+    """
+    Limits for commands running at the same time. A limit of 0 or a missing kind means unlimited.
+    """
+    max_parallel: int = Field(default=0, ge=0)
+    kinds: Dict[CommandKind, int] = Field(default_factory=dict)
+    # Launches only start while the memory and disk of the booting VMs fit into the free host capacity
+    resource_budget: bool = Field(default=False)
+    memory_reserve: str = Field(default="1G")
+    disk_reserve: str = Field(default="5G")
+
+    def limit_of(self, kind: CommandKind) -> int:
+        return self.kinds.get(kind, 0)
@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 from application.ports.commands.port_command_runner import PortCommandRunner
@@ -10,6 +12,9 @@ class ExecutableCommandEntity(BaseModel):
     :param description: Description of the command
     :param command: The actual executable command
     :param runner: CommandRunner type (async, multipass, ...)
+    :param timeout: Seconds the runner waits for the command
+    :param steps: Commands fused into this command by batching, empty for a single command
+    :param check: Probe run before the command, the command is skipped if it succeeds
     """
 
     index: int = Field(default=None)
@@ -17,6 +22,9 @@ class ExecutableCommandEntity(BaseModel):
     description: str = Field(default=None)
     command: str = Field(default=None)
     runner: PortCommandRunner = Field(default=None)
+    timeout: int = Field(default=120)
+    steps: List["ExecutableCommandEntity"] = Field(default_factory=list)
+    check: Optional[str] = Field(default=None)
 
     # Model configuration to allow arbitrary types
     model_config = {
@@ -0,0 +1,22 @@
+import time
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class StatusEvent(BaseModel):
+    """
+    :param instance: VM instance the status belongs to
+    :param task: Task currently executed on the instance
+    :param step: Step of the task
+    :param result: Result of the step (Running..., Success, Error, ...), None keeps the previous result
+    :param stage: Pipeline stage the instance entered, a stage transition leaves task, step and result as they are
+    :param timestamp: Monotonic time the transition happened
+    """
+
+    instance: str
+    task: str = Field(default="")
+    step: str = Field(default="")
+    result: Optional[str] = Field(default=None)
+    stage: Optional[str] = Field(default=None)
+    timestamp: float = Field(default_factory=time.monotonic)
@@ -0,0 +1,47 @@
+import re
+from enum import Enum
+
+# Verb of a multipass command line, e.g. "launch" in "multipass launch -n swarm-manager"
+MULTIPASS_VERB_PATTERN = re.compile(r"^\s*(?:sudo\s+)?multipass\s+([a-z-]+)")
+
+
+class CommandKind(str, Enum):
+    """Kind of operation a command performs on the host, used to limit how many of a kind run at once."""
+    LAUNCH = "launch"
+    EXEC = "exec"
+    TRANSFER = "transfer"
+    RESTART = "restart"
+    CLEAN = "clean"
+    HOST = "host"
+
+    @staticmethod
+    def get_enum_from_value(value: str) -> "CommandKind":
+        for enum_member in CommandKind:
+            if enum_member.value == value:
+                return enum_member
+        raise ValueError(f"Value '{value}' does not match any CommandKind.")
+
+    @staticmethod
+    def of_command(command: str) -> "CommandKind":
+        """
+        Classifies a shell command by its multipass verb. Commands not calling multipass are host commands.
+        """
+        match = MULTIPASS_VERB_PATTERN.match(command)
+        if match is None:
+            return CommandKind.HOST
+        return MULTIPASS_VERBS.get(match.group(1), CommandKind.HOST)
+
+
+MULTIPASS_VERBS = {
+    "launch": CommandKind.LAUNCH,
+    "clone": CommandKind.LAUNCH,
+    "exec": CommandKind.EXEC,
+    "shell": CommandKind.EXEC,
+    "transfer": CommandKind.TRANSFER,
+    "mount": CommandKind.TRANSFER,
+    "restart": CommandKind.RESTART,
+    "start": CommandKind.RESTART,
+    "stop": CommandKind.RESTART,
+    "delete": CommandKind.CLEAN,
+    "purge": CommandKind.CLEAN,
+}
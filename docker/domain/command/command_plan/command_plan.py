@@ -0,0 +1,36 @@
+from typing import ClassVar, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from domain.command.command_plan.planned_command import PlannedCommand
+
+# Changes whenever the layout of the plan changes, so plans of older versions are compiled again
+PLAN_FORMAT = 3
+
+
+class CommandPlan(BaseModel):
+    """
+    The commands of all command repositories resolved against the VM repository.
+    input_hash identifies the content of the YAML files the plan was compiled from.
+
+    :param commands: repository name -> VM instance -> index -> command
+    """
+    format: int = Field(default=PLAN_FORMAT)
+    input_hash: str
+    commands: Dict[str, Dict[str, Dict[int, PlannedCommand]]] = Field(default_factory=dict)
+
+    # Plan the CommandBuilders of this process use
+    active: ClassVar[Optional["CommandPlan"]] = None
+
+    @classmethod
+    def activate(cls, plan: Optional["CommandPlan"]):
+        """Makes the plan the one CommandBuilders take their commands from, None to build from the YAML files."""
+        CommandPlan.active = plan
+
+    @classmethod
+    def active_commands(cls, repository_name: Optional[str]) -> Optional[Dict[str, Dict[int, PlannedCommand]]]:
+        """Returns the planned commands of the repository, None if there is no active plan covering it."""
+        plan = CommandPlan.active
+        if plan is None or repository_name is None:
+            return None
+        return plan.commands.get(repository_name)
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from domain.command.command_entity import DEFAULT_TIMEOUT
+from domain.command.command_runner_type_enum import CommandRunnerType
+
+
+class PlannedCommand(BaseModel):
+    """
+    A command assigned to a VM by the strategies, stored in a CommandPlan.
+    The command stays a template, parameters only known at run time are rendered when it is executed.
+
+    :param index: order of execution within the VM
+    :param vm_instance_name: VM the command runs for
+    :param description: Description with the VM instance already rendered
+    :param template: The command template of the CommandEntity
+    :param runner: CommandRunner type
+    :param check: The check template of the CommandEntity
+    :param timeout: Seconds the runner waits for the command
+    """
+    index: int
+    vm_instance_name: str
+    description: str = Field(default="")
+    template: str
+    runner: CommandRunnerType
+    check: Optional[str] = Field(default=None)
+    timeout: int = Field(default=DEFAULT_TIMEOUT)
@@ -6,6 +6,8 @@ class CommandRunnerType(str, Enum):
     MULTIPASS = "multipass"
     REST = "rest"
     ANSIBLE = "ansible"
+    SESSION = "session"
+    STREAM = "stream"
 
     @staticmethod
     def get_enum_from_value(value: str) -> "CommandRunnerType":
@@ -0,0 +1,29 @@
+import re
+from typing import Optional
+
+from pydantic import BaseModel
+
+MULTIPASS_EXEC_PATTERN = re.compile(r"^\s*multipass\s+exec\s+(\S+)\s+--\s+(.+?)\s*$", re.DOTALL)
+
+
+class RemoteCommand(BaseModel):
+    """
+    :param vm_instance: VM instance the command is executed on
+    :param remote: Shell command executed inside the VM
+    """
+
+    vm_instance: str
+    remote: str
+
+    @staticmethod
+    def parse(command: str) -> Optional["RemoteCommand"]:
+        """
+        Splits a `multipass exec <vm> -- <command>` call into the VM and the remote command.
+        The remote part keeps its shell quoting, so a remote shell parses it into the same arguments as the host shell.
+
+        :return: The remote command or None if the command is not a multipass exec call.
+        """
+        match = MULTIPASS_EXEC_PATTERN.match(command)
+        if not match:
+            return None
+        return RemoteCommand(vm_instance=match.group(1), remote=match.group(2))
@@ -0,0 +1,48 @@
+import hashlib
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from domain.multipass.multipass_instance import MultipassInstance
+
+# Prefix of all golden image instances, the rest of the name is the recipe hash
+GOLDEN_IMAGE_PREFIX = "tsw-golden-"
+# Hex digits of the recipe hash used in the instance name
+NAME_HASH_LENGTH = 12
+# State a clone source has to be in
+STOPPED_STATE = "Stopped"
+
+
+class GoldenImage(BaseModel):
+    """
+    A stopped instance with docker installed that new workers are cloned from.
+    Its name carries the hash of the install recipe, so a changed recipe yields a new image.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    recipe_hash: str
+
+    @staticmethod
+    def of_recipe(recipe_hashes: List[str]) -> "GoldenImage":
+        """
+        :param recipe_hashes: Content hashes of the command files provisioning the image, in execution order.
+        """
+        return GoldenImage(recipe_hash=hashlib.sha256("\0".join(recipe_hashes).encode("utf-8")).hexdigest())
+
+    @property
+    def name(self) -> str:
+        return f"{GOLDEN_IMAGE_PREFIX}{self.recipe_hash[:NAME_HASH_LENGTH]}"
+
+    def find(self, instances: List[MultipassInstance]) -> Optional[MultipassInstance]:
+        """Returns the existing instance of this image, None if it has to be built."""
+        return next((instance for instance in instances if instance.name == self.name and instance.exists), None)
+
+    def is_ready(self, instances: List[MultipassInstance]) -> bool:
+        """True if the image exists and was sealed, an interrupted build leaves it running."""
+        instance = self.find(instances)
+        return instance is not None and instance.state == STOPPED_STATE
+
+    def outdated(self, instances: List[MultipassInstance]) -> List[str]:
+        """Returns the golden images built from another recipe."""
+        return [instance.name for instance in instances
+                if instance.name.startswith(GOLDEN_IMAGE_PREFIX) and instance.name != self.name and instance.exists]
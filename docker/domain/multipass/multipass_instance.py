@@ -0,0 +1,32 @@
+import json
+from typing import List
+
+from pydantic import BaseModel, Field
+
+# State of instances that are deleted but not yet purged
+DELETED_STATE = "Deleted"
+
+
+class MultipassInstance(BaseModel):
+    """An instance as reported by `multipass list --format json`."""
+    name: str
+    state: str = Field(default="")
+    ipv4: List[str] = Field(default_factory=list)
+    release: str = Field(default="")
+
+    @property
+    def exists(self) -> bool:
+        return self.state != DELETED_STATE
+
+    @staticmethod
+    def parse_list(output: str) -> List["MultipassInstance"]:
+        """
+        Parses the output of `multipass list --format json`.
+
+        :raises ValueError: If the output is not the JSON of multipass list.
+        """
+        try:
+            data = json.loads(output)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Output of multipass list is not JSON: {output}") from e
+        return [MultipassInstance(**instance) for instance in data.get("list", [])]
@@ -0,0 +1,41 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from domain.multipass.multipass_instance import MultipassInstance
+
+
+class ReconcilePlan(BaseModel):
+    """
+    The workers to bring up, to join and to remove so the cluster matches the VM repository.
+    """
+    to_create: List[str] = Field(default_factory=list)
+    # Existing instances which are no swarm members, e.g. after a failed join
+    to_join: List[str] = Field(default_factory=list)
+    to_remove: List[str] = Field(default_factory=list)
+    unchanged: List[str] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.to_create and not self.to_join and not self.to_remove
+
+    @staticmethod
+    def diff(manager: str, desired_workers: List[str], instances: List[MultipassInstance],
+             swarm_nodes: List[str]) -> "ReconcilePlan":
+        """
+        Compares the desired workers with the existing instances.
+        Only swarm members are removed, other instances of the host are never touched.
+
+        :param manager: Name of the manager, it is neither created nor removed.
+        :param desired_workers: Workers of the VM repository.
+        :param instances: Instances reported by multipass.
+        :param swarm_nodes: Hostnames of the swarm nodes, which are the instance names.
+        """
+        existing = {instance.name for instance in instances if instance.exists}
+        desired = set(desired_workers)
+        return ReconcilePlan(
+            to_create=[worker for worker in desired_workers if worker not in existing],
+            to_join=[worker for worker in desired_workers if worker in existing and worker not in swarm_nodes],
+            to_remove=[node for node in swarm_nodes if node in existing and node not in desired and node != manager],
+            unchanged=[worker for worker in desired_workers if worker in existing and worker in swarm_nodes],
+        )
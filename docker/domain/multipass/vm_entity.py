@@ -4,6 +4,9 @@ from domain.multipass.vm_type import VmType
 
 
 class VmEntity(BaseModel):
+    # Entities are shared through the repository cache, changes go through model_copy and update_vm
+    model_config = {"frozen": True}
+
     vm_instance: str
     vm_type: VmType = Field(default=VmType.MANAGER)  # worker
     ipaddress: str = Field(default="")
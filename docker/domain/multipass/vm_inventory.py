@@ -0,0 +1,44 @@
+from typing import Dict, Optional, Tuple
+
+from pydantic import BaseModel, PrivateAttr
+
+from domain.multipass.vm_entity import VmEntity
+from domain.multipass.vm_type import VmType
+
+
+class VmInventory(BaseModel):
+    """
+    Immutable view of the VMs of a repository, shared by all its readers.
+    Name and type indexes are built once, changes create a new inventory.
+    """
+    model_config = {"frozen": True}
+
+    vms: Tuple[VmEntity, ...] = ()
+
+    _by_name: Dict[str, VmEntity] = PrivateAttr(default_factory=dict)
+    _by_type: Dict[VmType, Tuple[str, ...]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        by_type: Dict[VmType, list] = {}
+        for vm in self.vms:
+            self._by_name[vm.vm_instance] = vm
+            by_type.setdefault(vm.vm_type, []).append(vm.vm_instance)
+        self._by_type = {vm_type: tuple(names) for vm_type, names in by_type.items()}
+
+    def get(self, vm_instance: str) -> Optional[VmEntity]:
+        """Returns the VM with the name, None if there is none."""
+        return self._by_name.get(vm_instance)
+
+    def names_of_type(self, vm_type: VmType) -> Tuple[str, ...]:
+        """Returns the names of the VMs of the type in file order."""
+        return self._by_type.get(vm_type, ())
+
+    def with_vm(self, vm: VmEntity) -> "VmInventory":
+        """Returns an inventory with the VM added, or replacing the VM of the same name in place."""
+        if vm.vm_instance not in self._by_name:
+            return VmInventory(vms=self.vms + (vm,))
+        return VmInventory(vms=tuple(vm if current.vm_instance == vm.vm_instance else current for current in self.vms))
+
+    def without_vm(self, vm_instance: str) -> "VmInventory":
+        """Returns an inventory without the VM of the name."""
+        return VmInventory(vms=tuple(vm for vm in self.vms if vm.vm_instance != vm_instance))
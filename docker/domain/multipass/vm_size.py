@@ -0,0 +1,17 @@
+import re
+
+SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$", re.IGNORECASE)
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(value: str) -> int:
+    """
+    Converts a multipass size like "4G", "512M" or "10GiB" to bytes.
+
+    :raises ValueError: If the value is not a size.
+    """
+    match = SIZE_PATTERN.match(str(value))
+    if match is None:
+        raise ValueError(f"Value '{value}' is not a size.")
+    number, unit = match.groups()
+    return int(float(number) * SIZE_UNITS[unit.upper()])
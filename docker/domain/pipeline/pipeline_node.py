@@ -0,0 +1,32 @@
+from typing import Any, Awaitable, Callable, List
+
+from pydantic import BaseModel, Field
+
+
+class PipelineNode(BaseModel):
+    """
+    :param stage: Name of the pipeline stage (launch, docker-install, ...)
+    :param vm_instance: VM instance the stage is executed for
+    :param depends_on: Keys of the nodes that must be finished before this node starts
+    :param action: Coroutine factory that executes the stage for the VM instance
+    """
+
+    stage: str
+    vm_instance: str
+    depends_on: List[str] = Field(default_factory=list)
+    action: Callable[[], Awaitable[Any]] = Field(default=None)
+
+    # Model configuration to allow arbitrary types
+    model_config = {
+        "arbitrary_types_allowed": True
+    }
+
+    @property
+    def key(self) -> str:
+        """Returns the unique key of the node inside a pipeline."""
+        return self.key_of(self.stage, self.vm_instance)
+
+    @staticmethod
+    def key_of(stage: str, vm_instance: str) -> str:
+        """Builds the key of the node for the given stage and VM instance."""
+        return f"{stage}:{vm_instance}"
@@ -0,0 +1,35 @@
+import random
+from typing import Iterator, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Backoff(BaseModel):
+    """
+    Exponential backoff with jitter between the attempts of a readiness probe.
+    The jitter spreads the attempts of VMs that became unready at the same time, e.g. after a common restart.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    initial: float = Field(default=0.5, gt=0)
+    factor: float = Field(default=2.0, ge=1)
+    max_delay: float = Field(default=10.0, gt=0)
+    # Fraction of each delay that is randomized, 0 gives the plain exponential delays
+    jitter: float = Field(default=0.5, ge=0, le=1)
+
+    def delay(self, attempt: int, rng: Optional[random.Random] = None) -> float:
+        """
+        :param attempt: Number of failed attempts so far, starting with 0.
+        :param rng: Source of the jitter, the module random if None.
+        :return: Seconds to wait before the next attempt.
+        """
+        base = min(self.max_delay, self.initial * self.factor ** attempt)
+        spread = base * self.jitter
+        return base - spread + (rng or random).random() * spread
+
+    def delays(self, rng: Optional[random.Random] = None) -> Iterator[float]:
+        """Yields the delays of the attempts one after another, without end."""
+        attempt = 0
+        while True:
+            yield self.delay(attempt, rng)
+            attempt += 1
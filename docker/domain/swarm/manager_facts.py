@@ -0,0 +1,55 @@
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+
+# Prefix of the lines printed by command_multipass_docker_swarm_manager_facts.yaml
+FACT_MARKER = "__TSW_FACT__"
+SWARM_MANAGER_PORT = "2377"
+
+
+class ManagerFacts(BaseModel):
+    """
+    The state of the swarm manager the workers need to join.
+    """
+    ip: str
+    worker_token: str
+    manager_token: str = Field(default="")
+    nodes: List[str] = Field(default_factory=list)
+
+    @staticmethod
+    def parse(output: str) -> "ManagerFacts":
+        """
+        Reads the facts from the output of the facts command.
+
+        :raises ValueError: If the IP or the worker join token is missing.
+        """
+        facts: Dict[str, str] = {}
+        nodes = []
+        for line in output.splitlines():
+            parts = line.split(maxsplit=2)
+            if len(parts) < 3 or parts[0] != FACT_MARKER:
+                continue
+            _, name, value = parts
+            if name == "node":
+                nodes.append(value.strip())
+            else:
+                facts[name] = value.strip()
+
+        missing = [name for name in ("ip", "worker_token") if not facts.get(name)]
+        if missing:
+            raise ValueError(f"Manager facts {missing} missing in output: {output}")
+        # hostname -I lists all addresses, the first one is the address of the default interface
+        return ManagerFacts(ip=facts["ip"].split()[0], worker_token=facts["worker_token"],
+                            manager_token=facts.get("manager_token", ""), nodes=nodes)
+
+    def as_parameters(self) -> Dict[ParameterType, str]:
+        """Returns the facts as command template parameters."""
+        return {
+            ParameterType.SWARM_MANAGER_IP: self.ip,
+            ParameterType.SWARM_MANAGER_PORT: SWARM_MANAGER_PORT,
+            ParameterType.SWARM_TOKEN: self.worker_token,
+            ParameterType.SWARM_MANAGER_TOKEN: self.manager_token,
+            ParameterType.SWARM_NODES: ",".join(self.nodes),
+        }
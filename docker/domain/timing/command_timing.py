@@ -0,0 +1,46 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CommandTiming(BaseModel):
+    """
+    :param vm_instance: VM instance the command ran for
+    :param stage: Pipeline stage the VM was in, empty outside of a pipeline
+    :param description: Description of the command
+    :param command: The executed command
+    :param queued: Monotonic time the executer took up the command, before its check and its limiter slot
+    :param started: Monotonic time the command got its limiter slot and was handed to the runner
+    :param spawned: Monotonic time the runner had started the process, None if the runner does not report it
+    :param ended: Monotonic time the command finished
+    :param exit_code: Exit code of the command, None if unknown
+    :param output_bytes: Size of stdout and stderr of the command
+    :param skipped: True if the command was skipped because its check succeeded
+    """
+
+    vm_instance: str
+    stage: str = Field(default="")
+    description: str = Field(default="")
+    command: str = Field(default="")
+    queued: float
+    started: float
+    spawned: Optional[float] = Field(default=None)
+    ended: float
+    exit_code: Optional[int] = Field(default=None)
+    output_bytes: int = Field(default=0)
+    skipped: bool = Field(default=False)
+
+    @property
+    def duration(self) -> float:
+        """Seconds the command ran, without the time waiting for its limiter slot."""
+        return self.ended - self.started
+
+    @property
+    def wait(self) -> float:
+        """Seconds the command waited for its check and its limiter slot."""
+        return self.started - self.queued
+
+    @property
+    def spawn_latency(self) -> Optional[float]:
+        """Seconds between handing the command to the runner and the process running."""
+        return self.spawned - self.started if self.spawned is not None else None
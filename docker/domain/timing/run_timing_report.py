@@ -0,0 +1,125 @@
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from domain.timing.command_timing import CommandTiming
+from domain.timing.stage_timing import StageTiming
+from domain.timing.timing_recorder import TimingRecorder
+
+
+class StageSummary(BaseModel):
+    """
+    :param stage: Name of the pipeline stage
+    :param vms: Number of VMs the stage ran for
+    :param wall: Seconds from the first VM entering the stage to the last VM leaving it
+    :param summed: Seconds the commands of the stage ran, summed over all VMs
+    """
+
+    stage: str
+    vms: int
+    wall: float
+    summed: float
+
+    @property
+    def parallelism(self) -> float:
+        return self.summed / self.wall if self.wall > 0 else 0.0
+
+
+class RunTimingReport(BaseModel):
+    """
+    Where the time of a run went: the chain of stages that determined its end (critical path),
+    wall time against summed command time per stage, and the parallelism achieved over the whole run.
+
+    The summed command time stands in for CPU time, the commands mostly wait for the VMs and the host
+    cannot see the CPU time spent inside them.
+    """
+
+    critical_path: List[StageTiming] = Field(default_factory=list)
+    stages: List[StageSummary] = Field(default_factory=list)
+    commands: int = 0
+    wall: float = 0.0
+    busy: float = 0.0
+    peak_parallel: int = 0
+
+    @classmethod
+    def of(cls, recorder: TimingRecorder) -> "RunTimingReport":
+        with recorder.lock:
+            commands = list(recorder.commands)
+            stages = list(recorder.stages)
+
+        executed = [command for command in commands if not command.skipped]
+        intervals = [(command.started, command.ended) for command in executed]
+        intervals += [(stage.started, stage.ended) for stage in stages]
+        wall = max(end for _, end in intervals) - min(start for start, _ in intervals) if intervals else 0.0
+        return RunTimingReport(
+            critical_path=cls._critical_path(stages),
+            stages=cls._summaries(stages, executed),
+            commands=len(commands),
+            wall=wall,
+            busy=sum(command.duration for command in executed),
+            peak_parallel=cls._peak_parallel(executed),
+        )
+
+    @property
+    def parallelism(self) -> float:
+        """Commands running on average at the same time."""
+        return self.busy / self.wall if self.wall > 0 else 0.0
+
+    @staticmethod
+    def _critical_path(stages: List[StageTiming]) -> List[StageTiming]:
+        """
+        Follows the stages back from the one finishing last, always to the dependency finishing last,
+        which is the one the stage had to wait for.
+        """
+        by_key = {stage.key: stage for stage in stages}
+        current: Optional[StageTiming] = max(stages, key=lambda stage: stage.ended, default=None)
+        path = []
+        while current is not None:
+            path.append(current)
+            dependencies = [by_key[key] for key in current.depends_on if key in by_key]
+            current = max(dependencies, key=lambda stage: stage.ended, default=None)
+        return list(reversed(path))
+
+    @staticmethod
+    def _summaries(stages: List[StageTiming], commands: List[CommandTiming]) -> List[StageSummary]:
+        windows: Dict[str, Tuple[float, float, int]] = {}
+        for stage in sorted(stages, key=lambda stage: stage.started):
+            start, end, vms = windows.get(stage.stage, (stage.started, stage.ended, 0))
+            windows[stage.stage] = (min(start, stage.started), max(end, stage.ended), vms + 1)
+        summed: Dict[str, float] = {}
+        for command in commands:
+            summed[command.stage] = summed.get(command.stage, 0.0) + command.duration
+        return [StageSummary(stage=stage, vms=vms, wall=end - start, summed=summed.get(stage, 0.0))
+                for stage, (start, end, vms) in windows.items()]
+
+    @staticmethod
+    def _peak_parallel(commands: List[CommandTiming]) -> int:
+        # Ends sort before starts at the same time, a command following another directly does not overlap it
+        events = sorted([(command.started, 1) for command in commands] + [(command.ended, -1) for command in commands])
+        running = peak = 0
+        for _, change in events:
+            running += change
+            peak = max(peak, running)
+        return peak
+
+    def format(self) -> str:
+        """Renders the report as text for the end of a run."""
+        if not self.critical_path and not self.commands:
+            return "No timings recorded."
+        lines = []
+        if self.critical_path:
+            origin = self.critical_path[0].started
+            length = self.critical_path[-1].ended - origin
+            lines.append(f"Critical path ({length:.1f}s):")
+            for stage in self.critical_path:
+                lines.append(f"  {stage.key:<40} {stage.started - origin:>8.1f}s -> {stage.ended - origin:>8.1f}s "
+                             f"{stage.duration:>8.1f}s{'  failed' if stage.failed else ''}")
+        if self.stages:
+            lines.append("Stages:")
+            lines.append(f"  {'Stage':<24} {'VMs':>4} {'wall':>9} {'summed':>9} {'parallel':>9}")
+            for summary in self.stages:
+                lines.append(f"  {summary.stage:<24} {summary.vms:>4} {summary.wall:>8.1f}s {summary.summed:>8.1f}s "
+                             f"{summary.parallelism:>8.1f}x")
+        lines.append(f"Commands: {self.commands}, {self.busy:.1f}s summed over {self.wall:.1f}s wall, "
+                     f"parallelism {self.parallelism:.1f}x average, {self.peak_parallel} peak")
+        return "\n".join(lines)
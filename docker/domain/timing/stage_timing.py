@@ -0,0 +1,27 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class StageTiming(BaseModel):
+    """
+    :param key: Key of the pipeline node (stage:vm)
+    :param stage: Name of the pipeline stage
+    :param vm_instance: VM instance the stage ran for
+    :param depends_on: Keys of the nodes the stage waited for
+    :param started: Monotonic time the stage started, after all its dependencies were done
+    :param ended: Monotonic time the stage finished
+    :param failed: True if the stage raised an error
+    """
+
+    key: str
+    stage: str
+    vm_instance: str
+    depends_on: List[str] = Field(default_factory=list)
+    started: float
+    ended: float
+    failed: bool = Field(default=False)
+
+    @property
+    def duration(self) -> float:
+        return self.ended - self.started
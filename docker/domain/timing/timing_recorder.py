@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, List, Optional
+
+from domain.timing.command_timing import CommandTiming
+from domain.timing.stage_timing import StageTiming
+
+
+class TimingRecorder:
+    """
+    Collects the timings of the commands and pipeline stages of a run.
+    One recorder is shared by all CommandExecuters and the pipeline, so the report covers the whole run.
+    """
+
+    _shared: Optional["TimingRecorder"] = None
+
+    def __init__(self):
+        self.commands: List[CommandTiming] = []
+        self.stages: List[StageTiming] = []
+        self.current_stages: Dict[str, str] = {}
+        # Commands of the UI thread and of the event loop are recorded concurrently
+        self.lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "TimingRecorder":
+        """Returns the process wide recorder."""
+        if cls._shared is None:
+            cls._shared = TimingRecorder()
+        return cls._shared
+
+    @classmethod
+    def configure(cls, recorder: Optional["TimingRecorder"]):
+        """Replaces the process wide recorder, e.g. with an empty one at the start of a run."""
+        cls._shared = recorder
+
+    def enter_stage(self, vm_instance: str, stage: str):
+        """Marks the stage the VM is in, the commands of the VM recorded meanwhile belong to it."""
+        with self.lock:
+            self.current_stages[vm_instance] = stage
+
+    def stage_of(self, vm_instance: str) -> str:
+        with self.lock:
+            return self.current_stages.get(vm_instance, "")
+
+    def record_command(self, timing: CommandTiming):
+        with self.lock:
+            self.commands.append(timing)
+
+    def record_stage(self, timing: StageTiming):
+        with self.lock:
+            self.stages.append(timing)
+            if self.current_stages.get(timing.vm_instance) == timing.stage:
+                del self.current_stages[timing.vm_instance]
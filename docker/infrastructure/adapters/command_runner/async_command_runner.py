@@ -34,11 +34,13 @@ class AsyncPortCommandRunner(PortCommandRunner):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
+            self.mark_spawned()
             self.logger.info(f"Finishing subprocess: {command}")
             # Wait for subprocess to complete
             stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            output = stdout.decode('utf-8').strip()
             # Log output
-            self.logger.info(f"Command output: {stdout.decode('utf-8').strip()}")
+            self.logger.info(f"Command output: {output}")
 
             # Check process return code
             if process.returncode != 0:
@@ -49,7 +51,7 @@ class AsyncPortCommandRunner(PortCommandRunner):
                 raise CommandExecutionError(
                     command=command,
                     return_code=process.returncode,
-                    stdout=stdout.decode('utf-8').strip(),
+                    stdout=output,
                     stderr=error_message
                 )
 
@@ -58,7 +60,7 @@ class AsyncPortCommandRunner(PortCommandRunner):
                 self.status["result"] = "Success"
             self.logger.info(f"Command completed successfully: {command}")
 
-            return stdout.decode('utf-8').strip()
+            return output
 
         except asyncio.TimeoutError:
             # Log timeout error
@@ -74,6 +76,9 @@ class AsyncPortCommandRunner(PortCommandRunner):
                 stderr=f"Command timed out after {timeout} seconds."
             )
 
+        except CommandExecutionError:
+            raise
+
         except Exception as e:
             # Log unexpected errors
             self.logger.exception(f"An unexpected error occurred while executing the command: {command}")
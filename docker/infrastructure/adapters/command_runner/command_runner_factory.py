@@ -1,9 +1,13 @@
+from typing import Callable, Optional
+
 from application.ports.commands.port_command_runner_factory import PortCommandRunnerFactory
 from application.ports.commands.port_command_runner import PortCommandRunner
 from domain.command.command_runner_type_enum import CommandRunnerType
 from infrastructure.adapters.command_runner.ansible_runner import AnsiblePortCommandRunner
 from infrastructure.adapters.command_runner.async_command_runner import AsyncPortCommandRunner
 from infrastructure.adapters.command_runner.rest_api_runner import RestApiPortCommandRunner
+from infrastructure.adapters.command_runner.session_command_runner import SessionPortCommandRunner
+from infrastructure.adapters.command_runner.streaming_command_runner import StreamingPortCommandRunner
 
 
 class CommandRunnerFactory(PortCommandRunnerFactory):
@@ -11,9 +15,20 @@ class CommandRunnerFactory(PortCommandRunnerFactory):
         CommandRunnerType.ASYNC: AsyncPortCommandRunner,
         CommandRunnerType.REST: RestApiPortCommandRunner,
         CommandRunnerType.ANSIBLE: AnsiblePortCommandRunner,
+        CommandRunnerType.SESSION: SessionPortCommandRunner,
+        CommandRunnerType.STREAM: StreamingPortCommandRunner,
     }
+    # Creates the runners of all types instead of the map, e.g. a simulation for benchmarks
+    _override: Optional[Callable[[CommandRunnerType], PortCommandRunner]] = None
+
+    @classmethod
+    def configure(cls, provider: Optional[Callable[[CommandRunnerType], PortCommandRunner]]):
+        """Replaces the runners of every factory by the ones the provider creates, None restores the real runners."""
+        cls._override = provider
 
     def get_runner(self, runner_type: CommandRunnerType) -> PortCommandRunner:
+        if CommandRunnerFactory._override is not None:
+            return CommandRunnerFactory._override(runner_type)
         runner_class = CommandRunnerFactory._runner_map.get(runner_type)
         if not runner_class:
             raise ValueError(f"Unsupported runner type: {runner_type}")
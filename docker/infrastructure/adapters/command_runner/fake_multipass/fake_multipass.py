@@ -0,0 +1,364 @@
+import asyncio
+import json
+import random
+import re
+import shlex
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from domain.command.command_builder.command_batcher import SATISFIED, STEP_MARKER
+from domain.command.command_runner_type_enum import CommandRunnerType
+from domain.swarm.manager_facts import FACT_MARKER
+from infrastructure.adapters.command_runner.fake_multipass.simulation_profile import SimulationProfile
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+from infrastructure.logging.logger_factory import LoggerFactory
+
+DOCKER_VERSION = "Docker version 27.0.3, build 7d4bcd8"
+GATEWAY = "10.42.0.1"
+# Steps of a script fused by the CommandBatcher, with and without check
+STEP_BLOCK = re.compile(rf"echo '{STEP_MARKER} BEGIN (\d+)'\n(.*?)\nprintf '\\n{STEP_MARKER} END \1 %d\\n'", re.S)
+CHECKED_STEP = re.compile(r"if \( (.*?)\n\) </dev/null >/dev/null 2>&1; then echo '[^']*'; "
+                          r"else \( (.*)\n\) </dev/null 2>&1; fi", re.S)
+PLAIN_STEP = re.compile(r"\( (.*)\n\) </dev/null 2>&1", re.S)
+# First registry mirror of a daemon.json written by echo, quotes escaped once or not at all
+DAEMON_MIRROR = re.compile(r'registry-mirrors\\?"\s*:\s*\[\\?"([^"\\]+)')
+
+
+class SimulatedVm(BaseModel):
+    """
+    :param name: Instance name
+    :param state: Running, Stopped or Deleted
+    :param ipv4: Address of the default interface
+    :param docker: True once docker-ce is installed
+    :param swarm: Swarm state of the node, inactive or active
+    :param daemon_mirror: Registry mirror in /etc/docker/daemon.json
+    :param loaded_mirror: Registry mirror the docker daemon uses, daemon.json as it was when docker started
+    """
+
+    name: str
+    state: str = Field(default="Running")
+    ipv4: str
+    docker: bool = Field(default=False)
+    swarm: str = Field(default="inactive")
+    daemon_mirror: Optional[str] = Field(default=None)
+    loaded_mirror: Optional[str] = Field(default=None)
+
+
+class CommandFailed(Exception):
+    def __init__(self, message: str, return_code: int = 1):
+        super().__init__(message)
+        self.return_code = return_code
+
+
+class FakeMultipass:
+    """
+    Simulates multipass and the VMs behind it in memory, for benchmarks of the orchestration without real VMs.
+    It understands the commands of the repository YAML files: launch, clone, start, stop, restart, delete, purge,
+    info, list, transfer and exec, inside exec the docker, swarm and network commands whose output or state the
+    services depend on. Other commands succeed without output.
+
+    Configure it as the runner of all commands with CommandRunnerFactory.configure(fake.runner).
+    """
+
+    def __init__(self, profile: Optional[SimulationProfile] = None):
+        self.profile = profile or SimulationProfile.instant()
+        self.rng = random.Random(self.profile.seed)
+        self.vms: Dict[str, SimulatedVm] = {}
+        self.worker_token = "SWMTKN-1-simulated-worker"
+        self.manager_token = "SWMTKN-1-simulated-manager"
+        self.swarm_manager: Optional[str] = None
+        self.swarm_nodes: List[str] = []
+        self.operations: Dict[str, int] = {}
+        self.simulated_seconds = 0.0
+        self.running = 0
+        self.peak_running = 0
+        # Runners of different event loops may share the state, e.g. the readiness probes of the legacy scripts
+        self.lock = threading.Lock()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    def runner(self, runner_type: CommandRunnerType = CommandRunnerType.ASYNC) -> PortCommandRunner:
+        """Creates a runner executing its commands against this simulation, for every runner type."""
+        return FakeMultipassPortCommandRunner(self)
+
+    async def run(self, command: str) -> Tuple[str, float]:
+        """
+        Executes the command against the state after its simulated latency.
+
+        :return: Output of the command and the simulated seconds it took.
+        :raises CommandFailed: If the command fails on the current state or by its failure rate.
+        """
+        operation = self.operation_of(command)
+        with self.lock:
+            seconds = self.profile.latency(operation, self.rng)
+            fails = self.profile.fails(operation, self.rng)
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+            self.simulated_seconds += seconds
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        try:
+            await asyncio.sleep(seconds)
+            if fails:
+                raise CommandFailed(f"simulated failure of {operation}")
+            with self.lock:
+                return self.apply(command), seconds
+        finally:
+            with self.lock:
+                self.running -= 1
+
+    @staticmethod
+    def operation_of(command: str) -> str:
+        tokens = FakeMultipass._multipass_tokens(command)
+        if tokens is None:
+            return "host"
+        if tokens[0] == "exec" and re.search(r"\bapt(-get)?\s+(install|update|upgrade)", command):
+            return "apt"
+        return tokens[0]
+
+    @staticmethod
+    def _multipass_tokens(command: str) -> Optional[List[str]]:
+        """The arguments of a multipass call, None for other commands."""
+        head = command.split(" -- ", 1)[0]
+        tokens = shlex.split(head)
+        if tokens[:1] == ["sudo"]:
+            tokens = tokens[1:]
+        if tokens[:1] != ["multipass"] or len(tokens) < 2:
+            return None
+        return tokens[1:]
+
+    def apply(self, command: str) -> str:
+        """Applies the command to the state and returns its output."""
+        tokens = self._multipass_tokens(command)
+        if tokens is None:
+            return ""
+        verb, args = tokens[0], tokens[1:]
+        if verb == "launch":
+            return self._launch(self._option(args, "-n", "--name") or self._positional(args)[0])
+        if verb == "clone":
+            source = self._positional(args)[0]
+            return self._clone(source, self._option(args, "-n", "--name") or f"{source}-clone1")
+        if verb in ("start", "stop", "restart"):
+            for name in self._positional(args):
+                vm = self._vm(name, running=verb != "start")
+                vm.state = "Stopped" if verb == "stop" else "Running"
+                if vm.docker and verb != "stop":
+                    vm.loaded_mirror = vm.daemon_mirror
+            return ""
+        if verb == "delete":
+            names = list(self.vms) if "--all" in args else self._positional(args)
+            for name in names:
+                self._vm(name, running=False).state = "Deleted"
+                self._leave(name)
+            if "--purge" in args:
+                self._purge()
+            return ""
+        if verb == "purge":
+            self._purge()
+            return ""
+        if verb == "info":
+            vm = self._vm(self._positional(args)[0], running=False)
+            return f"Name:           {vm.name}\nState:          {vm.state}\nIPv4:           {vm.ipv4}"
+        if verb == "list":
+            return self._list("--format" in args and "json" in args)
+        if verb == "transfer":
+            for arg in self._positional(args):
+                if ":" in arg:
+                    self._vm(arg.split(":", 1)[0])
+            return ""
+        if verb == "exec":
+            vm = self._vm(self._positional(args)[0])
+            return self._exec(vm, command.split(" -- ", 1)[1] if " -- " in command else "")
+        raise CommandFailed(f"unknown multipass command: {verb}", return_code=2)
+
+    @staticmethod
+    def _option(args: List[str], *names: str) -> Optional[str]:
+        for index, arg in enumerate(args[:-1]):
+            if arg in names:
+                return args[index + 1]
+        return None
+
+    @staticmethod
+    def _positional(args: List[str]) -> List[str]:
+        positional, skip = [], False
+        for arg in args:
+            if skip:
+                skip = False
+            elif arg.startswith("-"):
+                # Flags without value
+                skip = arg not in ("--all", "--purge", "--force")
+            else:
+                positional.append(arg)
+        return positional
+
+    def _vm(self, name: str, running: bool = True) -> SimulatedVm:
+        vm = self.vms.get(name)
+        if vm is None or vm.state == "Deleted" and running:
+            raise CommandFailed(f"instance \"{name}\" does not exist")
+        if running and vm.state != "Running":
+            raise CommandFailed(f"instance \"{name}\" is not running")
+        return vm
+
+    def _next_ip(self) -> str:
+        number = len(self.vms) + 2
+        return f"10.42.{number // 250}.{number % 250 + 2}"
+
+    def _launch(self, name: str) -> str:
+        if name in self.vms:
+            raise CommandFailed(f"instance \"{name}\" already exists")
+        self.vms[name] = SimulatedVm(name=name, ipv4=self._next_ip())
+        return f"Launched: {name}"
+
+    def _clone(self, source: str, name: str) -> str:
+        image = self._vm(source, running=False)
+        if image.state != "Stopped":
+            raise CommandFailed(f"instance \"{source}\" must be stopped to be cloned")
+        if name in self.vms:
+            raise CommandFailed(f"instance \"{name}\" already exists")
+        self.vms[name] = image.model_copy(update={"name": name, "ipv4": self._next_ip(), "swarm": "inactive"})
+        return f"Cloned from {source} to {name}."
+
+    def _purge(self):
+        self.vms = {name: vm for name, vm in self.vms.items() if vm.state != "Deleted"}
+
+    def _list(self, as_json: bool) -> str:
+        vms = [vm for vm in self.vms.values()]
+        if as_json:
+            return json.dumps({"list": [{"name": vm.name, "state": vm.state, "ipv4": [vm.ipv4],
+                                         "release": "Ubuntu 24.04 LTS"} for vm in vms]})
+        if not vms:
+            return "No instances found."
+        return "\n".join(["Name State IPv4 Image"] + [f"{vm.name} {vm.state} {vm.ipv4} Ubuntu 24.04 LTS"
+                                                      for vm in vms])
+
+    def _leave(self, name: str):
+        if name in self.swarm_nodes:
+            self.swarm_nodes.remove(name)
+        if self.swarm_manager == name:
+            self.swarm_manager, self.swarm_nodes = None, []
+
+    def _require_docker(self, vm: SimulatedVm):
+        if not vm.docker:
+            raise CommandFailed("docker: command not found", return_code=127)
+
+    def _exec(self, vm: SimulatedVm, inner: str) -> str:
+        if f"{STEP_MARKER} BEGIN" in inner:
+            return self._exec_steps(vm, shlex.split(inner)[-1])
+        if FACT_MARKER in inner:
+            active = vm.swarm == "active" and self.swarm_manager == vm.name
+            lines = [f"{FACT_MARKER} ip {vm.ipv4} ",
+                     f"{FACT_MARKER} worker_token {self.worker_token if active else ''}",
+                     f"{FACT_MARKER} manager_token {self.manager_token if active else ''}"]
+            lines += [f"{FACT_MARKER} node {node}" for node in (self.swarm_nodes if active else [])]
+            return "\n".join(lines)
+        if "LocalNodeState" in inner:
+            if vm.swarm != "active":
+                raise CommandFailed("swarm inactive")
+            return ""
+        if "docker swarm init" in inner:
+            self._require_docker(vm)
+            if vm.swarm == "active":
+                raise CommandFailed("This node is already part of a swarm.")
+            vm.swarm, self.swarm_manager, self.swarm_nodes = "active", vm.name, [vm.name]
+            return f"Swarm initialized: current node ({vm.name}) is now a manager."
+        if "docker swarm join" in inner:
+            self._require_docker(vm)
+            if self.swarm_manager is None or self.worker_token not in inner:
+                raise CommandFailed("invalid join token or manager unreachable")
+            vm.swarm = "active"
+            self.swarm_nodes.append(vm.name)
+            return "This node joined a swarm as a worker."
+        if "docker swarm leave" in inner:
+            vm.swarm = "inactive"
+            self._leave(vm.name)
+            return "Node left the swarm."
+        if "docker node rm" in inner:
+            self._leave(inner.split()[-1])
+            return ""
+        if "/etc/docker/daemon.json" in inner:
+            if "grep -q" in inner:
+                if vm.daemon_mirror is None or vm.daemon_mirror not in inner:
+                    raise CommandFailed("no match")
+                return ""
+            match = DAEMON_MIRROR.search(inner)
+            vm.daemon_mirror = match.group(1) if match else None
+            return ""
+        if re.search(r"\bapt(-get)?\s+install\b.*docker-ce\b", inner, re.S):
+            vm.docker, vm.loaded_mirror = True, vm.daemon_mirror
+            return ""
+        if "RegistryConfig.Mirrors" in inner:
+            self._require_docker(vm)
+            if "grep -q" in inner and (vm.loaded_mirror is None or vm.loaded_mirror not in inner):
+                raise CommandFailed("no match")
+            return f"[{vm.loaded_mirror}/]" if vm.loaded_mirror else "[]"
+        if "docker --version" in inner:
+            self._require_docker(vm)
+            return DOCKER_VERSION
+        if re.search(r"\bdocker\s+(info|inspect|run|node|stack)\b", inner) or "is-active --quiet docker" in inner:
+            self._require_docker(vm)
+            return ""
+        if "route show default" in inner:
+            return f"default via {GATEWAY} dev enp0s1 proto dhcp src {vm.ipv4} metric 100"
+        if "hostname -I" in inner:
+            return f"{vm.ipv4} "
+        if "grep -q" in inner:
+            # File contents are not simulated, the probed command runs
+            raise CommandFailed("no match")
+        return ""
+
+    def _exec_steps(self, vm: SimulatedVm, script: str) -> str:
+        """Runs the steps of a fused script one after the other, framed by the markers the batcher splits on."""
+        lines = []
+        for index, body in STEP_BLOCK.findall(script):
+            checked, plain = CHECKED_STEP.fullmatch(body), PLAIN_STEP.fullmatch(body)
+            check, remote = checked.groups() if checked else (None, plain.group(1) if plain else body)
+            lines.append(f"{STEP_MARKER} BEGIN {index}")
+            return_code = 0
+            try:
+                if check is not None and self._succeeds(vm, check):
+                    lines.append(SATISFIED)
+                else:
+                    lines.append(self._exec(vm, remote))
+            except CommandFailed as e:
+                lines.append(str(e))
+                return_code = e.return_code
+            lines.append(f"{STEP_MARKER} END {index} {return_code}")
+        return "\n".join(line for line in lines if line)
+
+    def _succeeds(self, vm: SimulatedVm, inner: str) -> bool:
+        try:
+            self._exec(vm, inner)
+        except CommandFailed:
+            return False
+        return True
+
+
+class FakeMultipassPortCommandRunner(PortCommandRunner):
+    """Runs its commands against a FakeMultipass instead of a shell."""
+
+    def __init__(self, simulation: FakeMultipass):
+        super().__init__()
+        self.simulation = simulation
+        self.status = {"current_step": "Not started", "result": "Pending"}
+        # Simulated seconds of the last command, the rest of its measured time is overhead
+        self.simulated_seconds = 0.0
+
+    async def run(self, command: str, timeout: int = 120) -> str:
+        self.status["current_step"] = "Executing command"
+        self.status["result"] = "Running..."
+        spawn = self.simulation.profile.spawn.sample(self.simulation.rng) * self.simulation.profile.time_scale
+        await asyncio.sleep(spawn)
+        self.mark_spawned()
+        try:
+            output, self.simulated_seconds = await asyncio.wait_for(self.simulation.run(command), timeout=timeout)
+        except CommandFailed as e:
+            self.status["result"] = "Error"
+            raise CommandExecutionError(command=command, return_code=e.return_code, stdout="", stderr=str(e))
+        except asyncio.TimeoutError:
+            self.status["result"] = "Error"
+            raise CommandExecutionError(command=command, return_code=-1, stdout="",
+                                        stderr=f"Command timed out after {timeout} seconds.")
+        self.simulated_seconds += spawn
+        self.status["result"] = "Success"
+        return output
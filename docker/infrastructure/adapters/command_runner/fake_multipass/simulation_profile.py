@@ -0,0 +1,77 @@
+import random
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Latency(BaseModel):
+    """
+    :param mean: Mean seconds of the operation
+    :param jitter: Fraction the seconds vary uniformly around the mean
+    """
+
+    mean: float = Field(default=0.0, ge=0)
+    jitter: float = Field(default=0.0, ge=0, le=1)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean == 0:
+            return 0.0
+        return self.mean * (1 + self.jitter * (2 * rng.random() - 1))
+
+
+class SimulationProfile(BaseModel):
+    """
+    Latencies and failure rates of the simulated multipass operations.
+    Operations: launch, clone, start, stop, restart, delete, purge, info, list, transfer, exec, apt (exec of an apt
+    command) and host (commands not calling multipass).
+
+    :param latencies: Latency per operation, operations without an entry take no time
+    :param failure_rates: Probability per operation that a command fails
+    :param spawn: Latency of starting the process of a command
+    :param time_scale: Factor applied to all latencies, e.g. 0.001 to replay a 10 minute run in 0.6 s
+    :param seed: Seed of the random latencies and failures, a fresh seed if None
+    """
+
+    latencies: Dict[str, Latency] = Field(default_factory=dict)
+    failure_rates: Dict[str, float] = Field(default_factory=dict)
+    spawn: Latency = Field(default_factory=Latency)
+    time_scale: float = Field(default=1.0, ge=0)
+    seed: Optional[int] = Field(default=None)
+
+    @staticmethod
+    def instant() -> "SimulationProfile":
+        """Every operation takes no time, the measured time is the overhead of the orchestration."""
+        return SimulationProfile(time_scale=0.0)
+
+    @staticmethod
+    def realistic(time_scale: float = 0.001, seed: Optional[int] = 0) -> "SimulationProfile":
+        """Latencies in the range of a laptop with a local image cache, scaled down by time_scale."""
+        return SimulationProfile(
+            latencies={
+                "launch": Latency(mean=60, jitter=0.3),
+                "clone": Latency(mean=8, jitter=0.3),
+                "start": Latency(mean=15, jitter=0.3),
+                "stop": Latency(mean=5, jitter=0.3),
+                "restart": Latency(mean=20, jitter=0.3),
+                "delete": Latency(mean=3, jitter=0.3),
+                "purge": Latency(mean=2, jitter=0.3),
+                "info": Latency(mean=0.2, jitter=0.3),
+                "list": Latency(mean=0.3, jitter=0.3),
+                "transfer": Latency(mean=0.5, jitter=0.3),
+                "exec": Latency(mean=0.4, jitter=0.5),
+                "apt": Latency(mean=25, jitter=0.5),
+                "host": Latency(mean=0.05, jitter=0.5),
+            },
+            spawn=Latency(mean=0.005, jitter=0.5),
+            time_scale=time_scale,
+            seed=seed,
+        )
+
+    def latency(self, operation: str, rng: random.Random) -> float:
+        """Seconds the operation takes, scaled."""
+        latency = self.latencies.get(operation)
+        return latency.sample(rng) * self.time_scale if latency else 0.0
+
+    def fails(self, operation: str, rng: random.Random) -> bool:
+        rate = self.failure_rates.get(operation, 0.0)
+        return rate > 0 and rng.random() < rate
@@ -0,0 +1,117 @@
+import asyncio
+import uuid
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+from infrastructure.logging.logger_factory import LoggerFactory
+
+# Maximum length of a single output line read from the session
+STREAM_LIMIT = 2 ** 20
+# Number of trailing output lines kept per command
+DEFAULT_CAPTURE_LINES = 200
+
+
+class RemoteShellSession:
+    """
+    A long-lived shell inside a VM. Commands are written to its stdin one after another and the output of
+    every command is framed by a sentinel line carrying the exit code, so one `multipass exec` serves many commands.
+    """
+
+    def __init__(self, vm_instance: str, shell_command: Optional[List[str]] = None,
+                 capture_lines: int = DEFAULT_CAPTURE_LINES):
+        """
+        :param vm_instance: VM instance the shell runs in.
+        :param shell_command: Command starting the shell, defaults to a bash via `multipass exec`.
+        :param capture_lines: Number of trailing output lines returned per command.
+        """
+        self.vm_instance = vm_instance
+        self.capture_lines = capture_lines
+        self.shell_command = shell_command or ["multipass", "exec", vm_instance, "--", "bash", "--noprofile", "--norc"]
+        self.sentinel = f"__TSW_DONE_{uuid.uuid4().hex}__"
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.lock = asyncio.Lock()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    def is_alive(self) -> bool:
+        """Returns True if the shell is running and bound to the current event loop."""
+        return (self.process is not None and self.process.returncode is None
+                and self.loop is asyncio.get_running_loop())
+
+    async def start(self):
+        """Starts the remote shell."""
+        self.logger.info(f"Opening session to {self.vm_instance}: {self.shell_command}")
+        self.loop = asyncio.get_running_loop()
+        self.process = await asyncio.create_subprocess_exec(
+            *self.shell_command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=STREAM_LIMIT
+        )
+
+    async def execute(self, remote: str, timeout: int = 120,
+                      on_line: Optional[Callable[[str], None]] = None) -> Tuple[int, str]:
+        """
+        Executes a command in the session.
+
+        :param remote: Shell command to execute.
+        :param timeout: Seconds to wait for the command.
+        :param on_line: Callback receiving every output line as soon as it is read.
+        :return: Exit code and the trailing lines of the combined stdout/stderr of the command.
+        :raises ConnectionError: If the session ended while the command was running.
+        :raises asyncio.TimeoutError: If the command did not finish in time, the session is closed then.
+        """
+        async with self.lock:
+            if not self.is_alive():
+                await self.start()
+
+            # stdin is detached so the command cannot consume the following commands. The sentinel starts on a line
+            # of its own even if the output does not end with a newline, the extra line break is dropped when read
+            self.process.stdin.write(f"( {remote}\n) </dev/null 2>&1; printf '\\n%s %d\\n' '{self.sentinel}' \"$?\"\n"
+                                     .encode("utf-8"))
+            await self.process.stdin.drain()
+
+            try:
+                return await asyncio.wait_for(self._read_until_sentinel(on_line), timeout=timeout)
+            except asyncio.TimeoutError:
+                await self.close()
+                raise
+
+    async def _read_until_sentinel(self, on_line: Optional[Callable[[str], None]]) -> Tuple[int, str]:
+        lines = deque(maxlen=self.capture_lines)
+        # An empty line is only output once the next line shows it is not the line break before the sentinel
+        pending_empty = False
+        while True:
+            raw_line = await self.process.stdout.readline()
+            if not raw_line:
+                output = "\n".join(lines)
+                await self.close()
+                raise ConnectionError(f"Session to {self.vm_instance} closed unexpectedly: {output}")
+
+            line = raw_line.decode("utf-8", errors="replace").rstrip("\n")
+            if line.startswith(self.sentinel):
+                return int(line[len(self.sentinel):].strip()), "\n".join(lines)
+            if pending_empty:
+                self._output("", lines, on_line)
+            pending_empty = line == ""
+            if not pending_empty:
+                self._output(line, lines, on_line)
+
+    @staticmethod
+    def _output(line: str, lines: deque, on_line: Optional[Callable[[str], None]]):
+        lines.append(line)
+        if on_line:
+            on_line(line)
+
+    async def close(self):
+        """Terminates the remote shell."""
+        if self.process is None or self.process.returncode is not None:
+            return
+        self.logger.info(f"Closing session to {self.vm_instance}")
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), timeout=5)
+        except (asyncio.TimeoutError, ConnectionError, RuntimeError):
+            self.process.kill()
+            await self.process.wait()
@@ -11,7 +11,7 @@ class RestApiPortCommandRunner(PortCommandRunner):
         # Use asyncio.Lock for asynchronous operations
         self.lock = asyncio.Lock()
 
-    async def run(self, command: str) -> str:
+    async def run(self, command: str, timeout: int = 120) -> str:
         async with self.lock:
             self.status["current_step"] = "Executing command"
             self.status["result"] = "Running..."
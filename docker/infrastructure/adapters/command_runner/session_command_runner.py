@@ -0,0 +1,85 @@
+import asyncio
+from typing import Dict
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from domain.command.remote_command import RemoteCommand
+from infrastructure.adapters.command_runner.async_command_runner import AsyncPortCommandRunner
+from infrastructure.adapters.command_runner.remote_shell_session import RemoteShellSession
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+from infrastructure.logging.logger_factory import LoggerFactory
+
+
+class SessionPortCommandRunner(PortCommandRunner):
+    """
+    Runs `multipass exec` commands through one persistent shell per VM instead of a new process per command.
+    Commands that do not target a VM are executed by the AsyncPortCommandRunner.
+    """
+
+    # One session per VM instance, shared by all runner objects
+    _sessions: Dict[str, RemoteShellSession] = {}
+
+    def __init__(self):
+        super().__init__()
+        # Use asyncio.Lock for asynchronous operations
+        self.lock = asyncio.Lock()
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    @classmethod
+    def get_session(cls, vm_instance: str) -> RemoteShellSession:
+        """Returns the session of the VM instance, creating it on first use."""
+        session = cls._sessions.get(vm_instance)
+        if session is None:
+            session = RemoteShellSession(vm_instance)
+            cls._sessions[vm_instance] = session
+        return session
+
+    @classmethod
+    async def close_all(cls):
+        """Closes the sessions of all VM instances."""
+        sessions = list(cls._sessions.values())
+        cls._sessions.clear()
+        for session in sessions:
+            await session.close()
+
+    async def run(self, command: str, timeout: int = 120) -> str:
+        remote_command = RemoteCommand.parse(command)
+        if remote_command is None:
+            fallback = AsyncPortCommandRunner()
+            fallback.output_listeners = self.output_listeners
+            result = await fallback.run(command, timeout=timeout)
+            self.status = fallback.status
+            return result
+
+        async with self.lock:
+            self.status["current_step"] = "Executing command"
+            self.status["result"] = "Running..."
+
+        self.logger.info(f"Executing in session of {remote_command.vm_instance}: {remote_command.remote}")
+        session = self.get_session(remote_command.vm_instance)
+        try:
+            return_code, output = await session.execute(remote_command.remote, timeout=timeout,
+                                                        on_line=self.emit_output)
+        except asyncio.TimeoutError:
+            async with self.lock:
+                self.status["result"] = "Error"
+            self.logger.error(f"Command timed out after {timeout} seconds: {command}")
+            raise CommandExecutionError(command=command, return_code=-1, stdout="",
+                                        stderr=f"Command timed out after {timeout} seconds.")
+        except Exception as e:
+            self.logger.exception(f"An unexpected error occurred while executing the command: {command}")
+            async with self.lock:
+                self.status["result"] = "Error"
+            raise CommandExecutionError(command=command, return_code=-1, stdout="",
+                                        stderr=f"An unexpected error occurred: {str(e)}") from e
+
+        self.logger.info(f"Command output: {output}")
+        if return_code != 0:
+            self.logger.error(f"Command failed with return code {return_code}: {output}")
+            async with self.lock:
+                self.status["result"] = "Error"
+            raise CommandExecutionError(command=command, return_code=return_code, stdout="", stderr=output)
+
+        async with self.lock:
+            self.status["result"] = "Success"
+        self.logger.info(f"Command completed successfully: {command}")
+        return output.strip()
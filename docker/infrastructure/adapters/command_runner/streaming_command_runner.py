@@ -0,0 +1,138 @@
+import asyncio
+import os
+import signal
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncIterator, Optional, Tuple
+
+from infrastructure.adapters.command_runner.async_command_runner import AsyncPortCommandRunner
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+
+# Number of output lines per stream kept for the return value and the error
+DEFAULT_CAPTURE_LINES = 200
+# Maximum length of a single output line
+STREAM_LIMIT = 2 ** 20
+
+
+class StreamingPortCommandRunner(AsyncPortCommandRunner):
+    """
+    Runs shell commands and reads their output line by line while they are running.
+    Lines are forwarded to the logger and the output listeners immediately, only a bounded tail is kept in memory.
+    """
+
+    def __init__(self, capture_lines: int = DEFAULT_CAPTURE_LINES):
+        """
+        :param capture_lines: Number of trailing lines per stream kept for the result.
+        """
+        super().__init__()
+        self.capture_lines = capture_lines
+        self.return_code: Optional[int] = None
+
+    async def stream(self, command: str) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Starts the command and yields its output lines as they arrive.
+        The return code is available in `return_code` once the generator is exhausted.
+
+        :return: Async iterator of (stream name, line) with stream name "stdout" or "stderr".
+        """
+        self.return_code = None
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT,
+            # Own process group, so a timeout also stops the children holding the pipes open
+            start_new_session=hasattr(os, "killpg")
+        )
+        self.mark_spawned()
+        lines: asyncio.Queue = asyncio.Queue()
+
+        async def pump(stream_name: str, stream: asyncio.StreamReader):
+            while raw_line := await stream.readline():
+                await lines.put((stream_name, raw_line.decode("utf-8", errors="replace").rstrip("\r\n")))
+            await lines.put((stream_name, None))
+
+        readers = [asyncio.create_task(pump("stdout", process.stdout)),
+                   asyncio.create_task(pump("stderr", process.stderr))]
+        try:
+            open_streams = len(readers)
+            while open_streams:
+                stream_name, line = await lines.get()
+                if line is None:
+                    open_streams -= 1
+                    continue
+                yield stream_name, line
+            self.return_code = await process.wait()
+        finally:
+            for reader in readers:
+                reader.cancel()
+            if process.returncode is None:
+                self._kill(process)
+                await process.wait()
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process):
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+                return
+            except ProcessLookupError:
+                pass
+        process.kill()
+
+    async def run(self, command: str, timeout: int = 120) -> str:
+        self.logger.info(f"Starting streaming subprocess: {command}")
+        stdout_tail = deque(maxlen=self.capture_lines)
+        stderr_tail = deque(maxlen=self.capture_lines)
+
+        async def consume():
+            async with aclosing(self.stream(command)) as lines:
+                async for stream_name, line in lines:
+                    (stdout_tail if stream_name == "stdout" else stderr_tail).append(line)
+                    self.logger.info(f"[{stream_name}] {line}")
+                    self.emit_output(line)
+
+        async with self.lock:
+            self.status["current_step"] = "Executing command"
+            self.status["result"] = "Running..."
+
+        try:
+            await asyncio.wait_for(consume(), timeout=timeout)
+        except asyncio.TimeoutError:
+            async with self.lock:
+                self.status["result"] = "Error"
+            self.logger.error(f"Command timed out after {timeout} seconds: {command}")
+            raise CommandExecutionError(
+                command=command,
+                return_code=-1,  # -1 = Special return code for timeout
+                stdout="\n".join(stdout_tail),
+                stderr=f"Command timed out after {timeout} seconds."
+            )
+        except Exception as e:
+            self.logger.exception(f"An unexpected error occurred while executing the command: {command}")
+            async with self.lock:
+                self.status["result"] = "Error"
+            raise CommandExecutionError(
+                command=command,
+                return_code=-1,  # -1 = Special return code for unexpected errors
+                stdout="",
+                stderr=f"An unexpected error occurred: {str(e)}"
+            ) from e
+
+        output = "\n".join(stdout_tail).strip()
+        if self.return_code != 0:
+            error_message = "\n".join(stderr_tail).strip()
+            self.logger.error(f"Command failed with return code {self.return_code}: {error_message}")
+            async with self.lock:
+                self.status["result"] = "Error"
+            raise CommandExecutionError(
+                command=command,
+                return_code=self.return_code,
+                stdout=output,
+                stderr=error_message
+            )
+
+        async with self.lock:
+            self.status["result"] = "Success"
+        self.logger.info(f"Command completed successfully: {command}")
+        return output
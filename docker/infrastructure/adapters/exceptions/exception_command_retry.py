@@ -0,0 +1,19 @@
+from typing import List
+
+
+class CommandRetriesExhaustedError(Exception):
+    """
+    Raised when the commands of a VM still failed after the last retry.
+    """
+
+    def __init__(self, vm_instance: str, attempts: int, failed_keys: List[int]):
+        """
+        Args:
+            vm_instance (str): The VM the commands ran on.
+            attempts (int): Number of times the commands were executed.
+            failed_keys (List[int]): Indexes of the commands that failed in the last attempt.
+        """
+        super().__init__(f"Commands {failed_keys} on '{vm_instance}' failed after {attempts} attempts")
+        self.vm_instance = vm_instance
+        self.attempts = attempts
+        self.failed_keys = failed_keys
@@ -0,0 +1,15 @@
+from typing import Dict, List
+
+
+class CommandsFailedError(Exception):
+    """
+    Raised when commands of a stage failed, so the stages depending on it are skipped.
+    """
+
+    def __init__(self, failures: Dict[str, List[int]]):
+        """
+        Args:
+            failures (Dict[str, List[int]]): Indexes of the failed commands per VM.
+        """
+        super().__init__(f"Commands failed: {failures}")
+        self.failures = failures
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Any
 
+from infrastructure.adapters.file_management.file_locator import FileLocator
 from infrastructure.adapters.file_management.path_normalizer import PathNormalizer
 from infrastructure.adapters.file_management.path_strategies.path_factory import PathFactory
 from infrastructure.dependency_injection.infra_core_di_annotations import inject
@@ -52,5 +53,6 @@ class FileCreator:
         # Write data to file
         with open(final_file_path, "w", encoding="utf-8") as f:
             f.write(str(data))
+        FileLocator.invalidate(final_file_path.name)
 
         return final_file_path
@@ -1,7 +1,9 @@
 import os
 from pathlib import Path
+from typing import List, Optional
 
 from infrastructure.adapters.file_management.path_normalizer import PathNormalizer
+from infrastructure.adapters.file_management.resolved_path_cache import ResolvedPathCache
 from infrastructure.adapters.file_management.path_strategies.path_factory import PathFactory
 from infrastructure.dependency_injection.infra_core_di_annotations import inject
 
@@ -9,23 +11,36 @@ from infrastructure.dependency_injection.infra_core_di_annotations import inject
 class FileLocator:
     """
     Adapter for locating and ensuring YAML files and directories exist in standard locations.
+    The search directories and the located files are cached process-wide, see ResolvedPathCache.
     """
 
+    # Resolutions of all locators, validated against the modification times of the probed directories
+    _cache = ResolvedPathCache()
+
     @inject
     def __init__(self, filename: str, path_factory: PathFactory):
         self.path_factory = path_factory
         self.filename = filename
-
-        self.search_paths = [
-            PathNormalizer(os.path.join(os.getcwd(), "config")).normalize(),  # Default config directory
-            PathNormalizer(os.path.join(os.getcwd(), "config/multipass")).normalize(),
-            PathNormalizer(os.path.join(os.getcwd(), "config/docker")).normalize(),
-            PathNormalizer(os.path.join(os.getcwd(), "config/network")).normalize(),
-            PathNormalizer(os.getcwd()).normalize()  # Root working directory
+        self.cwd = os.getcwd()
+        self.search_paths = FileLocator._cache.search_paths(self.cwd, FileLocator._build_search_paths)
+
+    @staticmethod
+    def _build_search_paths(cwd: str) -> List[str]:
+        search_paths = [
+            PathNormalizer(os.path.join(cwd, "config")).normalize(),  # Default config directory
+            PathNormalizer(os.path.join(cwd, "config/multipass")).normalize(),
+            PathNormalizer(os.path.join(cwd, "config/docker")).normalize(),
+            PathNormalizer(os.path.join(cwd, "config/network")).normalize(),
+            PathNormalizer(cwd).normalize()  # Root working directory
         ]
 
-        self.search_paths.insert(1, PathNormalizer(os.path.dirname(os.path.abspath(__file__))).normalize())
+        search_paths.insert(1, PathNormalizer(os.path.dirname(os.path.abspath(__file__))).normalize())
+        return search_paths
 
+    @classmethod
+    def invalidate(cls, filename: Optional[str] = None):
+        """Forgets where the file, or every file if no name is given, was found."""
+        cls._cache.invalidate(filename)
 
     def get_existing_file_path(self) -> str:
         """
@@ -37,11 +52,9 @@ class FileLocator:
         Raises:
             FileNotFoundError: If the file is not found.
         """
-        for directory in self.search_paths:
-            file_path = Path(directory) / self.filename
-
-            if file_path.is_file():
-                return str(file_path)
+        file_path = FileLocator._cache.resolve(self.cwd, self.filename, self.search_paths)
+        if file_path is not None:
+            return file_path
 
         raise FileNotFoundError(f"File '{self.filename}' not found in expected paths: {self.search_paths}")
 
@@ -87,5 +100,6 @@ class FileLocator:
 
         if not final_path.exists():
             final_path.touch()  # Creates an empty file
+            FileLocator.invalidate(self.filename)
 
         return str(final_path)
@@ -45,6 +45,18 @@ class FileManager(PortFileManager):
         file_loader = self.loader(path)
         return file_loader.load()
 
+    def locate(self, path: Path) -> Path:
+        """
+        Resolves the file name to the absolute path of the existing file.
+
+        Args:
+            path (Path): The file path.
+
+        Returns:
+            Path: The absolute path of the file.
+        """
+        return self.loader(path).path
+
     def save(self, path: Path, data: Any) -> None:
         """
         Saves data to the specified file using the saver.
@@ -81,6 +93,7 @@ class FileManager(PortFileManager):
             file_path = Path(path)
             if file_path.exists():
                 file_path.unlink()
+                FileLocator.invalidate(file_path.name)
                 return True
             return False
         except Exception as e:
@@ -0,0 +1,60 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (st_mtime_ns, st_ino, st_size) of a file when it was parsed
+Fingerprint = Tuple[int, int, int]
+
+
+class ParsedFileCache:
+    """
+    Keeps the parsed content of files in memory. An entry is reused as long as modification time, inode and size
+    of the file are unchanged, so edits and atomic replacements of the file are picked up on the next access.
+    The cached values are shared by all callers and must not be modified.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Fingerprint, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(path: Path) -> Fingerprint:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+    def get(self, path: Path, parse: Callable[[Path], T]) -> T:
+        """
+        Returns the parsed content of the file, parsing it only if it is not cached or has changed.
+
+        :param path: Path of the file.
+        :param parse: Parses the file at the given path.
+        """
+        path = Path(path).resolve()
+        fingerprint = self.fingerprint(path)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        value = parse(path)
+        with self._lock:
+            self._entries[path] = (fingerprint, value)
+        return value
+
+    def put(self, path: Path, value: Any):
+        """Stores the value for the current state of the file, e.g. after the owner of the value wrote it."""
+        path = Path(path).resolve()
+        fingerprint = self.fingerprint(path)
+        with self._lock:
+            self._entries[path] = (fingerprint, value)
+
+    def invalidate(self, path: Optional[Path] = None):
+        """Drops the entry of the file, or all entries if no path is given."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).resolve(), None)
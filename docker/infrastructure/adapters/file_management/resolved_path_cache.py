@@ -0,0 +1,83 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# (directory, st_mtime_ns) of the directories probed for a file, -1 for a missing directory
+DirectoryFingerprint = Tuple[Tuple[str, int], ...]
+
+
+class ResolvedPathCache:
+    """
+    Remembers where a file name was found in the search directories, per working directory.
+    An entry stays valid while the directories probed up to the hit are unchanged: creating, deleting or renaming
+    a file changes the modification time of its directory, so a file shadowing the hit or the removal of the hit
+    is noticed. Editing a file does not change the resolution and costs no lookup.
+    Files found in the first search directory are validated with a single stat.
+    """
+
+    def __init__(self):
+        self._search_paths: Dict[str, List[str]] = {}
+        self._entries: Dict[Tuple[str, str], Tuple[str, DirectoryFingerprint]] = {}
+        self._lock = threading.Lock()
+
+    def search_paths(self, cwd: str, build: Callable[[str], List[str]]) -> List[str]:
+        """
+        Returns the normalized search directories of the working directory, building them only once.
+
+        :param build: Creates the search directories for a working directory.
+        """
+        with self._lock:
+            paths = self._search_paths.get(cwd)
+        if paths is None:
+            paths = build(cwd)
+            with self._lock:
+                self._search_paths[cwd] = paths
+        return paths
+
+    @staticmethod
+    def _mtime(directory: str) -> int:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return -1
+
+    def _unchanged(self, fingerprint: DirectoryFingerprint) -> bool:
+        return all(self._mtime(directory) == mtime for directory, mtime in fingerprint)
+
+    def resolve(self, cwd: str, filename: str, search_paths: List[str]) -> Optional[str]:
+        """
+        Returns the path of the file in the first search directory containing it, None if none does.
+        Misses are not cached, a file created later is found on the next lookup.
+        """
+        key = (cwd, filename)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._unchanged(entry[1]):
+            return entry[0]
+
+        fingerprint = []
+        for directory in search_paths:
+            file_path = Path(directory) / filename
+            parent = str(file_path.parent)
+            # Taken before the probe, a file created in between invalidates the entry instead of being missed
+            fingerprint.append((parent, self._mtime(parent)))
+            if file_path.is_file():
+                with self._lock:
+                    self._entries[key] = (str(file_path), tuple(fingerprint))
+                return str(file_path)
+        return None
+
+    def invalidate(self, filename: Optional[str] = None):
+        """
+        Drops the entries of the file name in all working directories, or all entries if no name is given.
+        Called when the process creates or deletes a file, the directory time may not have changed on file systems
+        with coarse timestamps.
+        """
+        with self._lock:
+            if filename is None:
+                self._entries.clear()
+                self._search_paths.clear()
+            else:
+                for key in [key for key in self._entries if key[1] == filename]:
+                    del self._entries[key]
@@ -0,0 +1,31 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:  # psutil is optional, sysconf covers Linux
+    psutil = None
+
+
+class HostResources:
+    """Reads the free memory and disk of the host the VMs are launched on."""
+
+    @staticmethod
+    def available_memory() -> Optional[int]:
+        """Free memory in bytes, None if it cannot be determined on this platform."""
+        if psutil is not None:
+            return psutil.virtual_memory().available
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return None
+
+    @staticmethod
+    def available_disk(path: Path = Path.home()) -> Optional[int]:
+        """Free disk in bytes on the file system of the path, None if it cannot be determined."""
+        try:
+            return shutil.disk_usage(path).free
+        except OSError:
+            return None
@@ -0,0 +1,27 @@
+from application.ports.readiness.port_readiness_probe import PortReadinessProbe
+from domain.command.command_runner_type_enum import CommandRunnerType
+from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+
+# Seconds a single attempt may take
+PROBE_TIMEOUT = 15
+
+
+class CommandProbe(PortReadinessProbe):
+    """Ready when the shell command exits with 0."""
+
+    def __init__(self, name: str, command: str, timeout: int = PROBE_TIMEOUT):
+        self._name = name
+        self.command = command
+        self.timeout = timeout
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def check(self) -> bool:
+        try:
+            await CommandRunnerFactory().get_runner(CommandRunnerType.ASYNC).run(self.command, timeout=self.timeout)
+        except CommandExecutionError:
+            return False
+        return True
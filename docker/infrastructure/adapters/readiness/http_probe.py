@@ -0,0 +1,41 @@
+import asyncio
+import urllib.error
+import urllib.request
+from typing import Optional
+
+from application.ports.readiness.port_readiness_probe import PortReadinessProbe
+
+# Seconds a single request may take
+REQUEST_TIMEOUT = 5
+
+
+class HttpProbe(PortReadinessProbe):
+    """Ready when the URL answers with the expected status and, if given, a body containing the expected text."""
+
+    def __init__(self, url: str, expected_status: int = 200, contains: Optional[str] = None,
+                 timeout: float = REQUEST_TIMEOUT):
+        self.url = url
+        self.expected_status = expected_status
+        self.contains = contains
+        self.timeout = timeout
+        # Endpoints of the cluster are reached directly, never through a proxy of the environment
+        self.opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    @property
+    def name(self) -> str:
+        return f"HTTP {self.expected_status} from {self.url}"
+
+    async def check(self) -> bool:
+        return await asyncio.to_thread(self._request)
+
+    def _request(self) -> bool:
+        try:
+            with self.opener.open(self.url, timeout=self.timeout) as response:
+                status, body = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, body = e.code, b""
+        except (urllib.error.URLError, OSError):
+            return False
+        if status != self.expected_status:
+            return False
+        return self.contains is None or self.contains in body.decode("utf-8", errors="replace")
@@ -0,0 +1,44 @@
+from typing import List
+
+from application.ports.readiness.port_readiness_probe import PortReadinessProbe
+from infrastructure.adapters.readiness.command_probe import CommandProbe
+
+
+class VmProbes:
+    """Probes of a multipass VM, `multipass exec` only succeeds once the VM accepts SSH connections."""
+
+    @staticmethod
+    def ssh_reachable(vm_instance: str) -> PortReadinessProbe:
+        return CommandProbe(f"SSH on {vm_instance}", f"multipass exec {vm_instance} -- true")
+
+    @staticmethod
+    def systemd_unit_active(vm_instance: str, unit: str) -> PortReadinessProbe:
+        return CommandProbe(f"{unit} on {vm_instance}",
+                            f"multipass exec {vm_instance} -- systemctl is-active --quiet {unit}")
+
+    @staticmethod
+    def docker_socket_up(vm_instance: str) -> PortReadinessProbe:
+        return CommandProbe(f"docker socket on {vm_instance}", f"multipass exec {vm_instance} -- sudo docker info")
+
+    @staticmethod
+    def registry_mirror_loaded(vm_instance: str, registry_mirror: str) -> PortReadinessProbe:
+        """The docker daemon runs with the registry mirror, daemon.json is only read when docker starts."""
+        return CommandProbe(f"registry mirror on {vm_instance}",
+                            f"multipass exec {vm_instance} -- sh -c \"sudo docker info "
+                            f"--format '{{{{.RegistryConfig.Mirrors}}}}' | grep -q {registry_mirror}\"")
+
+    @staticmethod
+    def reachable(vm_instance: str) -> List[PortReadinessProbe]:
+        """The VM is up after a restart."""
+        return [VmProbes.ssh_reachable(vm_instance)]
+
+    @staticmethod
+    def docker_ready(vm_instance: str) -> List[PortReadinessProbe]:
+        """The VM is up and its docker daemon answers."""
+        return [VmProbes.ssh_reachable(vm_instance), VmProbes.systemd_unit_active(vm_instance, "docker"),
+                VmProbes.docker_socket_up(vm_instance)]
+
+    @staticmethod
+    def docker_ready_with_mirror(vm_instance: str, registry_mirror: str) -> List[PortReadinessProbe]:
+        """The VM is up, its docker daemon answers and uses the registry mirror."""
+        return VmProbes.docker_ready(vm_instance) + [VmProbes.registry_mirror_loaded(vm_instance, registry_mirror)]
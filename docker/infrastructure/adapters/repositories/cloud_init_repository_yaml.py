@@ -0,0 +1,85 @@
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ruamel.yaml import YAML
+
+from domain.cache.package_cache import PackageCache
+from domain.network.network import Network
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.adapters.repositories.netplan_repository import PortNetplanRepositoryYaml
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.logging.logger_factory import LoggerFactory
+
+TEMPLATE_PATH = "cloud_init_template.yaml"
+# cloud-init only reads user-data starting with this line
+CLOUD_CONFIG_HEADER = "#cloud-config\n"
+NETPLAN_PATH = "/etc/netplan/60-tiny-swarm-world.yaml"
+DAEMON_CONFIG_PATH = "/etc/docker/daemon.json"
+
+
+class PortCloudInitRepositoryYaml:
+    """
+    Renders the cloud-init user-data of a VM from the base template, its netplan configuration and the package
+    caches, and saves it next to the other generated configuration files.
+    """
+
+    def __init__(self, template: str = TEMPLATE_PATH):
+        """
+        :param template: The name of the YAML file with the user-data shared by all VMs.
+        """
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self.file_manager = infra_core_container.resolve(FileManager)
+        self.template = template
+        self.yaml = YAML(typ="safe")
+        self.yaml.default_flow_style = False
+        # Long apt source lines stay on one line
+        self.yaml.width = 4096
+
+    @staticmethod
+    def file_name(vm_instance: str) -> str:
+        """Name of the user-data file of the VM, see command_multipass_cloud_init_launch_yaml.yaml."""
+        return f"cloud-init-user-data-{vm_instance}.yaml"
+
+    def create(self, network: Optional[Network] = None, cache: Optional[PackageCache] = None) -> Dict[str, Any]:
+        """
+        Creates the user-data of one VM.
+
+        :param network: Static network configuration, DHCP if None.
+        :param cache: Package caches the VM downloads through, the upstream sources if None.
+        """
+        user_data = self.yaml.load(self.file_manager.load(path=Path(self.template))) or {}
+        write_files = user_data.setdefault("write_files", [])
+        run_first = []
+
+        if network is not None:
+            netplan = PortNetplanRepositoryYaml()
+            netplan.create(network)
+            write_files.append({"path": NETPLAN_PATH, "permissions": "0600", "content": netplan.builder.to_yaml()})
+            run_first.append("netplan apply")
+
+        if cache is not None:
+            user_data.setdefault("apt", {})["proxy"] = cache.apt_proxy
+            for source in user_data["apt"].get("sources", {}).values():
+                if "source" in source:
+                    source["source"] = cache.rewrite(source["source"])
+            # Written before the packages are installed, so docker starts with the mirror
+            daemon_config = {"registry-mirrors": [cache.registry_mirror], "insecure-registries": [cache.registry_host]}
+            write_files.append({"path": DAEMON_CONFIG_PATH, "content": json.dumps(daemon_config, indent=2)})
+
+        user_data["runcmd"] = run_first + list(user_data.get("runcmd") or [])
+        if not write_files:
+            del user_data["write_files"]
+        return user_data
+
+    def to_yaml(self, user_data: Dict[str, Any]) -> str:
+        stream = io.StringIO()
+        self.yaml.dump(user_data, stream)
+        return CLOUD_CONFIG_HEADER + stream.getvalue()
+
+    def save(self, vm_instance: str, user_data: Dict[str, Any]) -> None:
+        """Saves the user-data of the VM."""
+        file_name = self.file_name(vm_instance)
+        self.file_manager.save(path=Path(file_name), data=self.to_yaml(user_data))
+        self.logger.info(f"cloud-init user-data saved: {file_name}")
@@ -1,11 +1,12 @@
+import hashlib
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from ruamel.yaml import YAML
 
 from application.ports.repositories.port_command_repository import PortCommandRepository
 
-from domain.command.command_entity import CommandEntity
+from domain.command.command_entity import DEFAULT_TIMEOUT, CommandEntity
 from infrastructure.adapters.file_management.file_manager import FileManager
 from infrastructure.adapters.yaml.yaml_builder import FluentYAMLBuilder
 from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
@@ -23,9 +24,26 @@ class PortCommandRepositoryYaml(PortCommandRepository):
         """
         self.logger = LoggerFactory.get_logger(self.__class__)
         self.file_manager = infra_core_container.resolve(FileManager)
-        self.yaml_builder = FluentYAMLBuilder()
+        self.filename = filename
         self.yaml = YAML()
-        self.data = self.yaml_builder.load_from_string(yaml_content=self.file_manager.load(path=Path(filename))).build()
+        self._data: Optional[dict] = None
+
+    @property
+    def name(self) -> str:
+        return self.filename
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the YAML file as stored, without parsing it."""
+        return hashlib.sha256(self.file_manager.locate(Path(self.filename)).read_bytes()).hexdigest()
+
+    @property
+    def data(self) -> dict:
+        """The parsed YAML file, read on first use so planned commands never parse it."""
+        if self._data is None:
+            yaml_content = self.file_manager.load(path=Path(self.filename))
+            self._data = FluentYAMLBuilder().load_from_string(yaml_content=yaml_content).build()
+        return self._data
 
     def get_all_commands(self) -> Dict[int, CommandEntity]:
         """
@@ -43,6 +61,8 @@ class PortCommandRepositoryYaml(PortCommandRepository):
                 command=command["command"],
                 runner=command["runner"],
                 command_type=command["command_type"],
-                vm_type=command["vm_type"]
+                vm_type=command["vm_type"],
+                check=command.get("check"),
+                timeout=command.get("timeout", DEFAULT_TIMEOUT)
             )
         return task_dict
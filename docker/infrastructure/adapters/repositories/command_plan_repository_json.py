@@ -0,0 +1,63 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from domain.command.command_plan.command_plan import PLAN_FORMAT, CommandPlan
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.logging.logger_factory import LoggerFactory
+
+PLAN_PATH = "command_plan.json"
+VM_REPOSITORY_PATH = "vms_repository.yaml"
+COMMAND_FILE_PATTERN = "command_*.yaml"
+
+
+class PortCommandPlanRepositoryJson:
+    """
+    Stores the compiled CommandPlan as JSON and fingerprints the YAML files it is compiled from.
+    """
+
+    def __init__(self, filename: str = PLAN_PATH, config_dir: Optional[Path] = None):
+        """
+        :param filename: The name of the JSON file.
+        :param config_dir: Directory searched for command YAML files, config/ of the working directory by default.
+        """
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self.file_manager = infra_core_container.resolve(FileManager)
+        self.filename = filename
+        self.config_dir = config_dir or Path(os.getcwd()) / "config"
+
+    def command_files(self) -> List[Path]:
+        """Returns all command YAML files of the configuration, sorted by name."""
+        return sorted(self.config_dir.rglob(COMMAND_FILE_PATTERN), key=lambda path: path.name)
+
+    def input_hash(self) -> str:
+        """
+        Hashes the content of the command YAML files and the VM repository, without parsing them.
+        """
+        digest = hashlib.sha256(f"plan-format:{PLAN_FORMAT}".encode("utf-8"))
+        for path in self.command_files() + [self.file_manager.locate(Path(VM_REPOSITORY_PATH))]:
+            digest.update(b"\0" + path.name.encode("utf-8") + b"\0")
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def save(self, plan: CommandPlan) -> None:
+        """Saves the plan as compact JSON."""
+        self.file_manager.save(path=Path(self.filename), data=plan.model_dump_json())
+
+    def load(self) -> Optional[CommandPlan]:
+        """Returns the stored plan, None if there is none or it cannot be read."""
+        try:
+            content = self.file_manager.load(path=Path(self.filename))
+        except FileNotFoundError:
+            return None
+        if not content.strip():
+            return None
+        try:
+            return CommandPlan.model_validate_json(content)
+        except ValidationError as e:
+            self.logger.warning(f"Ignoring unreadable command plan {self.filename}: {e}")
+            return None
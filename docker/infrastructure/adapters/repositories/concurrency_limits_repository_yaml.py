@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from ruamel.yaml import YAML
+
+from domain.command.command_executer.concurrency_limiter import ConcurrencyLimiter
+from domain.command.command_executer.concurrency_limits import ConcurrencyLimits
+from domain.multipass.vm_size import parse_size
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.adapters.host.host_resources import HostResources
+from infrastructure.adapters.repositories.vm_repository_yaml import PortVmRepositoryYaml
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.logging.logger_factory import LoggerFactory
+
+CONFIG_PATH = "concurrency_limits.yaml"
+
+
+class PortConcurrencyLimitsRepositoryYaml:
+    """
+    Loads the concurrency limits of the command execution from a YAML file.
+    """
+
+    def __init__(self, filename: str = CONFIG_PATH):
+        """
+        :param filename: The name of the YAML file.
+        """
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self.file_manager = infra_core_container.resolve(FileManager)
+        self.filename = filename
+        self.yaml = YAML(typ="safe")
+
+    def get_limits(self) -> ConcurrencyLimits:
+        """
+        Returns the configured limits, unlimited if the file does not exist.
+        """
+        try:
+            content = self.file_manager.load(path=Path(self.filename))
+        except FileNotFoundError:
+            self.logger.warning(f"No concurrency limits found in {self.filename}, commands run unbounded.")
+            return ConcurrencyLimits()
+        # Plain mapping, the limits are read only and nested one level deeper than the builder supports
+        data = self.yaml.load(content) or {}
+        return ConcurrencyLimits(**(data.get("concurrency") or {}))
+
+    def get_limiter(self) -> ConcurrencyLimiter:
+        """
+        Creates the limiter for the configured limits. With the resource budget enabled the free host memory and
+        disk, minus the configured reserve, bound the VMs launching at the same time.
+        """
+        limits = self.get_limits()
+        if not limits.resource_budget:
+            return ConcurrencyLimiter(limits)
+
+        vms = {vm.vm_instance: vm for vm in PortVmRepositoryYaml().get_all_vms()}
+        memory = HostResources.available_memory()
+        disk = HostResources.available_disk()
+        memory_capacity = max(memory - parse_size(limits.memory_reserve), 1) if memory is not None else None
+        disk_capacity = max(disk - parse_size(limits.disk_reserve), 1) if disk is not None else None
+        self.logger.info(f"Resource budget for launches: memory={memory_capacity} disk={disk_capacity} bytes")
+        return ConcurrencyLimiter(limits, vms=vms, memory_capacity=memory_capacity, disk_capacity=disk_capacity)
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from ruamel.yaml import YAML
+
+from domain.cache.package_cache import PackageCache
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.logging.logger_factory import LoggerFactory
+
+CONFIG_PATH = "package_cache.yaml"
+
+
+class PortPackageCacheRepositoryYaml:
+    """
+    Loads the configuration of the package caches from a YAML file, the caches run on the manager.
+    The host is left empty, MultipassPackageCache sets it to the address the manager got.
+    """
+
+    def __init__(self, filename: str = CONFIG_PATH):
+        """
+        :param filename: The name of the YAML file.
+        """
+        self.logger = LoggerFactory.get_logger(self.__class__)
+        self.file_manager = infra_core_container.resolve(FileManager)
+        self.filename = filename
+        self.yaml = YAML(typ="safe")
+
+    def get_cache(self) -> PackageCache:
+        """
+        Returns the configured caches, the defaults if the file does not exist.
+        """
+        try:
+            data = self.yaml.load(self.file_manager.load(path=Path(self.filename))) or {}
+        except FileNotFoundError:
+            self.logger.warning(f"No package cache configuration found in {self.filename}, using the defaults.")
+            data = {}
+        return PackageCache(**(data.get("cache") or {}))
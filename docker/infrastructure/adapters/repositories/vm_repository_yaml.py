@@ -3,7 +3,9 @@ from typing import List, Optional
 
 from ruamel.yaml import YAML
 
+from domain.multipass.vm_inventory import VmInventory
 from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.adapters.file_management.parsed_file_cache import ParsedFileCache
 from infrastructure.adapters.yaml.yaml_builder import FluentYAMLBuilder
 from domain.multipass.vm_entity import VmEntity
 from domain.multipass.vm_type import VmType
@@ -13,14 +15,44 @@ from infrastructure.dependency_injection.infra_core_di_container import infra_co
 CONFIG_PATH = "vms_repository.yaml"
 
 class PortVmRepositoryYaml(PortVmRepository):
-    """YAML-based VM repository using FluentYAMLBuilder."""
+    """
+    YAML-based VM repository. Readers share one parsed VmInventory per file, which is parsed again only when
+    the file changes. Lookups by name and type use the indexes of the inventory.
+    The FluentYAMLBuilder is only created for modifications.
+    """
+
+    # Parsed inventories of all repository instances, validated against the file on every access
+    _cache = ParsedFileCache()
 
     def __init__(self ):
         self.config_path = Path(CONFIG_PATH)
         self.file_manager = infra_core_container.resolve(FileManager)
-        self.yaml_builder = FluentYAMLBuilder()
-        self.yaml = YAML()
-        self.loaded_data = self.yaml_builder.load_from_string(self.file_manager.load(self.config_path)).build()
+        self.yaml = YAML(typ="safe")
+        self._file_path: Optional[Path] = None
+        self._yaml_builder: Optional[FluentYAMLBuilder] = None
+
+    @property
+    def file_path(self) -> Path:
+        """Absolute path of the YAML file, located on first use."""
+        if self._file_path is None:
+            self._file_path = self.file_manager.locate(self.config_path)
+        return self._file_path
+
+    @property
+    def inventory(self) -> VmInventory:
+        """The parsed VMs, shared with all other instances reading the same file."""
+        return self._cache.get(self.file_path, self._parse)
+
+    def _parse(self, path: Path) -> VmInventory:
+        data = self.yaml.load(self.file_manager.load(path)) or {}
+        return VmInventory(vms=tuple(VmEntity(**vm) for vm in data.get("vms") or []))
+
+    @property
+    def yaml_builder(self) -> FluentYAMLBuilder:
+        """Editable tree of the YAML file, loaded on the first modification."""
+        if self._yaml_builder is None:
+            self._yaml_builder = FluentYAMLBuilder().load_from_string(self.file_manager.load(self.config_path))
+        return self._yaml_builder
 
     def save(self) -> None:
         """Saves the YAML configuration file."""
@@ -28,42 +60,40 @@ class PortVmRepositoryYaml(PortVmRepository):
             self.file_manager.save(path=self.config_path,data=self.yaml_builder.to_yaml())
         except Exception as e:
             raise Exception(f"Error saving YAML file: {str(e)}")
+        finally:
+            self._cache.invalidate(self.file_path)
 
     def get_all_vms(self) -> List[VmEntity]:
         """Retrieves all VMs as VmEntity objects."""
-        return [VmEntity(**vm) for vm in self.loaded_data.get("vms", [])]
+        return list(self.inventory.vms)
 
     def get_vm_by_name(self, vm_instance: str) -> Optional[VmEntity]:
         """Finds a VM by its name."""
-        for vm in self.get_all_vms():
-            if vm.vm_instance == vm_instance:
-                return vm
-        return None
+        return self.inventory.get(vm_instance)
+
+    def _store(self, inventory: VmInventory) -> None:
+        """Writes the inventory to the YAML file and keeps it as the cached inventory."""
+        self.yaml_builder.root.value = [vm.model_dump(mode="json") for vm in inventory.vms]
+        self.save()
+        self._cache.put(self.file_path, inventory)
 
     def add_vm(self, vm: VmEntity) -> None:
         """Adds a new VM to the YAML configuration."""
-        (self.yaml_builder
-         .navigate_to(["vms"])
-         .current.add_child(vm.model_dump()))
-        self.save()
+        if self.inventory.get(vm.vm_instance) is not None:
+            raise ValueError(f"VM {vm.vm_instance} already exists.")
+        self._store(self.inventory.with_vm(vm))
 
     def remove_vm(self, name: str) -> None:
         """Deletes a VM by name."""
-        all_vms = self.get_all_vms()
-        for vm in all_vms:
-            if vm.vm_instance == name:
-                try:
-                    self.yaml_builder.navigate_to(["vms", "vm_instance", str(vm.vm_instance)]).delete_current()
-                    self.save()
-                    return
-                except KeyError:
-                    raise ValueError(f"VM {name} not found.")
-        raise ValueError(f"VM {name} not found.")
+        if self.inventory.get(name) is None:
+            raise ValueError(f"VM {name} not found.")
+        self._store(self.inventory.without_vm(name))
 
     def update_vm(self, vm: VmEntity) -> None:
         """Updates an existing VM."""
-        self.remove_vm(vm.vm_instance)
-        self.add_vm(vm)
+        if self.inventory.get(vm.vm_instance) is None:
+            raise ValueError(f"VM {vm.vm_instance} not found.")
+        self._store(self.inventory.with_vm(vm))
 
     def find_all_vms(self) -> List[VmEntity]:
         """Retrieves all VMs from the YAML file."""
@@ -80,10 +110,5 @@ class PortVmRepositoryYaml(PortVmRepository):
             :rtype List[str]: List of all VM names that belong to these types.
         """
 
-        # Filter and return matching vm_instance names
-        return [
-            vm.get("vm_instance")
-            for vm in self.loaded_data.get("vms", [])
-            if vm.get("vm_type") == vm_type.value and vm.get("vm_instance") is not None
-        ]
+        return list(self.inventory.names_of_type(vm_type))
 
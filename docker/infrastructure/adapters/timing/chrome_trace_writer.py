@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.logging.logger_factory import LoggerFactory
+
+TRACE_PATH = "logs/tiny_swarm_world_trace.json"
+PROCESS_ID = 1
+
+
+class ChromeTraceWriter:
+    """
+    Exports the recorded timings in the Chrome trace event format, to be opened in Perfetto (ui.perfetto.dev)
+    or chrome://tracing. Every VM is a thread, its stages contain its commands.
+    """
+
+    def __init__(self, recorder: TimingRecorder):
+        self.recorder = recorder
+        self.logger = LoggerFactory.get_logger(self.__class__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self.recorder.lock:
+            commands = list(self.recorder.commands)
+            stages = list(self.recorder.stages)
+
+        starts = [command.queued for command in commands] + [stage.started for stage in stages]
+        origin = min(starts, default=0.0)
+
+        def micros(seconds: float) -> float:
+            return round((seconds - origin) * 1_000_000, 1)
+
+        vms = sorted({command.vm_instance for command in commands} | {stage.vm_instance for stage in stages})
+        threads = {vm: thread_id for thread_id, vm in enumerate(vms, start=1)}
+        events: List[Dict[str, Any]] = [{"name": "process_name", "ph": "M", "pid": PROCESS_ID,
+                                         "args": {"name": "tiny_swarm_world"}}]
+        events += [{"name": "thread_name", "ph": "M", "pid": PROCESS_ID, "tid": thread_id, "args": {"name": vm}}
+                   for vm, thread_id in threads.items()]
+
+        for stage in stages:
+            events.append({"name": stage.stage, "cat": "stage", "ph": "X", "pid": PROCESS_ID,
+                           "tid": threads[stage.vm_instance], "ts": micros(stage.started),
+                           "dur": micros(stage.ended) - micros(stage.started),
+                           "args": {"key": stage.key, "depends_on": stage.depends_on, "failed": stage.failed}})
+        for command in commands:
+            spawn_latency = command.spawn_latency
+            events.append({"name": command.description or command.command, "cat": "command", "ph": "X",
+                           "pid": PROCESS_ID, "tid": threads[command.vm_instance], "ts": micros(command.started),
+                           "dur": micros(command.ended) - micros(command.started),
+                           "args": {"command": command.command, "stage": command.stage,
+                                    "exit_code": command.exit_code, "output_bytes": command.output_bytes,
+                                    "skipped": command.skipped, "wait_ms": round(command.wait * 1000, 3),
+                                    "spawn_latency_ms": round(spawn_latency * 1000, 3)
+                                    if spawn_latency is not None else None}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str = TRACE_PATH) -> Path:
+        """Writes the trace to the path and returns it."""
+        trace_path = Path(path)
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        self.logger.info(f"Chrome trace written: {trace_path}")
+        return trace_path
@@ -1,27 +1,46 @@
 import asyncio
-from typing import Dict
+from typing import Dict, Optional
 
+from application.ports.ui.port_ui import PortUI
 from domain.command.command_executer.command_executer import CommandExecuter
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from infrastructure.adapters.exceptions.exception_command_retry import CommandRetriesExhaustedError
 from infrastructure.adapters.ui.command_runner_ui import CommandRunnerUi
 from infrastructure.logging.logger_factory import LoggerFactory
 from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.adapters.ui.ui_session import UiSession
 
 class AsyncCommandRunnerUI(CommandRunnerUi):
     """
     Handles the UI initialization and asynchronous execution of commands.
     """
 
-    def __init__(self, command_list: Dict[str, Dict[int, ExecutableCommandEntity]]):
+    def __init__(self, command_list: Dict[str, Dict[int, ExecutableCommandEntity]], ui: Optional[PortUI] = None,
+                 max_parallel: Optional[int] = None, attempts: int = 1, retry_delay: float = 2.0,
+                 stage: Optional[str] = None):
         """
         Initializes the UI and command execution logic.
 
         :param command_list: Dictionary mapping instances to their respective command entities.
+        :param ui: Already running UI to report to, the UI of the open UiSession if None. The caller owns its
+                   lifecycle, only without both the runner starts a UI of its own.
+        :param max_parallel: Maximum number of VMs executing at the same time, unbounded if None.
+        :param attempts: Executions of the command list of a VM until all its commands succeed. With more than one
+                         attempt the command lists must be safe to repeat, and a VM failing in every attempt raises
+                         CommandRetriesExhaustedError into the results.
+        :param retry_delay: Seconds before the first retry, doubled for every further retry.
+        :param stage: Stage the UI shows for the instances while the commands run.
         """
 
         self.command_list = command_list
+        self.max_parallel = max_parallel
+        self.attempts = attempts
+        self.retry_delay = retry_delay
         self.instances = list(command_list.keys())
-        self.ui = FactoryUI().get_ui(instances=self.instances, test_mode=False)
+        self.stage = stage
+        ui = ui or UiSession.current()
+        self.owns_ui = ui is None
+        self.ui = ui or FactoryUI().get_ui(instances=self.instances, test_mode=False)
         self.command_execute = CommandExecuter(ui=self.ui)
         self.logger = LoggerFactory.get_logger(self.__class__)
         self.logger.info(f"CommandRunnerUI initialized {self.instances} instances")
@@ -31,13 +50,16 @@ class AsyncCommandRunnerUI(CommandRunnerUi):
         Runs the UI and executes commands asynchronously.
         """
         # Start the UI in a separate thread
-        self.logger.info("start ui")
-        self.ui.start_in_thread()
+        if self.owns_ui:
+            self.logger.info("start ui")
+            self.ui.start_in_thread()
+        self.ui.attach(self.instances, self.stage)
 
         try:
             # Starte die parallele Ausführung der Befehle für jede VM
+            semaphore = asyncio.Semaphore(self.max_parallel) if self.max_parallel else None
             tasks = {
-                vm: asyncio.create_task(self.command_execute.execute(self.command_list[vm]))
+                vm: asyncio.create_task(self._execute(vm, semaphore))
                 for vm in self.instances
             }
 
@@ -54,13 +76,41 @@ class AsyncCommandRunnerUI(CommandRunnerUi):
                     self.ui.update_status(task="completed", step="execution", result="success", instance=vm)
 
         finally:
-            # Aktualisiere die UI mit Abschlussstatus
-            self.ui.update_status(task="finished", step="execution", result="success", instance="all")
+            self.ui.detach(self.instances, self.stage)
+            if self.owns_ui:
+                # Aktualisiere die UI mit Abschlussstatus
+                self.ui.update_status(task="finished", step="execution", result="success", instance="all")
 
-            # Warte auf das Ende des UI-Threads
-            self.logger.info("Waiting for UI thread to close...")
-            await self.ui.ui_thread
+                # Beende die eigene UI und warte auf das Ende des UI-Threads
+                self.logger.info("Waiting for UI thread to close...")
+                self.ui.close()
+                await self.ui.ui_thread
 
             self.logger.info("Execution complete.")
 
-        return results
\ No newline at end of file
+        return results
+
+    async def _execute(self, vm: str, semaphore: Optional[asyncio.Semaphore]):
+        """Executes the command list of the VM, holding a slot of the semaphore, and retries failed executions."""
+        commands = self.command_list[vm]
+        for attempt in range(1, self.attempts + 1):
+            if semaphore is None:
+                result = await self.command_execute.execute(commands)
+            else:
+                async with semaphore:
+                    result = await self.command_execute.execute(commands)
+
+            if self.attempts == 1:
+                return result
+            failed_keys = CommandExecuter.failed_keys(commands, result)
+            if not failed_keys:
+                return result
+            if attempt == self.attempts:
+                raise CommandRetriesExhaustedError(vm_instance=vm, attempts=attempt, failed_keys=failed_keys)
+
+            delay = self.retry_delay * 2 ** (attempt - 1)
+            self.logger.warning(f"Commands {failed_keys} failed on {vm}, retry {attempt}/{self.attempts - 1} "
+                                f"in {delay}s")
+            self.ui.update_status(instance=vm, task=f"Retry {attempt}/{self.attempts - 1}",
+                                  step=f"Waiting {delay}s", result="Retrying")
+            await asyncio.sleep(delay)
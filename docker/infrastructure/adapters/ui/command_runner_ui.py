@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from domain.command.command_executer.command_executer import CommandExecuter
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from infrastructure.adapters.exceptions.exception_commands_failed import CommandsFailedError
 
 
 class CommandRunnerUi(ABC):
+    command_list: Dict[str, Dict[int, ExecutableCommandEntity]]
+    instances: List[str]
 
     @abstractmethod
     async def run(self):
@@ -9,3 +16,28 @@ class CommandRunnerUi(ABC):
         Runs the UI and executes commands asynchronously.
         """
         pass
+
+    def failures(self, results: list) -> Dict[str, List[int]]:
+        """
+        Returns the indexes of the failed commands per VM for the results of run.
+        A VM whose execution raised counts with the keys of the exception, respectively all its commands.
+        """
+        failures = {}
+        for vm, result in zip(self.instances, results):
+            if isinstance(result, BaseException):
+                failed_keys = getattr(result, "failed_keys", None) or list(self.command_list[vm])
+            else:
+                failed_keys = CommandExecuter.failed_keys(self.command_list[vm], result)
+            if failed_keys:
+                failures[vm] = failed_keys
+        return failures
+
+    def raise_for_failures(self, results: list):
+        """
+        Raises if a command of any VM failed, stage actions call it so the pipeline skips the dependent stages.
+
+        :raises CommandsFailedError: With the failed commands per VM.
+        """
+        failures = self.failures(results)
+        if failures:
+            raise CommandsFailedError(failures)
@@ -1,27 +1,35 @@
-import asyncio
-from typing import Dict
+from typing import Dict, Optional
 
+from application.ports.ui.port_ui import PortUI
 from domain.command.command_executer.command_executer import CommandExecuter
 from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
 from infrastructure.adapters.ui.command_runner_ui import CommandRunnerUi
 from infrastructure.logging.logger_factory import LoggerFactory
 from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.adapters.ui.ui_session import UiSession
 
 class SyncCommandRunnerUI(CommandRunnerUi):
     """
     Handles the UI initialization and asynchronous execution of commands.
     """
 
-    def __init__(self, command_list: Dict[str, Dict[int, ExecutableCommandEntity]]):
+    def __init__(self, command_list: Dict[str, Dict[int, ExecutableCommandEntity]], ui: Optional[PortUI] = None,
+                 stage: Optional[str] = None):
         """
         Initializes the UI and command execution logic.
 
         :param command_list: Dictionary mapping instances to their respective command entities.
+        :param ui: Already running UI to report to, the UI of the open UiSession if None. The caller owns its
+                   lifecycle, only without both the runner starts a UI of its own.
+        :param stage: Stage the UI shows for the instances while the commands run.
         """
 
         self.command_list = command_list
         self.instances = list(command_list.keys())
-        self.ui = FactoryUI().get_ui(instances=self.instances, test_mode=False)
+        self.stage = stage
+        ui = ui or UiSession.current()
+        self.owns_ui = ui is None
+        self.ui = ui or FactoryUI().get_ui(instances=self.instances, test_mode=False)
         self.command_execute = CommandExecuter(ui=self.ui)
         self.logger = LoggerFactory.get_logger(self.__class__)
         self.logger.info(f"CommandRunnerUI initialized {self.instances} instances")
@@ -31,8 +39,10 @@ class SyncCommandRunnerUI(CommandRunnerUi):
         Runs the UI and executes commands asynchronously.
         """
         # Start the UI in a separate thread
-        self.logger.info("start ui")
-        self.ui.start_in_thread()
+        if self.owns_ui:
+            self.logger.info("start ui")
+            self.ui.start_in_thread()
+        self.ui.attach(self.instances, self.stage)
 
         try:
             # Starte die parallele Ausführung der Befehle für jede VM
@@ -51,12 +61,15 @@ class SyncCommandRunnerUI(CommandRunnerUi):
                     self.ui.update_status(task="completed", step="execution", result="success", instance=vm)
 
         finally:
-            # Aktualisiere die UI mit Abschlussstatus
-            self.ui.update_status(task="finished", step="execution", result="success", instance="all")
+            self.ui.detach(self.instances, self.stage)
+            if self.owns_ui:
+                # Aktualisiere die UI mit Abschlussstatus
+                self.ui.update_status(task="finished", step="execution", result="success", instance="all")
 
-            # Warte auf das Ende des UI-Threads
-            self.logger.info("Waiting for UI thread to close...")
-            await self.ui.ui_thread
+                # Beende die eigene UI und warte auf das Ende des UI-Threads
+                self.logger.info("Waiting for UI thread to close...")
+                self.ui.close()
+                await self.ui.ui_thread
 
             self.logger.info("Execution complete.")
 
@@ -1,18 +1,38 @@
 import platform
+import sys
+from typing import Optional
 
 from application.ports.ui.port_ui import PortUI
+from infrastructure.adapters.ui.headless_ui import HeadlessUI
 from infrastructure.adapters.ui.linux_ui import LinuxUI
 from infrastructure.os_types import OsTypes
 from infrastructure.adapters.ui.windows_ui import WindowsUi
 
 
 class FactoryUI:
+    # None decides by the terminal: headless if stdout is no TTY, e.g. in CI runners
+    headless: Optional[bool] = None
+    # File the headless UI appends its JSON lines to, stdout if None
+    progress_file: Optional[str] = None
 
     def __init__(self):
         self.os_type = OsTypes.get_enum_from_value(platform.system())
 
+    @classmethod
+    def configure(cls, headless: Optional[bool] = None, progress_file: Optional[str] = None):
+        """Selects the UI of the process, see tiny_swarm_world --headless."""
+        FactoryUI.headless = headless
+        FactoryUI.progress_file = progress_file
+
+    def is_headless(self) -> bool:
+        if FactoryUI.headless is not None:
+            return FactoryUI.headless
+        return not sys.stdout.isatty()
+
     def get_ui(self, **kwargs) -> PortUI:
+        if self.is_headless():
+            return HeadlessUI(output=FactoryUI.progress_file, **kwargs)
         if self.os_type == OsTypes.WINDOWS:
             return WindowsUi(**kwargs)
         else :
-            return LinuxUI(**kwargs)
\ No newline at end of file
+            return LinuxUI(**kwargs)
@@ -0,0 +1,51 @@
+from typing import Dict, List, NamedTuple, Tuple
+
+Position = Tuple[int, int]
+
+
+class CellChange(NamedTuple):
+    """
+    :param row: Screen row of the cell
+    :param col: Screen column the cell starts at
+    :param text: New text of the cell
+    :param attr: curses attribute the text is drawn with
+    :param stale: Number of characters of the previous text behind the new one that must be blanked
+    """
+    row: int
+    col: int
+    text: str
+    attr: int
+    stale: int
+
+
+class FrameBuffer:
+    """
+    Remembers what is on the screen, so a frame only writes the cells whose text changed.
+    """
+
+    def __init__(self):
+        self.screen: Dict[Position, Tuple[str, int]] = {}
+
+    def diff(self, cells: Dict[Position, Tuple[str, int]]) -> List[CellChange]:
+        """
+        Returns the changes turning the screen into the given cells and takes them over as the new screen.
+
+        :param cells: Text and curses attribute per position of the cell.
+        """
+        changes = []
+        for (row, col), (text, attr) in cells.items():
+            previous = self.screen.get((row, col))
+            if previous == (text, attr):
+                continue
+            stale = max(0, len(previous[0]) - len(text)) if previous else 0
+            changes.append(CellChange(row, col, text, attr, stale))
+        # Cells no longer drawn, e.g. after fewer columns fit, are blanked
+        for (row, col), (text, _) in self.screen.items():
+            if (row, col) not in cells and text:
+                changes.append(CellChange(row, col, "", 0, len(text)))
+        self.screen = dict(cells)
+        return changes
+
+    def invalidate(self):
+        """Forgets the screen, e.g. after it was cleared on a resize, so the next frame draws every cell."""
+        self.screen = {}
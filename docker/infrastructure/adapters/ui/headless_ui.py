@@ -0,0 +1,92 @@
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, TextIO, Tuple
+
+from application.ports.ui.port_ui import PortUI
+from domain.command.command_executer.status_event import StatusEvent
+
+
+class HeadlessUI(PortUI):
+    """
+    Writes every status transition as one JSON line instead of drawing a terminal UI, for runs without a TTY
+    (CI runners) and for dashboards reading the timings. There is no render thread, events are written when
+    they are published.
+
+    Each line holds: event (status, stage-start or stage-end), stage, vm, task, step, result, timestamp (UTC ISO 8601),
+    monotonic (seconds) and duration_ms, the time the VM spent in its previous step, respectively in the stage
+    for stage-end. duration_ms is null for the first event of a VM.
+    """
+
+    def __init__(self, instances, test_mode=False, persistent=False, output: Optional[str] = None,
+                 stream: Optional[TextIO] = None):
+        """
+        :param output: File the events are appended to, stdout if None.
+        :param stream: Stream the events are written to, overrides output.
+        """
+        super().__init__(instances, test_mode, persistent)
+        self.owns_stream = stream is None and output is not None
+        self.stream = stream or (open(output, "a", encoding="utf-8", buffering=1) if output else sys.stdout)
+        self.write_lock = threading.Lock()
+        self.last_event: Dict[str, float] = {}
+        self.stage_started: Dict[str, Tuple[str, float]] = {}
+
+    def publish(self, event: StatusEvent):
+        """Applies the status transition and writes it, nothing is queued."""
+        if self.apply(event):
+            self._write(event)
+
+    def _write(self, event: StatusEvent):
+        with self.write_lock:
+            if self.stream.closed:
+                return
+            previous = self.last_event.get(event.instance)
+            self.last_event[event.instance] = event.timestamp
+            duration = event.timestamp - previous if previous is not None else None
+            status = self.status[event.instance]
+
+            if event.stage is None:
+                kind, stage = "status", self.stage_started.get(event.instance, ("", 0.0))[0]
+            elif event.stage:
+                kind, stage = "stage-start", event.stage
+                self.stage_started[event.instance] = (event.stage, event.timestamp)
+            else:
+                kind, (stage, started) = "stage-end", self.stage_started.pop(event.instance, ("", event.timestamp))
+                duration = event.timestamp - started
+
+            line = {
+                "event": kind,
+                "stage": stage,
+                "vm": event.instance,
+                "task": status["current_task"],
+                "step": status["current_step"],
+                "result": status["result"],
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "monotonic": event.timestamp,
+                "duration_ms": round(duration * 1000, 3) if duration is not None else None,
+            }
+            self.stream.write(json.dumps(line) + "\n")
+            self.stream.flush()
+
+    def start_in_thread(self):
+        """Nothing to render, the UI counts as finished for callers waiting on ui_thread."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        future = loop.create_future()
+        future.set_result(None)
+        self.ui_thread = future
+
+    def start(self):
+        """Nothing to render, the events are written when they are published."""
+        pass
+
+    def close(self):
+        self.closed.set()
+        if self.owns_stream:
+            with self.write_lock:
+                self.stream.close()
@@ -1,42 +1,41 @@
-
 import time
 import curses
+from typing import Dict, Tuple
+
 from application.ports.ui.port_ui import PortUI
+from infrastructure.adapters.ui.frame_buffer import FrameBuffer, Position
+
+# Seconds between two frames at most, bursts of status updates are coalesced into one frame
+FRAME_INTERVAL = 0.1
+# Seconds the renderer sleeps without status updates before it checks the terminal size again
+IDLE_TIMEOUT = 0.5
+
 
 class LinuxUI(PortUI):
-    def __init__(self, instances, test_mode=False):
+    def __init__(self, instances, test_mode=False, persistent=False):
         """test_mode: If True, the UI will exit after 2 seconds."""
-        super().__init__(instances, test_mode)
-
-    def update_status(self, instance, task, step, result=None):
-        """
-        Updates the status of an instance.
-        """
-        with self.lock:
-            if instance in self.status:
-                self.status[instance]["current_task"] = task
-                self.status[instance]["current_step"] = step
-                if result:
-                    self.status[instance]["result"] = result
+        super().__init__(instances, test_mode, persistent)
 
     def _draw_ui(self, stdscr):
         """
         Draws the UI using curses.
+        The renderer sleeps until a status changes and then only rewrites the cells whose text changed.
         """
         curses.curs_set(0)  # Hide cursor
         stdscr.nodelay(True)
         stdscr.timeout(500)
 
-        previous_status = {instance: {"current_task": "", "current_step": "", "result": ""} for instance in
-                           self.instances}
+        frame_buffer = FrameBuffer()
+        size = None
 
         while True:
+            frame_started = time.monotonic()
             height, width = stdscr.getmaxyx()
-
-            # Limiting the column width between 20 and 50 characters
-            col_width = max(20, min(width // len(self.instances), 50))
-
-            stdscr.clear()
+            if (height, width) != size:
+                # The old layout does not fit the new size, the next frame draws every cell
+                size = (height, width)
+                stdscr.clear()
+                frame_buffer.invalidate()
 
             # Check if the terminal is large enough
             if height < len(self.instances) + 5:
@@ -45,37 +44,23 @@ class LinuxUI(PortUI):
                 time.sleep(3)
                 return
 
-            # Print headers
-            for idx, instance in enumerate(self.instances):
-                stdscr.addstr(0, idx * col_width, instance.center(col_width), curses.A_BOLD)
-
-            changed = False
+            # Decided before the snapshot, so the last frame shows the final status
+            finished = self.is_finished()
             with self.lock:
-                for idx, instance in enumerate(self.instances):
-                    current_task = self.status[instance]["current_task"]
-                    current_step = self.status[instance]["current_step"]
-                    current_result = self.status[instance]["result"]
-
-                    if (previous_status[instance]["current_step"] != current_step or
-                            previous_status[instance]["result"] != current_result or
-                            previous_status[instance]["current_task"] != current_task):
-                        changed = True
-                        previous_status[instance]["current_task"] = current_task
-                        previous_status[instance]["current_step"] = current_step
-                        previous_status[instance]["result"] = current_result
-
-                    # Ensure content does not exceed column width
-                    stdscr.addstr(2, idx * col_width, f"Task: {current_task[:col_width - 7]}")
-                    stdscr.addstr(3, idx * col_width, f"Step: {current_step[:col_width - 7]}")
-                    stdscr.addstr(4, idx * col_width, f"Status: {current_result[:col_width - 7]}")
-
-            if changed:
-                stdscr.refresh()
+                snapshot = {instance: dict(self.status[instance], stage=self.stages.get(instance, ""))
+                            for instance in self.instances}
 
-            time.sleep(0.5)
+            changes = frame_buffer.diff(self._cells(snapshot, width))
+            for change in changes:
+                if change.attr == curses.A_NORMAL:
+                    stdscr.addstr(change.row, change.col, change.text)
+                else:
+                    stdscr.addstr(change.row, change.col, change.text, change.attr)
+                if change.stale:
+                    stdscr.addstr(change.row, change.col + len(change.text), " " * change.stale)
 
             # Handle successful completion of all instances
-            if all(self.status[instance]["result"] in ["Success", "Error"] for instance in self.instances):
+            if finished:
                 # Ensure "All instances completed" fits within the terminal
                 if len(self.instances) + 4 < height:
                     stdscr.addstr(len(self.instances) + 4, 0, "All instances completed".center(width)[:width],
@@ -88,10 +73,49 @@ class LinuxUI(PortUI):
                 if not self.test_mode:
                     time.sleep(2)
                     break
+            elif changes:
+                stdscr.refresh()
 
             if self.test_mode:
                 break
 
+            self._wait_for_next_frame(frame_started)
+
+    def _cells(self, snapshot: Dict[str, Dict[str, str]], width: int) -> Dict[Position, Tuple[str, int]]:
+        """Lays out the header and the status of each instance in its own column, cut at the terminal width."""
+        # Limiting the column width between 20 and 50 characters
+        col_width = max(20, min(width // len(snapshot), 50))
+        cells = {}
+        for idx, instance in enumerate(snapshot):
+            col = idx * col_width
+            if col >= width:
+                break
+            status = snapshot[instance]
+            # Ensure content does not exceed column width
+            column = {
+                0: (instance.center(col_width), curses.A_BOLD),
+                1: (f"Stage: {status['stage'][:col_width - 8]}", curses.A_NORMAL),
+                2: (f"Task: {status['current_task'][:col_width - 7]}", curses.A_NORMAL),
+                3: (f"Step: {status['current_step'][:col_width - 7]}", curses.A_NORMAL),
+                4: (f"Status: {status['result'][:col_width - 7]}", curses.A_NORMAL),
+            }
+            for row, (text, attr) in column.items():
+                # The last cell of the screen cannot be written by curses
+                cells[(row, col)] = (text[:width - col - 1], attr)
+        return cells
+
+    def _wait_for_next_frame(self, started: float):
+        """
+        Sleeps until a status changes, then lets further updates of the burst arrive until the frame interval
+        passed since the frame started, so streaming output costs at most one frame per interval.
+        """
+        if not self.wait_for_events(timeout=IDLE_TIMEOUT):
+            return
+        remaining = FRAME_INTERVAL - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+        self.drain_events()
+
     def start(self):
         """
         Runs the curses-based UI.
@@ -0,0 +1,36 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from application.ports.ui.port_ui import PortUI
+from infrastructure.logging.logger_factory import LoggerFactory
+
+
+class UiSession:
+    """
+    Keeps one UI open for a whole run. Command runners created without a UI attach to the open session
+    instead of starting and tearing down a terminal session of their own for every stage.
+    """
+
+    active: Optional[PortUI] = None
+
+    @classmethod
+    @asynccontextmanager
+    async def open(cls, ui: PortUI) -> AsyncIterator[PortUI]:
+        """Shows the UI while the context is open and makes it the one command runners attach to."""
+        logger = LoggerFactory.get_logger(cls)
+        previous = UiSession.active
+        ui.start_in_thread()
+        UiSession.active = ui
+        logger.info(f"UI session opened for {ui.instances}")
+        try:
+            yield ui
+        finally:
+            UiSession.active = previous
+            ui.close()
+            await ui.ui_thread
+            logger.info("UI session closed")
+
+    @classmethod
+    def current(cls) -> Optional[PortUI]:
+        """Returns the UI of the open session, None if no session is open."""
+        return UiSession.active
@@ -5,22 +5,9 @@ from application.ports.ui.port_ui import PortUI
 import time
 
 class WindowsUi(PortUI):
-    def __init__(self, instances, test_mode=False):
+    def __init__(self, instances, test_mode=False, persistent=False):
         """test_mode: If True, the UI will exit after 2 seconds."""
-        super().__init__(instances, test_mode)
-
-    def update_status(self, instance, task, step, result=None):
-        """
-        Updates the status of an instance.
-        """
-        with self.lock:
-            if instance in self.status:
-                self.status[instance]["current_task"] = task
-                self.status[instance]["current_step"] = step
-                if result:
-                    self.status[instance]["result"] = result
-
-
+        super().__init__(instances, test_mode, persistent)
 
     def _draw_ui(self):
         """
@@ -58,20 +45,22 @@ class WindowsUi(PortUI):
                         previous_status[instance]["result"] = current_result
 
                     # Format and truncate content if necessary
+                    stage_display = f"Stage: {self.stages.get(instance, '')[:col_width - 8]}".ljust(col_width)
                     task_display = f"Task: {current_task[:col_width - 7]}".ljust(col_width)
                     step_display = f"Step: {current_step[:col_width - 7]}".ljust(col_width)
                     result_display = f"Status: {current_result[:col_width - 7]}".ljust(col_width)
 
-                    rows.append([task_display, step_display, result_display])
+                    rows.append([stage_display, task_display, step_display, result_display])
 
                 # Print rows
-                for i in range(3):
+                for i in range(4):
                     print(" | ".join(row[i] for row in rows))
 
-            time.sleep(0.5)
+            # Wake up on the next status transition instead of polling
+            self.wait_for_events(timeout=0.5)
 
             # Check if all instances are completed
-            if all(self.status[instance]["result"] in ["Success", "Error"] for instance in self.instances):
+            if self.is_finished():
                 print("\nAll instances completed".center(columns))
                 time.sleep(2)
                 break
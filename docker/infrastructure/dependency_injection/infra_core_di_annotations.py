@@ -1,4 +1,4 @@
-import inspect
+import functools
 import threading
 
 from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
@@ -42,11 +42,10 @@ def repository(cls):
 
 def inject(func):
     """Decorator for automatic dependency injection from the DI container."""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        dependencies = {
-            name: infra_core_container.resolve(param.annotation)
-            for name, param in inspect.signature(func).parameters.items()
-            if param.annotation in infra_core_container.services and name not in kwargs
-        }
-        return func(*args, **{**kwargs, **dependencies})
-    return wrapper
\ No newline at end of file
+        # Parameters the caller passes, by keyword or position, are not injected
+        for name, key in infra_core_container.injection_plan(func).missing(args, kwargs):
+            kwargs[name] = infra_core_container.resolve(key)
+        return func(*args, **kwargs)
+    return wrapper
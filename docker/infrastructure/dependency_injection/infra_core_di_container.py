@@ -2,6 +2,10 @@ import os
 import inspect
 import importlib
 import pkgutil
+import threading
+
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
+from infrastructure.dependency_injection.infra_core_di_resolution_plan import InjectionPlan, ResolutionPlan
 
 class InfraCoreContainer:
     _instance = None  # Singleton instance
@@ -11,32 +15,75 @@ class InfraCoreContainer:
         if cls._instance is None:
             cls._instance = super(InfraCoreContainer, cls).__new__(cls)
             cls._instance.services = {}  # Storage for all registered services
+            cls._instance.lifetimes = {}  # Lifetime of the registered classes
+            cls._instance.singletons = {}  # Instances of the classes registered as SINGLETON
+            # Compiled on first resolve, which parameters are injected changes with every registration
+            cls._instance.plans = {}
+            cls._instance.injection_plans = {}
+            cls._instance.lock = threading.RLock()
             cls._instance.root_module = cls.find_root_module()  # Root of the project
         return cls._instance
 
-    def register(self, class_type, instance=None):
+    def register(self, class_type, instance=None, lifetime: Lifetime = Lifetime.TRANSIENT):
         """
         Registers a class or a specific instance.
         If instance is provided, it's stored immediately.
         Otherwise, the class type itself is stored for lazy instantiation.
+
+        :param lifetime: SINGLETON creates the class once and hands out that instance, for stateless services.
         """
-        if instance:
-            self.services[class_type] = instance
-        else:
-            self.services[class_type] = class_type
+        with self.lock:
+            if instance:
+                self.services[class_type] = instance
+            else:
+                self.services[class_type] = class_type
+            self.lifetimes[class_type] = lifetime
+            self.singletons.pop(class_type, None)
+            self.plans = {}
+            self.injection_plans = {}
+
+    def plan(self, class_type) -> ResolutionPlan:
+        """Returns the resolution plan of the service, compiling it on first use."""
+        plan = self.plans.get(class_type)
+        if plan is None:
+            with self.lock:
+                if class_type not in self.services:
+                    raise ValueError(f"Service {class_type.__name__} is not registered")
+                registered = self.services[class_type]
+                if registered is class_type or inspect.isfunction(registered):
+                    plan = ResolutionPlan.compile(registered, self.services, self.lifetimes[class_type])
+                else:
+                    # A registered instance is handed out as it is
+                    plan = ResolutionPlan(type(registered), (), Lifetime.SINGLETON, registered)
+                self.plans[class_type] = plan
+        return plan
+
+    def injection_plan(self, func) -> InjectionPlan:
+        """Returns the parameters @inject fills for the function, compiling them on first use."""
+        plan = self.injection_plans.get(func)
+        if plan is None:
+            with self.lock:
+                plan = InjectionPlan.compile(func, self.services)
+                self.injection_plans[func] = plan
+        return plan
 
     def resolve(self, class_type):
         """Creates an instance with automatic dependency injection"""
-        if class_type not in self.services:
-            raise ValueError(f"Service {class_type.__name__} is not registered")
-
-        constructor = inspect.signature(class_type.__init__)
-        dependencies = {
-            name: self.resolve(param.annotation)
-            for name, param in constructor.parameters.items()
-            if name != "self" and param.annotation in self.services
-        }
-        return class_type(**dependencies)  # Instantiate the class with resolved dependencies
+        plan = self.plan(class_type)
+        if plan.instance is not None:
+            return plan.instance
+        if plan.lifetime is Lifetime.SINGLETON:
+            instance = self.singletons.get(class_type)
+            if instance is None:
+                with self.lock:
+                    instance = self.singletons.get(class_type)
+                    if instance is None:  # Double-Checked Locking
+                        instance = self.singletons[class_type] = self._create(plan)
+            return instance
+        return self._create(plan)
+
+    def _create(self, plan: ResolutionPlan):
+        return plan.factory(**{name: self.resolve(key) for name, key in plan.dependencies})
 
     def scan_module(self, module_name):
         """Scans a module and registers all `@injectable`, `@Component`, `@Service`, and `@Repository` classes"""
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Lifetime(str, Enum):
+    # A new instance per resolve
+    TRANSIENT = "transient"
+    # One instance per container, created on the first resolve
+    SINGLETON = "singleton"
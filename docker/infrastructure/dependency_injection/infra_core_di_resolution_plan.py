@@ -0,0 +1,74 @@
+import inspect
+from typing import Any, Callable, Collection, Dict, Tuple
+
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
+
+
+class ResolutionPlan:
+    """
+    How the container creates a service, compiled once from the constructor signature:
+    the factory to call, its injected parameters with the service keys they resolve to, and the lifetime.
+    """
+
+    __slots__ = ("factory", "dependencies", "lifetime", "instance")
+
+    def __init__(self, factory: Callable[..., Any], dependencies: Tuple[Tuple[str, Any], ...],
+                 lifetime: Lifetime = Lifetime.TRANSIENT, instance: Any = None):
+        """
+        :param factory: Class or function creating the instance.
+        :param dependencies: Parameter name and service key of each injected parameter.
+        :param lifetime: Whether the container creates an instance per resolve or once.
+        :param instance: Instance registered with the container, handed out instead of creating one.
+        """
+        self.factory = factory
+        self.dependencies = dependencies
+        self.lifetime = lifetime
+        self.instance = instance
+
+    @staticmethod
+    def compile(factory: Callable[..., Any], services: Collection[Any],
+                lifetime: Lifetime = Lifetime.TRANSIENT) -> "ResolutionPlan":
+        """Inspects the constructor of the class, respectively the function, once."""
+        target = factory.__init__ if inspect.isclass(factory) else factory
+        return ResolutionPlan(factory, injected_parameters(target, services), lifetime)
+
+
+def injected_parameters(func: Callable[..., Any], services: Collection[Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Name and annotation of the parameters annotated with a registered service."""
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        # Builtin constructors without signature take no services
+        return ()
+    return tuple((name, parameter.annotation) for name, parameter in parameters.items()
+                 if name != "self" and parameter.annotation in services)
+
+
+def positions(func: Callable[..., Any]) -> Dict[str, int]:
+    """Position of each parameter that can be passed positionally, self included."""
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return {}
+    return {name: index for index, (name, parameter) in enumerate(parameters.items())
+            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)}
+
+
+class InjectionPlan:
+    """The parameters @inject fills for a function, with their positions to skip arguments the caller passed."""
+
+    __slots__ = ("dependencies", "positions")
+
+    def __init__(self, dependencies: Tuple[Tuple[str, Any], ...], positions: Dict[str, int]):
+        self.dependencies = dependencies
+        self.positions = positions
+
+    @staticmethod
+    def compile(func: Callable[..., Any], services: Collection[Any]) -> "InjectionPlan":
+        return InjectionPlan(injected_parameters(func, services), positions(func))
+
+    def missing(self, args: tuple, kwargs: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        """The dependencies the call does not pass itself."""
+        return tuple((name, key) for name, key in self.dependencies
+                     if name not in kwargs and self.positions.get(name, len(args)) >= len(args))
+
@@ -0,0 +1,37 @@
+import argparse
+import sys
+
+from application.services.plan.command_plan_compiler import CommandPlanCompiler
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.adapters.file_management.path_strategies.path_factory import PathFactory
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="plan", description="Compiles the command YAML files into the command plan "
+                                                              "tiny_swarm_world executes.")
+    actions = parser.add_subparsers(dest="action", required=True)
+    actions.add_parser("compile", help="compile config/command_*.yaml against vms_repository.yaml")
+    actions.add_parser("status", help="show whether the stored plan matches the configuration")
+    args = parser.parse_args(argv)
+
+    infra_core_container.register(PathFactory, lifetime=Lifetime.SINGLETON)
+    infra_core_container.register(FileManager, lifetime=Lifetime.SINGLETON)
+
+    compiler = CommandPlanCompiler()
+    if args.action == "compile":
+        plan = compiler.compile()
+        print(f"Compiled plan {plan.input_hash} with {len(plan.commands)} command files")
+        return 0
+
+    plan = compiler.load_current()
+    if plan is None:
+        print("No current plan, run: python plan.py compile")
+        return 1
+    print(f"Plan {plan.input_hash} is current")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
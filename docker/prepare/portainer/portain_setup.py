@@ -1,10 +1,25 @@
 import json
 import os
+import random
 import subprocess
 import time
 
 import requests
 
+# Seconds Portainer may take to answer after the stack was deployed
+PORTAINER_DEADLINE = 300
+# Seconds between the attempts, doubled after each attempt up to the maximum, JITTER of each is random
+INITIAL_DELAY = 1
+MAX_DELAY = 15
+JITTER = 0.5
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait after the attempt, exponential with jitter as the Backoff of domain.readiness."""
+    base = min(MAX_DELAY, INITIAL_DELAY * 2 ** attempt)
+    spread = base * JITTER
+    return base - spread + random.random() * spread
+
 
 class PortainerSetup:
     def __init__(self):
@@ -81,16 +96,22 @@ class PortainerSetup:
 
     def wait_for_portainer(self):
         print("Waiting for Portainer to start...")
+        give_up = time.monotonic() + PORTAINER_DEADLINE
+        attempts = 0
         while True:
+            attempts += 1
             try:
-                response = requests.get(f"http://{self.swarm_manager_ip}:9000")
+                response = requests.get(f"http://{self.swarm_manager_ip}:9000", timeout=5)
                 if "Portainer" in response.text:
-                    print("Portainer started successfully.")
-                    break
+                    print(f"Portainer started successfully after {attempts} attempts.")
+                    return
             except requests.RequestException:
                 pass
+            remaining = give_up - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Portainer did not answer within {PORTAINER_DEADLINE} seconds")
             print(".", end="", flush=True)
-            time.sleep(5)
+            time.sleep(min(backoff_delay(attempts - 1), remaining))
 
     def init_admin(self):
         print("Initializing Portainer admin user...")
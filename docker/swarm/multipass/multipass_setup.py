@@ -1,33 +1,42 @@
 import os
+import random
 import subprocess
-import sys
 import time
 
+# Seconds between the attempts, doubled after each attempt up to the maximum, JITTER of each is random
+INITIAL_DELAY = 1
+MAX_DELAY = 20
+JITTER = 0.5
 
-def wait_progress(duration):
-    """Simple progress bar using stdout."""
-    print(f"Waiting for {duration} seconds:")
-    for i in range(duration):
-        sys.stdout.write(f"\rProgress: {((i + 1) / duration) * 100:.0f}%")
-        sys.stdout.flush()
-        time.sleep(1)
-    print("\rProgress: 100%")
 
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait after the attempt, exponential with jitter as the Backoff of domain.readiness."""
+    base = min(MAX_DELAY, INITIAL_DELAY * 2 ** attempt)
+    spread = base * JITTER
+    return base - spread + random.random() * spread
 
-def wait_for_multipass_socket(max_retries=10):
-    """Checking Multipass socket if available"""
+
+def wait_for_multipass_socket(deadline=200):
+    """Checking Multipass socket if available, retried with backoff until the deadline in seconds"""
     print("Checking Multipass socket...")
 
-    for attempt in range(max_retries):
+    give_up = time.monotonic() + deadline
+    attempts = 0
+    while True:
+        attempts += 1
         try:
-            result = subprocess.run(["multipass", "list"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
-                                    check=True)
-            if "No instances found" in result.stdout or result.returncode == 0:
-                print(f"✅ Multipass is running!")
-                return
-        except subprocess.CalledProcessError:
-            print(f"Attempt {attempt + 1}/{max_retries}: Multipass is not ready, retrying in 20 seconds...")
-            wait_progress(20)
+            subprocess.run(["multipass", "list"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                           check=True)
+            print(f"✅ Multipass is running after {attempts} attempts!")
+            return
+        except (subprocess.CalledProcessError, OSError):
+            pass
+        remaining = give_up - time.monotonic()
+        if remaining <= 0:
+            break
+        delay = min(backoff_delay(attempts - 1), remaining)
+        print(f"Attempt {attempts}: Multipass is not ready, retrying in {delay:.0f} seconds...")
+        time.sleep(delay)
 
     print("❌ Multipass did not start correctly. Please check the Multipass service manually.")
     exit(1)
@@ -1,59 +1,119 @@
+import argparse
 import asyncio
-
-from application.services.multipass.multipass_docker_install import MultipassDockerInstall
-from application.services.multipass.multipass_docker_swarm_init import MultipassDockerSwarmInit
-from application.services.multipass.multipass_init_vms import MultipassInitVms
-from application.services.multipass.multipass_restart_vms import MultipassRestartVMs
-from application.services.network.network_prepare_netplan import NetworkPrepareNetplan
-from application.services.network.network_service import NetworkService
+import sys
+from typing import Optional
+
+from application.exceptions.exception_pipeline import PipelineFailedError
+from application.services.pipeline.pipeline_scheduler import PipelineScheduler
+from application.services.pipeline.swarm_pipeline import SwarmPipeline
+from application.services.reconcile.swarm_reconcile import SwarmReconcile
+from application.services.plan.command_plan_compiler import CommandPlanCompiler
+from domain.command.command_executer.concurrency_limiter import ConcurrencyLimiter
+from domain.command.command_plan.command_plan import CommandPlan
+from domain.timing.run_timing_report import RunTimingReport
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.adapters.command_runner.session_command_runner import SessionPortCommandRunner
 from infrastructure.adapters.file_management.file_manager import FileManager
 from infrastructure.adapters.file_management.path_strategies.path_factory import PathFactory
+from infrastructure.adapters.timing.chrome_trace_writer import TRACE_PATH, ChromeTraceWriter
+from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.adapters.repositories.concurrency_limits_repository_yaml import PortConcurrencyLimitsRepositoryYaml
 from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
 from infrastructure.logging.logger_factory import LoggerFactory
 
 
-async def main():
+async def main(fresh: bool = False, reconcile: bool = False, golden_image: bool = False,
+               package_cache: bool = False, cloud_init: bool = False, headless: Optional[bool] = None,
+               progress_file: Optional[str] = None, trace_file: str = TRACE_PATH) -> int:
+    """Brings up the swarm, returns the exit code of the process."""
     # Register FileManager explicitly
 
     #infra_core_container.scan_module("docker")
-    infra_core_container.register(PathFactory)
-    infra_core_container.register(FileManager)
+    infra_core_container.register(PathFactory, lifetime=Lifetime.SINGLETON)
+    infra_core_container.register(FileManager, lifetime=Lifetime.SINGLETON)
 
     logger = LoggerFactory.get_logger("application")
     logger.info("Starting application")
 
-    logger.info("MultipassInitVms")
-    multipass_init_vms = MultipassInitVms()
-    await multipass_init_vms.run()
-
-    logger.info("NetworkPrepareNetplan")
-    network_prepare_netplan = NetworkPrepareNetplan()
-    await network_prepare_netplan.run()
-
-    logger.info("NetworkService")
-    network = NetworkService()
-    await network.run()
-
-    logger.info("MultipassRestartVMs")
-    multipass_restart_vms = MultipassRestartVMs()
-    await multipass_restart_vms.run()
+    # Progress as JSON lines instead of the terminal UI, chosen by the terminal if headless is None
+    FactoryUI.configure(headless=headless, progress_file=progress_file)
+
+    # Timings of this run only, reported at its end
+    TimingRecorder.configure(TimingRecorder())
+
+    # Bound the parallel launches and restarts, see config/multipass/concurrency_limits.yaml
+    ConcurrencyLimiter.configure(PortConcurrencyLimitsRepositoryYaml().get_limiter())
+
+    # Commands come from the compiled plan, it is only compiled again when a YAML file changed (see plan.py)
+    CommandPlan.activate(CommandPlanCompiler().load_or_compile())
+
+    # Stages run per VM as soon as their dependencies are done, see SwarmPipeline for the graph
+    logger.info("SwarmPipeline")
+    swarm_pipeline = SwarmPipeline(fresh=fresh, golden_image=golden_image, package_cache=package_cache,
+                                   cloud_init=cloud_init)
+    try:
+        if reconcile:
+            # Only adds and removes the workers that differ from the VM repository
+            plan = await SwarmReconcile(swarm_pipeline).run()
+            logger.info(f"SwarmReconcile: {plan}")
+        else:
+            result = await swarm_pipeline.run()
+            logger.info(f"SwarmPipeline: {result}")
+            PipelineScheduler.raise_for_failures(result)
+    except PipelineFailedError as e:
+        logger.error(str(e))
+        for key, error in e.failed.items():
+            print(f"Failed: {key}: {error}", file=sys.stderr)
+        for key in e.skipped:
+            print(f"Skipped: {key}", file=sys.stderr)
+        return 1
+    finally:
+        await SessionPortCommandRunner.close_all()
+        _report_timings(logger, trace_file)
 
-    logger.info("MultipassDockerInstall")
-    multipass_docker_install = MultipassDockerInstall()
-    await multipass_docker_install.run()
-
-    logger.info("MultipassRestartVMs")
-    multipass_restart_vms = MultipassRestartVMs()
-    await multipass_restart_vms.run()
-
-    logger.info("MultipassDockerSwarmInit")
-    multipass_swarm_init = MultipassDockerSwarmInit()
-    await multipass_swarm_init.run()
+    logger.info("Done")
+    # Stdout carries the JSON lines of the headless UI
+    print("Done", file=sys.stderr if FactoryUI().is_headless() else sys.stdout)
+    return 0
 
 
-    logger.info("Done")
-    print("Done")
+def _report_timings(logger, trace_file: str):
+    """Prints where the time of the run went and exports it as Chrome trace for Perfetto."""
+    recorder = TimingRecorder.shared()
+    report = RunTimingReport.of(recorder).format()
+    logger.info(f"Timing report:\n{report}")
+    trace_path = ChromeTraceWriter(recorder).save(trace_file)
+    # Stdout carries the JSON lines of the headless UI
+    output = sys.stderr if FactoryUI().is_headless() else sys.stdout
+    print(report, file=output)
+    print(f"Trace for https://ui.perfetto.dev: {trace_path}", file=output)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Brings up the Docker Swarm on Multipass VMs.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--fresh", action="store_true",
+                      help="delete all VMs first instead of completing the existing cluster")
+    mode.add_argument("--reconcile", action="store_true",
+                      help="only add missing workers and remove workers no longer configured")
+    parser.add_argument("--golden-image", action="store_true",
+                        help="clone the workers from a VM with docker installed, needs multipass 1.15 or newer")
+    parser.add_argument("--package-cache", action="store_true",
+                        help="run apt and registry caches on the manager, see config/docker/package_cache.yaml")
+    parser.add_argument("--cloud-init", action="store_true",
+                        help="set up network and docker with cloud-init during the first boot of new VMs")
+    ui = parser.add_mutually_exclusive_group()
+    ui.add_argument("--headless", action="store_true", default=None,
+                    help="write the progress as JSON lines instead of the terminal UI, the default without a TTY")
+    ui.add_argument("--terminal-ui", dest="headless", action="store_false",
+                    help="show the terminal UI even without a TTY")
+    parser.add_argument("--progress-file", metavar="FILE",
+                        help="append the JSON lines of --headless to FILE instead of stdout")
+    parser.add_argument("--trace-file", metavar="FILE", default=TRACE_PATH,
+                        help=f"write the Chrome trace of the run to FILE (default: {TRACE_PATH})")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(fresh=args.fresh, reconcile=args.reconcile, golden_image=args.golden_image,
+                              package_cache=args.package_cache, cloud_init=args.cloud_init,
+                              headless=args.headless, progress_file=args.progress_file,
+                              trace_file=args.trace_file)))
@@ -0,0 +1,37 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from application.services.multipass.manager_facts_provider import ManagerFactsProvider
+from domain.swarm.manager_facts import ManagerFacts
+
+
+class TestManagerFactsProvider(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_query(self):
+        facts = ManagerFacts(ip="10.0.0.2", worker_token="SWMTKN-worker")
+        provider = ManagerFactsProvider()
+
+        with patch.object(ManagerFactsProvider, "_query", AsyncMock(return_value=facts)) as query:
+            results = await asyncio.gather(*(provider.get() for _ in range(5)))
+            await provider.get()
+
+        self.assertEqual(results, [facts] * 5)
+        query.assert_awaited_once()
+
+    async def test_invalidate_and_failures_query_again(self):
+        facts = ManagerFacts(ip="10.0.0.2", worker_token="SWMTKN-worker")
+        provider = ManagerFactsProvider()
+
+        with patch.object(ManagerFactsProvider, "_query",
+                          AsyncMock(side_effect=[ValueError("no swarm"), facts, facts])) as query:
+            with self.assertRaises(ValueError):
+                await provider.get()
+            self.assertEqual(await provider.get(), facts)
+            provider.invalidate()
+            await provider.get()
+
+        self.assertEqual(query.await_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import asyncio
+
+from application.services.multipass.multipass_golden_image import MultipassGoldenImage
+from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
+from infrastructure.adapters.command_runner.fake_multipass.fake_multipass import FakeMultipass
+from infrastructure.adapters.command_runner.fake_multipass.simulation_profile import SimulationProfile
+from infrastructure.adapters.exceptions.exception_commands_failed import CommandsFailedError
+from tests.application.services.pipeline.test_swarm_pipeline import SimulatedSwarmTestCase
+
+
+class TestMultipassGoldenImage(SimulatedSwarmTestCase):
+    def test_image_is_built_once(self):
+        golden_image = MultipassGoldenImage()
+        asyncio.run(golden_image.ensure())
+        asyncio.run(golden_image.ensure())
+
+        self.assertEqual("Stopped", self.simulation.vms[golden_image.image.name].state)
+        self.assertEqual(1, self.simulation.operations["launch"])
+
+    def test_failed_build_is_deleted(self):
+        self.simulation = FakeMultipass(SimulationProfile(failure_rates={"apt": 1.0}))
+        CommandRunnerFactory.configure(self.simulation.runner)
+        golden_image = MultipassGoldenImage()
+
+        with self.assertRaises(CommandsFailedError):
+            asyncio.run(golden_image.ensure())
+
+        # Not kept as a ready image, the next run builds it again
+        self.assertNotIn(golden_image.image.name, self.simulation.vms)
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from application.exceptions.exception_pipeline import PipelineFailedError, PipelineNodeSkippedError
+from application.services.pipeline.pipeline_scheduler import PipelineScheduler
+from domain.pipeline.pipeline_node import PipelineNode
+
+
+class TestPipelineScheduler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.scheduler = PipelineScheduler()
+        self.events = []
+
+    def _action(self, name, delay=0.0, error=None):
+        async def action():
+            self.events.append(f"start {name}")
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+            self.events.append(f"end {name}")
+            return name
+
+        return action
+
+    async def test_node_starts_when_own_dependencies_are_done(self):
+        self.scheduler.add_node(PipelineNode(stage="launch", vm_instance="manager", action=self._action("lm", 0.05)))
+        self.scheduler.add_node(PipelineNode(stage="launch", vm_instance="worker", action=self._action("lw")))
+        self.scheduler.add_node(PipelineNode(stage="install", vm_instance="worker", depends_on=["launch:worker"],
+                                             action=self._action("iw")))
+
+        result = await self.scheduler.run()
+
+        self.assertEqual(result, {"launch:manager": "lm", "launch:worker": "lw", "install:worker": "iw"})
+        # The worker install must not wait for the slow manager launch
+        self.assertLess(self.events.index("end iw"), self.events.index("end lm"))
+
+    async def test_dependants_of_failed_node_are_skipped(self):
+        self.scheduler.add_node(PipelineNode(stage="launch", vm_instance="vm", action=self._action(
+            "l", error=RuntimeError("boom"))))
+        self.scheduler.add_node(PipelineNode(stage="install", vm_instance="vm", depends_on=["launch:vm"],
+                                             action=self._action("i")))
+
+        result = await self.scheduler.run()
+
+        self.assertIsInstance(result["launch:vm"], RuntimeError)
+        self.assertIsInstance(result["install:vm"], PipelineNodeSkippedError)
+        self.assertNotIn("start i", self.events)
+
+    async def test_failed_and_skipped_nodes_are_raised(self):
+        self.scheduler.add_node(PipelineNode(stage="launch", vm_instance="vm", action=self._action(
+            "l", error=RuntimeError("boom"))))
+        self.scheduler.add_node(PipelineNode(stage="install", vm_instance="vm", depends_on=["launch:vm"],
+                                             action=self._action("i")))
+        self.scheduler.add_node(PipelineNode(stage="launch", vm_instance="other", action=self._action("o")))
+        result = await self.scheduler.run()
+
+        with self.assertRaises(PipelineFailedError) as raised:
+            PipelineScheduler.raise_for_failures(result)
+
+        self.assertEqual(list(raised.exception.failed), ["launch:vm"])
+        self.assertEqual(raised.exception.skipped, ["install:vm"])
+        PipelineScheduler.raise_for_failures({"launch:other": "o"})
+
+    def test_cycle_is_rejected(self):
+        self.scheduler.add_node(PipelineNode(stage="a", vm_instance="vm", depends_on=["b:vm"]))
+        self.scheduler.add_node(PipelineNode(stage="b", vm_instance="vm", depends_on=["a:vm"]))
+
+        with self.assertRaises(ValueError):
+            self.scheduler.topological_order()
+
+    def test_unknown_dependency_is_rejected(self):
+        self.scheduler.add_node(PipelineNode(stage="a", vm_instance="vm", depends_on=["missing:vm"]))
+
+        with self.assertRaises(ValueError):
+            self.scheduler.topological_order()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import yaml
+
+from application.services.pipeline.swarm_pipeline import SwarmPipeline
+from benchmarks.swarm_benchmark import CONFIG_DIR
+from domain.command.command_executer.concurrency_limiter import ConcurrencyLimiter
+from domain.command.command_plan.command_plan import CommandPlan
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
+from infrastructure.adapters.command_runner.fake_multipass.fake_multipass import FakeMultipass
+from infrastructure.adapters.file_management.file_manager import FileManager
+from infrastructure.adapters.file_management.path_strategies.path_factory import PathFactory
+from infrastructure.adapters.readiness.http_probe import HttpProbe
+from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
+
+VMS = ["swarm-manager", "swarm-worker-1", "swarm-worker-2"]
+
+
+class SimulatedSwarmTestCase(unittest.TestCase):
+    """Runs the services in a temporary working directory against a simulated multipass."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory(prefix="tsw-pipeline-")
+        self.addCleanup(directory.cleanup)
+        shutil.copytree(CONFIG_DIR, os.path.join(directory.name, "config"))
+        self.vms_path = os.path.join(directory.name, "config", "multipass", "vms_repository.yaml")
+        self.write_vms(VMS)
+
+        cwd = os.getcwd()
+        os.chdir(directory.name)
+        self.addCleanup(os.chdir, cwd)
+        self.simulation = FakeMultipass()
+        self.recorder = TimingRecorder()
+        infra_core_container.register(PathFactory, lifetime=Lifetime.SINGLETON)
+        infra_core_container.register(FileManager, lifetime=Lifetime.SINGLETON)
+        FactoryUI.configure(headless=True, progress_file=os.devnull)
+        TimingRecorder.configure(self.recorder)
+        ConcurrencyLimiter.configure(None)
+        CommandPlan.activate(None)
+        CommandRunnerFactory.configure(self.simulation.runner)
+        self.addCleanup(CommandRunnerFactory.configure, None)
+        self.addCleanup(TimingRecorder.configure, None)
+        self.addCleanup(FactoryUI.configure)
+
+    def write_vms(self, names):
+        """Configures the VMs, the first one is the manager."""
+        vms = [{"vm_instance": name, "vm_type": "manager" if index == 0 else "worker",
+                "ipaddress": f"10.42.0.{index + 2}", "gateway": "10.42.0.1", "memory": "2G", "disk": "10G"}
+               for index, name in enumerate(names)]
+        with open(self.vms_path, "w") as file:
+            yaml.safe_dump({"vms": vms}, file, sort_keys=False)
+
+    def assert_finished(self, results):
+        self.assertEqual([], [key for key, result in results.items() if isinstance(result, BaseException)])
+
+
+class TestSwarmPipelinePackageCache(SimulatedSwarmTestCase):
+    """The registry mirror on the manager is not reachable from here."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(HttpProbe, "check", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_pipeline(self, golden_image: bool = False):
+        self.assert_finished(asyncio.run(SwarmPipeline(fresh=True, golden_image=golden_image,
+                                                       package_cache=True).run()))
+
+    def mirrors(self):
+        return {name: self.simulation.vms[name].loaded_mirror for name in VMS}
+
+    def expected_mirrors(self):
+        # The address the manager got, not the one it was planned with in the VM repository
+        manager = self.simulation.vms[VMS[0]].ipv4
+        self.assertNotEqual("10.42.0.2", manager)
+        return {name: f"http://{manager}:5000" for name in VMS}
+
+    def restarted(self):
+        return {command.vm_instance for command in self.recorder.commands
+                if command.stage == "restart-docker" and not command.skipped}
+
+    def test_docker_of_every_vm_uses_the_registry_mirror(self):
+        self.run_pipeline()
+
+        self.assertEqual(self.expected_mirrors(), self.mirrors())
+        self.assertEqual(set(VMS), self.restarted())
+
+    def test_clones_restart_docker_after_cache_client(self):
+        self.run_pipeline(golden_image=True)
+
+        self.assertEqual(self.expected_mirrors(), self.mirrors())
+        self.assertEqual(set(VMS), self.restarted())
@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from application.exceptions.exception_readiness import ReadinessTimeoutError
+from application.ports.readiness.port_readiness_probe import PortReadinessProbe
+from application.services.readiness.readiness_waiter import ReadinessWaiter
+from domain.readiness.backoff import Backoff
+
+
+class FakeProbe(PortReadinessProbe):
+    def __init__(self, name, ready_after=0, events=None):
+        self._name = name
+        self.ready_after = ready_after
+        self.events = events if events is not None else []
+        self.attempts = 0
+
+    @property
+    def name(self):
+        return self._name
+
+    async def check(self):
+        self.attempts += 1
+        self.events.append(self._name)
+        return self.attempts > self.ready_after
+
+
+class TestReadinessWaiter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ui = MagicMock()
+        self.waiter = ReadinessWaiter(backoff=Backoff(initial=0.001, max_delay=0.005), ui=self.ui)
+
+    async def test_wait_returns_attempts_once_ready(self):
+        probe = FakeProbe("ssh", ready_after=3)
+
+        attempts = await self.waiter.wait(probe, deadline=5, instance="worker")
+
+        self.assertEqual(attempts, 4)
+        self.ui.update_status.assert_called_with(instance="worker", task="Waiting for ssh", step="Attempt 4",
+                                                 result="Running...")
+
+    async def test_wait_raises_after_deadline(self):
+        probe = FakeProbe("ssh", ready_after=10 ** 6)
+
+        with self.assertRaises(ReadinessTimeoutError) as context:
+            await self.waiter.wait(probe, deadline=0.05, instance="worker")
+
+        self.assertEqual(context.exception.waiting, {"worker": "ssh"})
+        self.assertGreater(probe.attempts, 1)
+
+    async def test_hanging_probe_is_cut_at_deadline(self):
+        class HangingProbe(FakeProbe):
+            async def check(self):
+                await asyncio.sleep(10)
+
+        with self.assertRaises(ReadinessTimeoutError):
+            await self.waiter.wait(HangingProbe("docker"), deadline=0.05)
+
+    async def test_wait_all_checks_probes_of_a_vm_in_order(self):
+        events = []
+        probes = {"manager": [FakeProbe("ssh", ready_after=2, events=events), FakeProbe("docker", events=events)]}
+
+        await self.waiter.wait_all(probes, deadline=5)
+
+        self.assertEqual(events, ["ssh", "ssh", "ssh", "docker"])
+
+    async def test_wait_all_reports_every_vm_not_ready(self):
+        probes = {
+            "manager": [FakeProbe("ssh")],
+            "worker-1": [FakeProbe("ssh"), FakeProbe("docker", ready_after=10 ** 6)],
+            "worker-2": [FakeProbe("ssh", ready_after=10 ** 6)],
+        }
+
+        with self.assertRaises(ReadinessTimeoutError) as context:
+            await self.waiter.wait_all(probes, deadline=5, deadlines={"worker-1": 0.05, "worker-2": 0.05})
+
+        self.assertEqual(context.exception.waiting, {"worker-1": "docker", "worker-2": "ssh"})
+
+
+if __name__ == "__main__":
+    unittest.main()
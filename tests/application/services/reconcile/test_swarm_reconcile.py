@@ -0,0 +1,23 @@
+import asyncio
+
+from application.services.pipeline.swarm_pipeline import SwarmPipeline
+from application.services.reconcile.swarm_reconcile import SwarmReconcile
+from tests.application.services.pipeline.test_swarm_pipeline import VMS, SimulatedSwarmTestCase
+
+
+class TestSwarmReconcile(SimulatedSwarmTestCase):
+    def setUp(self):
+        super().setUp()
+        self.assert_finished(asyncio.run(SwarmPipeline(fresh=True).run()))
+
+    def test_existing_worker_outside_the_swarm_is_joined_and_removed_worker_deleted(self):
+        manager, joined, removed = VMS
+        self.simulation.vms[joined].swarm = "inactive"
+        self.simulation.swarm_nodes.remove(joined)
+        self.write_vms([manager, joined])
+
+        plan = asyncio.run(SwarmReconcile(SwarmPipeline()).run())
+
+        self.assertEqual(([], [joined], [removed]), (plan.to_create, plan.to_join, plan.to_remove))
+        self.assertEqual([manager, joined], self.simulation.swarm_nodes)
+        self.assertNotIn(removed, self.simulation.vms)
@@ -0,0 +1,84 @@
+import threading
+import unittest
+import urllib.request
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from domain.cache.package_cache import PackageCache
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+
+DOCKER_SOURCE_COMMAND = ("multipass exec swarm-worker-1 -- bash -c \"curl -fsSL https://download.docker.com/linux/ubuntu/gpg;"
+                         " echo \\\"deb [arch=amd64 signed-by=/etc/apt/keyrings/docker.gpg]"
+                         " https://download.docker.com/linux/ubuntu noble stable\\\"\"")
+
+
+class FakeUpstream(BaseHTTPRequestHandler):
+    """Answers every GET with its path, standing in for the apt cache and the upstream behind it."""
+    paths = []
+
+    def do_GET(self):
+        FakeUpstream.paths.append(self.path)
+        body = b"Origin: Docker\n"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPackageCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PackageCache(host="192.168.1.2")
+
+    def test_only_apt_sources_are_rewritten(self):
+        rewritten = self.cache.rewrite(DOCKER_SOURCE_COMMAND)
+
+        self.assertIn("] http://192.168.1.2:3142/HTTPS///download.docker.com/linux/ubuntu noble stable", rewritten)
+        # The signing key is not an apt download and stays with the upstream
+        self.assertIn("curl -fsSL https://download.docker.com/linux/ubuntu/gpg", rewritten)
+
+    def test_parameters(self):
+        parameters = self.cache.as_parameters()
+
+        self.assertEqual(parameters[ParameterType.CACHE_APT_PROXY], "http://192.168.1.2:3142")
+        self.assertEqual(parameters[ParameterType.CACHE_REGISTRY_MIRROR], "http://192.168.1.2:5000")
+        self.assertEqual(parameters[ParameterType.CACHE_REGISTRY_HOST], "192.168.1.2:5000")
+
+    def serve(self) -> PackageCache:
+        """Runs the fake as the apt cache on a free local port."""
+        server = HTTPServer(("127.0.0.1", 0), FakeUpstream)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        FakeUpstream.paths = []
+        return PackageCache(host="127.0.0.1", apt_port=server.server_port)
+
+    def test_rewritten_source_reaches_the_cache(self):
+        cache = self.serve()
+
+        url = cache.source_url("https://download.docker.com/linux/ubuntu/dists/noble/InRelease")
+        # No proxy of the environment in between, the test stays offline
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+        with opener.open(url, timeout=5) as response:
+            self.assertEqual(response.read(), b"Origin: Docker\n")
+
+        self.assertEqual(FakeUpstream.paths, ["/HTTPS///download.docker.com/linux/ubuntu/dists/noble/InRelease"])
+
+    def test_downloads_go_through_the_configured_proxy(self):
+        cache = self.serve()
+        # As apt with Acquire::http::Proxy set to the apt proxy of the cache-client commands
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({"http": cache.apt_proxy}))
+        source = cache.source_url("https://download.docker.com/linux/ubuntu/dists/noble/InRelease")
+
+        for url in ("http://archive.ubuntu.com/ubuntu/dists/noble/InRelease", source):
+            with opener.open(url, timeout=5) as response:
+                self.assertEqual(response.read(), b"Origin: Docker\n")
+
+        # A proxy gets the absolute URL, the rewritten source keeps the remap path of apt-cacher-ng
+        self.assertEqual(FakeUpstream.paths, ["http://archive.ubuntu.com/ubuntu/dists/noble/InRelease", source])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import subprocess
+import unittest
+from unittest.mock import MagicMock
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from domain.command.command_builder.command_batcher import CommandBatcher
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.command.remote_command import RemoteCommand
+
+
+class TestCommandBatcher(unittest.TestCase):
+    def setUp(self):
+        self.batcher = CommandBatcher()
+        self.runner = MagicMock(spec=PortCommandRunner)
+
+    def _command(self, index, command, vm="vm1", check=None):
+        return ExecutableCommandEntity(index=index, vm_instance_name=vm, description=f"step {index}",
+                                       command=command, runner=self.runner, check=check)
+
+    def test_consecutive_vm_commands_are_fused(self):
+        commands = {
+            1: self._command(1, "multipass exec vm1 -- echo one"),
+            2: self._command(2, "multipass exec vm1 -- sudo sh -c 'echo two'"),
+            3: self._command(3, "multipass transfer file vm1:/tmp/file"),
+            4: self._command(4, "multipass exec vm1 -- echo four"),
+        }
+
+        batched = self.batcher.batch(commands)
+
+        self.assertEqual(list(batched), [1, 3, 4])
+        self.assertEqual([step.index for step in batched[1].steps], [1, 2])
+        self.assertEqual(batched[1].timeout, 240)
+        self.assertEqual(batched[3].steps, [])
+        self.assertEqual(batched[4].steps, [])
+
+    def test_fused_script_reports_every_step(self):
+        commands = {
+            1: self._command(1, "multipass exec vm1 -- echo \"it's one\""),
+            2: self._command(2, "multipass exec vm1 -- sh -c 'echo two; exit 4'"),
+            3: self._command(3, "multipass exec vm1 -- bash -c \"echo \\\"\\$((1 + 2))\\\"\""),
+        }
+        fused = self.batcher.batch(commands)[1]
+
+        # Run the remote part locally, as the VM would do it
+        remote = RemoteCommand.parse(fused.command).remote
+        output = subprocess.run(remote, shell=True, capture_output=True, text=True).stdout
+
+        self.assertEqual(CommandBatcher.split_output(output), {1: (0, "it's one"), 2: (4, "two"), 3: (0, "3")})
+
+    def test_satisfied_steps_are_skipped_in_the_script(self):
+        commands = {
+            1: self._command(1, "multipass exec vm1 -- echo installed", check="multipass exec vm1 -- true"),
+            2: self._command(2, "multipass exec vm1 -- echo configured", check="multipass exec vm1 -- false"),
+            3: self._command(3, "multipass exec vm1 -- echo host check", check="multipass info vm1"),
+        }
+        batched = self.batcher.batch(commands)
+
+        # A check outside the VM keeps its command unfused for the executer
+        self.assertEqual(list(batched), [1, 3])
+        self.assertEqual(batched[3].check, "multipass info vm1")
+
+        output = subprocess.run(RemoteCommand.parse(batched[1].command).remote, shell=True, capture_output=True,
+                                text=True).stdout
+        self.assertEqual(CommandBatcher.split_output(output), {1: (0, "Already satisfied"), 2: (0, "configured")})
+
+    def test_step_output_without_final_newline(self):
+        commands = {
+            1: self._command(1, "multipass exec vm1 -- printf foo"),
+            2: self._command(2, "multipass exec vm1 -- printf 'bar\\n\\n'"),
+        }
+        fused = self.batcher.batch(commands)[1]
+
+        output = subprocess.run(RemoteCommand.parse(fused.command).remote, shell=True, capture_output=True,
+                                text=True).stdout
+
+        self.assertEqual(CommandBatcher.split_output(output), {1: (0, "foo"), 2: (0, "bar")})
+
+    def test_missing_end_marker_is_not_reported(self):
+        output = "__TSW_STEP__ BEGIN 1\npartial"
+
+        self.assertEqual(CommandBatcher.split_output(output), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+from application.ports.repositories.port_command_repository import PortCommandRepository
+from domain.command.command_builder.vm_parameter.command_builder import CommandBuilder
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+from domain.command.command_entity import CommandEntity
+from domain.command.command_plan.command_plan import CommandPlan
+from infrastructure.adapters.file_management.parsed_file_cache import ParsedFileCache
+from infrastructure.adapters.repositories.vm_repository_yaml import PortVmRepositoryYaml
+
+VMS_YAML = """vms:
+  - vm_instance: "swarm-manager"
+    vm_type: "manager"
+  - vm_instance: "swarm-worker-1"
+    vm_type: "worker"
+  - vm_instance: "swarm-worker-2"
+    vm_type: "worker"
+"""
+
+
+class InMemoryCommandRepository(PortCommandRepository):
+    def __init__(self):
+        self.get_all_commands_calls = 0
+
+    @property
+    def name(self) -> str:
+        return "commands.yaml"
+
+    def get_all_commands(self) -> Dict[int, CommandEntity]:
+        self.get_all_commands_calls += 1
+        return {
+            1: CommandEntity(index=1, description="Creating {vm_instance}", command="multipass launch -n {vm_instance}",
+                             runner="async", vm_type=["manager", "worker"], timeout=600),
+            2: CommandEntity(index=2, description="Join {vm_instance}", runner="session", vm_type=["worker"],
+                             command="multipass exec {vm_instance} -- docker swarm join --token {swarm_token}"),
+            3: CommandEntity(index=3, description="List", command="multipass list", runner="async"),
+        }
+
+
+class TestCommandBuilderPlan(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "vms_repository.yaml"
+        path.write_text(VMS_YAML)
+        file_manager = MagicMock()
+        file_manager.locate.return_value = path
+        file_manager.load.side_effect = lambda _: path.read_text()
+        for patcher in (
+                patch("infrastructure.adapters.repositories.vm_repository_yaml.infra_core_container.resolve",
+                      return_value=file_manager),
+                patch.object(PortVmRepositoryYaml, "_cache", ParsedFileCache())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(CommandPlan.activate, None)
+        self.parameter = {ParameterType.SWARM_TOKEN: "secret"}
+
+    @staticmethod
+    def _summary(command_list):
+        return {vm: {index: (command.description, command.command, type(command.runner))
+                     for index, command in commands.items()}
+                for vm, commands in command_list.items()}
+
+    def test_plan_builds_the_same_commands_without_reading_the_repository(self):
+        expected = CommandBuilder(InMemoryCommandRepository(), parameter=dict(self.parameter)).get_command_list()
+        repository = InMemoryCommandRepository()
+        CommandPlan.activate(CommandPlan(input_hash="test",
+                                         commands={repository.name: CommandBuilder(repository).plan()}))
+
+        repository.get_all_commands_calls = 0
+        planned = CommandBuilder(repository, parameter=dict(self.parameter)).get_command_list()
+
+        self.assertEqual(self._summary(planned), self._summary(expected))
+        self.assertEqual(planned["swarm-worker-2"][2].command,
+                         "multipass exec swarm-worker-2 -- docker swarm join --token secret")
+        self.assertEqual(planned["swarm-manager"][1].timeout, 600)
+        self.assertEqual(repository.get_all_commands_calls, 0)
+
+    def test_plan_survives_json_round_trip(self):
+        repository = InMemoryCommandRepository()
+        plan = CommandPlan(input_hash="test", commands={repository.name: CommandBuilder(repository).plan()})
+
+        self.assertEqual(CommandPlan.model_validate_json(plan.model_dump_json()), plan)
+
+    def test_missing_runtime_parameter_fails_before_building(self):
+        repository = InMemoryCommandRepository()
+        CommandPlan.activate(CommandPlan(input_hash="test",
+                                         commands={repository.name: CommandBuilder(repository).plan()}))
+
+        with self.assertRaises(ValueError):
+            CommandBuilder(repository).get_command_list()
+
+    def test_command_list_for_instance_outside_the_repository(self):
+        command_list = CommandBuilder(InMemoryCommandRepository(), parameter=dict(self.parameter)) \
+            .get_command_list_for("tsw-golden-1234")
+
+        self.assertEqual(list(command_list), ["tsw-golden-1234"])
+        self.assertEqual(command_list["tsw-golden-1234"][1].command, "multipass launch -n tsw-golden-1234")
+        self.assertEqual(command_list["tsw-golden-1234"][2].description, "Join tsw-golden-1234")
+
+
+if __name__ == "__main__":
+    unittest.main()
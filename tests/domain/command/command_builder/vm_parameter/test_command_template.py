@@ -0,0 +1,47 @@
+import unittest
+
+from pydantic import ValidationError
+
+from domain.command.command_builder.vm_parameter.command_template import CommandTemplate
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+from domain.command.command_entity import CommandEntity
+
+JOIN_TEMPLATE = "multipass exec {vm_instance} -- docker swarm join --token {swarm_token} {swarm_manager_ip}:{swarm_manager_port}"
+
+
+class TestCommandTemplate(unittest.TestCase):
+    def test_render(self):
+        template = CommandTemplate.compile(JOIN_TEMPLATE)
+
+        command = template.render({ParameterType.VM_INSTANCE: "worker-1", ParameterType.SWARM_TOKEN: "abc",
+                                   ParameterType.SWARM_MANAGER_IP: "10.0.0.2", ParameterType.SWARM_MANAGER_PORT: "2377"})
+
+        self.assertEqual(command, "multipass exec worker-1 -- docker swarm join --token abc 10.0.0.2:2377")
+
+    def test_placeholders_are_recorded(self):
+        template = CommandTemplate.compile(JOIN_TEMPLATE)
+
+        self.assertEqual(template.placeholders, {ParameterType.VM_INSTANCE, ParameterType.SWARM_TOKEN,
+                                                 ParameterType.SWARM_MANAGER_IP, ParameterType.SWARM_MANAGER_PORT})
+        self.assertEqual(template.missing({ParameterType.VM_INSTANCE: "worker-1"}),
+                         {ParameterType.SWARM_TOKEN, ParameterType.SWARM_MANAGER_IP, ParameterType.SWARM_MANAGER_PORT})
+
+    def test_template_is_compiled_once(self):
+        self.assertIs(CommandTemplate.compile(JOIN_TEMPLATE), CommandTemplate.compile(JOIN_TEMPLATE))
+
+    def test_escaped_braces_stay_literal(self):
+        template = CommandTemplate.compile("docker ps --format '{{.Names}}' on {vm_instance}")
+
+        self.assertEqual(template.render({ParameterType.VM_INSTANCE: "vm1"}), "docker ps --format '{.Names}' on vm1")
+
+    def test_missing_parameter_raises(self):
+        with self.assertRaises(ValueError):
+            CommandTemplate.compile(JOIN_TEMPLATE).render({ParameterType.VM_INSTANCE: "worker-1"})
+
+    def test_unknown_placeholder_fails_when_loading(self):
+        with self.assertRaises(ValidationError):
+            CommandEntity(index=1, command="multipass exec {vm_name} -- ls", runner="async")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from application.ports.ui.port_ui import PortUI
+from domain.command.command_executer.command_executer import CommandExecuter
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+
+
+class RecordingUI(PortUI):
+    def start(self):
+        pass
+
+
+class EchoRunner(PortCommandRunner):
+    async def run(self, command: str, timeout: int = 120) -> str:
+        self.emit_output(command)
+        if command == "fail":
+            raise CommandExecutionError(command, 1, command, "")
+        return command
+
+
+class TestCommandExecuter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ui = RecordingUI(["vm1"])
+        self.recorder = TimingRecorder()
+        self.executer = CommandExecuter(ui=self.ui, recorder=self.recorder)
+
+    def _command(self, index, output):
+        runner = MagicMock(spec=PortCommandRunner)
+        runner.run = AsyncMock(return_value=output)
+        runner.status = {"current_step": "Executing command", "result": "Success"}
+        return ExecutableCommandEntity(index=index, vm_instance_name="vm1", description=f"task {index}",
+                                       command=f"echo {output}", runner=runner)
+
+    async def test_commands_run_back_to_back(self):
+        commands = {index: self._command(index, f"out{index}") for index in range(1, 9)}
+
+        started = time.monotonic()
+        result = await self.executer.execute(commands)
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(result, {index: f"out{index}" for index in range(1, 9)})
+
+    async def test_status_transitions_are_published_in_order(self):
+        await self.executer.execute({1: self._command(1, "out")})
+
+        events = [(event.task, event.result) for event in self.ui.drain_events()]
+        self.assertEqual(events, [("task 1", "Running..."), ("task 1", "Success"), ("closing", "Success")])
+
+    async def test_failed_command_is_published_as_failed(self):
+        command = self._command(1, "out")
+        command.runner.run.side_effect = RuntimeError("boom")
+
+        result = await self.executer.execute({1: command})
+
+        self.assertEqual(result, {})
+        self.assertIn(("task 1", "Failed"), [(event.task, event.result) for event in self.ui.drain_events()])
+
+    async def test_satisfied_check_skips_the_command(self):
+        command = self._command(1, "out")
+        command.check = "probe"
+
+        result = await self.executer.execute({1: command})
+
+        command.runner.run.assert_awaited_once_with("probe", timeout=30)
+        self.assertEqual(result, {1: "Already satisfied"})
+        self.assertIn(("task 1", "Skipped"), [(event.task, event.result) for event in self.ui.drain_events()])
+
+    async def test_failed_check_runs_the_command(self):
+        command = self._command(1, "out")
+        command.check = "probe"
+        command.runner.run.side_effect = [RuntimeError("not installed"), "out"]
+
+        result = await self.executer.execute({1: command})
+
+        self.assertEqual(result, {1: "out"})
+        self.assertEqual(command.runner.run.await_count, 2)
+
+
+    async def test_timing_of_each_command_is_recorded(self):
+        failing = self._command(2, "out")
+        failing.runner.run.side_effect = CommandExecutionError(command="false", return_code=3, stdout="", stderr="no")
+        self.recorder.enter_stage("vm1", "docker-install")
+
+        await self.executer.execute({1: self._command(1, "output"), 2: failing})
+
+        succeeded, failed = self.recorder.commands
+        self.assertEqual((succeeded.stage, succeeded.exit_code, succeeded.output_bytes), ("docker-install", 0, 6))
+        self.assertEqual((failed.exit_code, failed.output_bytes), (3, 2))
+        self.assertLessEqual(succeeded.queued, succeeded.started)
+        self.assertLessEqual(succeeded.started, succeeded.ended)
+        self.assertLessEqual(succeeded.ended, failed.started)
+
+
+    async def test_output_listener_is_removed_after_the_run(self):
+        runner = EchoRunner()
+        for command in ("fail", "echo"):
+            entity = ExecutableCommandEntity(index=1, vm_instance_name="vm1", description="retried",
+                                             command=command, runner=runner)
+            await self.executer.execute({1: entity})
+
+            self.assertEqual(runner.output_listeners, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from domain.command.command_executer.concurrency_limiter import ConcurrencyLimiter
+from domain.command.command_executer.concurrency_limits import ConcurrencyLimits
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from domain.command.command_kind import CommandKind
+from domain.multipass.vm_entity import VmEntity
+from domain.multipass.vm_size import parse_size
+
+GIB = 1024 ** 3
+
+
+def command(vm_instance: str, text: str) -> ExecutableCommandEntity:
+    return ExecutableCommandEntity(index=1, vm_instance_name=vm_instance, description="task", command=text,
+                                   runner=MagicMock(spec=PortCommandRunner))
+
+
+class TestCommandKind(unittest.TestCase):
+    def test_of_command(self):
+        self.assertEqual(CommandKind.of_command("multipass launch -n vm1"), CommandKind.LAUNCH)
+        self.assertEqual(CommandKind.of_command("multipass exec vm1 -- ls"), CommandKind.EXEC)
+        self.assertEqual(CommandKind.of_command("sudo multipass restart vm1"), CommandKind.RESTART)
+        self.assertEqual(CommandKind.of_command("netplan apply"), CommandKind.HOST)
+
+    def test_parse_size(self):
+        self.assertEqual(parse_size("4G"), 4 * GIB)
+        self.assertEqual(parse_size("512M"), 512 * 1024 ** 2)
+        self.assertEqual(parse_size("10GiB"), 10 * GIB)
+        with self.assertRaises(ValueError):
+            parse_size("much")
+
+
+class TestConcurrencyLimiter(unittest.IsolatedAsyncioTestCase):
+    async def _peak(self, limiter: ConcurrencyLimiter, commands) -> int:
+        running = {"now": 0, "peak": 0}
+
+        async def run(executable_command):
+            async with limiter.slot(executable_command):
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+                await asyncio.sleep(0.01)
+                running["now"] -= 1
+
+        await asyncio.gather(*(run(executable_command) for executable_command in commands))
+        return running["peak"]
+
+    async def test_kind_limit_bounds_only_its_kind(self):
+        limiter = ConcurrencyLimiter(ConcurrencyLimits(kinds={CommandKind.LAUNCH: 3}))
+
+        launches = [command(f"vm{i}", f"multipass launch -n vm{i}") for i in range(10)]
+        execs = [command(f"vm{i}", f"multipass exec vm{i} -- ls") for i in range(10)]
+
+        self.assertEqual(await self._peak(limiter, launches), 3)
+        self.assertEqual(await self._peak(limiter, execs), 10)
+
+    async def test_global_limit(self):
+        limiter = ConcurrencyLimiter(ConcurrencyLimits(max_parallel=2))
+
+        execs = [command(f"vm{i}", f"multipass exec vm{i} -- ls") for i in range(6)]
+
+        self.assertEqual(await self._peak(limiter, execs), 2)
+
+    async def test_memory_budget_bounds_launches(self):
+        vms = {f"vm{i}": VmEntity(vm_instance=f"vm{i}", memory="4G") for i in range(6)}
+        limiter = ConcurrencyLimiter(ConcurrencyLimits(), vms=vms, memory_capacity=9 * GIB)
+
+        launches = [command(f"vm{i}", f"multipass launch -n vm{i}") for i in range(6)]
+
+        self.assertEqual(await self._peak(limiter, launches), 2)
+
+    async def test_launch_option_overrides_vm_entity(self):
+        limiter = ConcurrencyLimiter(ConcurrencyLimits(), vms={"vm1": VmEntity(vm_instance="vm1", memory="2G")})
+
+        memory, disk = limiter.resources_of(command("vm1", "multipass launch -n vm1 --memory 4G --disk 50G"))
+
+        self.assertEqual((memory, disk), (4 * GIB, 50 * GIB))
+
+    async def test_oversized_launch_runs_alone(self):
+        limiter = ConcurrencyLimiter(ConcurrencyLimits(), memory_capacity=2 * GIB)
+
+        launches = [command(f"vm{i}", f"multipass launch -n vm{i} --memory 8G") for i in range(3)]
+
+        self.assertEqual(await self._peak(limiter, launches), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from domain.multipass.golden_image import GOLDEN_IMAGE_PREFIX, GoldenImage
+from domain.multipass.multipass_instance import MultipassInstance
+
+
+class TestGoldenImage(unittest.TestCase):
+    def setUp(self):
+        self.image = GoldenImage.of_recipe(["install-hash", "prepare-hash"])
+
+    def _instances(self, *name_states):
+        return [MultipassInstance(name=name, state=state) for name, state in name_states]
+
+    def test_name_follows_the_recipe(self):
+        self.assertTrue(self.image.name.startswith(GOLDEN_IMAGE_PREFIX))
+        self.assertEqual(GoldenImage.of_recipe(["install-hash", "prepare-hash"]).name, self.image.name)
+        self.assertNotEqual(GoldenImage.of_recipe(["changed-hash", "prepare-hash"]).name, self.image.name)
+
+    def test_only_a_stopped_image_is_ready(self):
+        self.assertTrue(self.image.is_ready(self._instances((self.image.name, "Stopped"))))
+        # An interrupted build leaves the image running
+        self.assertFalse(self.image.is_ready(self._instances((self.image.name, "Running"))))
+        self.assertFalse(self.image.is_ready(self._instances((self.image.name, "Deleted"))))
+        self.assertFalse(self.image.is_ready([]))
+
+    def test_images_of_other_recipes_are_outdated(self):
+        instances = self._instances((self.image.name, "Stopped"), (f"{GOLDEN_IMAGE_PREFIX}0123456789ab", "Stopped"),
+                                    ("swarm-worker-1", "Running"), (f"{GOLDEN_IMAGE_PREFIX}deleted", "Deleted"))
+
+        self.assertEqual(self.image.outdated(instances), [f"{GOLDEN_IMAGE_PREFIX}0123456789ab"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from domain.multipass.multipass_instance import MultipassInstance
+from domain.multipass.reconcile_plan import ReconcilePlan
+
+LIST_OUTPUT = """{
+    "list": [
+        {"ipv4": ["10.0.0.2"], "name": "swarm-manager", "release": "24.04 LTS", "state": "Running"},
+        {"ipv4": ["10.0.0.3"], "name": "swarm-worker-1", "release": "24.04 LTS", "state": "Running"},
+        {"ipv4": [], "name": "swarm-worker-3", "release": "24.04 LTS", "state": "Deleted"},
+        {"ipv4": ["10.0.0.9"], "name": "other-vm", "release": "22.04 LTS", "state": "Stopped"}
+    ]
+}"""
+
+
+class TestMultipassInstance(unittest.TestCase):
+    def test_parse_list(self):
+        instances = MultipassInstance.parse_list(LIST_OUTPUT)
+
+        self.assertEqual([instance.name for instance in instances],
+                         ["swarm-manager", "swarm-worker-1", "swarm-worker-3", "other-vm"])
+        self.assertEqual(instances[0].ipv4, ["10.0.0.2"])
+        self.assertFalse(instances[2].exists)
+
+    def test_parse_list_rejects_other_output(self):
+        with self.assertRaises(ValueError):
+            MultipassInstance.parse_list("Name State IPv4")
+
+
+class TestReconcilePlan(unittest.TestCase):
+    def setUp(self):
+        self.instances = MultipassInstance.parse_list(LIST_OUTPUT)
+
+    def test_missing_workers_are_created(self):
+        plan = ReconcilePlan.diff("swarm-manager", ["swarm-worker-1", "swarm-worker-2", "swarm-worker-3"],
+                                  self.instances, ["swarm-manager", "swarm-worker-1"])
+
+        self.assertEqual(plan.to_create, ["swarm-worker-2", "swarm-worker-3"])
+        self.assertEqual(plan.unchanged, ["swarm-worker-1"])
+        self.assertEqual(plan.to_remove, [])
+
+    def test_existing_workers_outside_the_swarm_are_joined(self):
+        plan = ReconcilePlan.diff("swarm-manager", ["swarm-worker-1"], self.instances, ["swarm-manager"])
+
+        self.assertEqual(plan.to_join, ["swarm-worker-1"])
+        self.assertEqual(plan.to_create, [])
+        self.assertEqual(plan.unchanged, [])
+        self.assertFalse(plan.is_empty)
+
+    def test_only_swarm_members_are_removed(self):
+        plan = ReconcilePlan.diff("swarm-manager", [], self.instances,
+                                  ["swarm-manager", "swarm-worker-1", "swarm-worker-3"])
+
+        # other-vm is no swarm member, swarm-worker-3 is already deleted and the manager is never removed
+        self.assertEqual(plan.to_remove, ["swarm-worker-1"])
+
+    def test_matching_cluster_gives_empty_plan(self):
+        plan = ReconcilePlan.diff("swarm-manager", ["swarm-worker-1"], self.instances,
+                                  ["swarm-manager", "swarm-worker-1"])
+
+        self.assertTrue(plan.is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import random
+import unittest
+from itertools import islice
+
+from domain.readiness.backoff import Backoff
+
+
+class TestBackoff(unittest.TestCase):
+    def test_delays_grow_exponentially_up_to_the_maximum(self):
+        backoff = Backoff(initial=1, factor=2, max_delay=5, jitter=0)
+
+        self.assertEqual(list(islice(backoff.delays(), 5)), [1, 2, 4, 5, 5])
+
+    def test_jitter_stays_below_the_exponential_delay(self):
+        backoff = Backoff(initial=1, factor=2, max_delay=100, jitter=0.5)
+        rng = random.Random(7)
+
+        for attempt in range(6):
+            base = 2 ** attempt
+            delay = backoff.delay(attempt, rng)
+            self.assertGreaterEqual(delay, base * 0.5)
+            self.assertLessEqual(delay, base)
+
+    def test_same_seed_gives_same_delays(self):
+        backoff = Backoff()
+
+        self.assertEqual(list(islice(backoff.delays(random.Random(1)), 4)),
+                         list(islice(backoff.delays(random.Random(1)), 4)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from domain.command.command_builder.vm_parameter.parameter_type import ParameterType
+from domain.swarm.manager_facts import ManagerFacts
+
+FACTS_OUTPUT = """__TSW_FACT__ ip 10.0.0.2 172.17.0.1
+__TSW_FACT__ worker_token SWMTKN-worker
+__TSW_FACT__ manager_token SWMTKN-manager
+__TSW_FACT__ node swarm-manager
+__TSW_FACT__ node swarm-worker-1
+"""
+
+
+class TestManagerFacts(unittest.TestCase):
+    def test_parse(self):
+        facts = ManagerFacts.parse(FACTS_OUTPUT)
+
+        self.assertEqual(facts.ip, "10.0.0.2")
+        self.assertEqual(facts.worker_token, "SWMTKN-worker")
+        self.assertEqual(facts.manager_token, "SWMTKN-manager")
+        self.assertEqual(facts.nodes, ["swarm-manager", "swarm-worker-1"])
+
+    def test_as_parameters(self):
+        parameters = ManagerFacts.parse(FACTS_OUTPUT).as_parameters()
+
+        self.assertEqual(parameters[ParameterType.SWARM_MANAGER_IP], "10.0.0.2")
+        self.assertEqual(parameters[ParameterType.SWARM_MANAGER_PORT], "2377")
+        self.assertEqual(parameters[ParameterType.SWARM_TOKEN], "SWMTKN-worker")
+        self.assertEqual(parameters[ParameterType.SWARM_NODES], "swarm-manager,swarm-worker-1")
+
+    def test_missing_token_raises(self):
+        with self.assertRaises(ValueError):
+            ManagerFacts.parse("__TSW_FACT__ ip 10.0.0.2\n__TSW_FACT__ worker_token")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from domain.timing.command_timing import CommandTiming
+from domain.timing.run_timing_report import RunTimingReport
+from domain.timing.stage_timing import StageTiming
+from domain.timing.timing_recorder import TimingRecorder
+
+
+def stage(name, vm, started, ended, depends_on=()):
+    return StageTiming(key=f"{name}:{vm}", stage=name, vm_instance=vm, depends_on=list(depends_on),
+                       started=started, ended=ended)
+
+
+def command(vm, stage_name, started, ended, skipped=False):
+    return CommandTiming(vm_instance=vm, stage=stage_name, queued=started, started=started, ended=ended,
+                         skipped=skipped)
+
+
+class TestRunTimingReport(unittest.TestCase):
+    def setUp(self):
+        self.recorder = TimingRecorder()
+        for timing in [
+            stage("launch", "manager", 0, 10),
+            stage("launch", "worker", 0, 30),
+            stage("install", "manager", 10, 40, ["launch:manager"]),
+            stage("install", "worker", 30, 50, ["launch:worker"]),
+            stage("join", "worker", 50, 55, ["install:worker", "install:manager"]),
+        ]:
+            self.recorder.record_stage(timing)
+        for timing in [
+            command("manager", "launch", 0, 10),
+            command("worker", "launch", 0, 30),
+            command("manager", "install", 10, 40),
+            command("worker", "install", 30, 50),
+            command("worker", "join", 50, 55),
+            command("worker", "join", 50, 50, skipped=True),
+        ]:
+            self.recorder.record_command(timing)
+        self.report = RunTimingReport.of(self.recorder)
+
+    def test_critical_path_follows_the_dependency_finishing_last(self):
+        self.assertEqual([timing.key for timing in self.report.critical_path],
+                         ["launch:worker", "install:worker", "join:worker"])
+
+    def test_stage_wall_time_against_summed_time(self):
+        summaries = {summary.stage: summary for summary in self.report.stages}
+
+        self.assertEqual((summaries["launch"].wall, summaries["launch"].summed, summaries["launch"].vms), (30, 40, 2))
+        self.assertEqual((summaries["install"].wall, summaries["install"].summed), (40, 50))
+
+    def test_parallelism_of_the_run(self):
+        self.assertEqual(self.report.wall, 55)
+        self.assertEqual(self.report.busy, 95)
+        self.assertEqual(self.report.peak_parallel, 2)
+        self.assertEqual(self.report.commands, 6)
+
+    def test_format(self):
+        text = self.report.format()
+
+        self.assertIn("Critical path (55.0s):", text)
+        self.assertIn("parallelism 1.7x average, 2 peak", text)
+        self.assertEqual(RunTimingReport.of(TimingRecorder()).format(), "No timings recorded.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import unittest
+
+from benchmarks.swarm_benchmark import run_scenario
+from domain.command.command_runner_type_enum import CommandRunnerType
+from domain.swarm.manager_facts import ManagerFacts
+from infrastructure.adapters.command_runner.command_runner_factory import CommandRunnerFactory
+from infrastructure.adapters.command_runner.fake_multipass.fake_multipass import FakeMultipass
+from infrastructure.adapters.command_runner.fake_multipass.simulation_profile import Latency, SimulationProfile
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+from infrastructure.adapters.readiness.vm_probes import VmProbes
+
+
+class TestFakeMultipass(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.simulation = FakeMultipass()
+        self.runner = self.simulation.runner()
+
+    def tearDown(self):
+        CommandRunnerFactory.configure(None)
+
+    async def test_launch_creates_a_running_vm(self):
+        await self.runner.run("multipass launch -n vm1 --memory 4G --disk 50G")
+
+        listing = json.loads(await self.runner.run("multipass list --format json"))
+
+        self.assertEqual([("vm1", "Running")], [(vm["name"], vm["state"]) for vm in listing["list"]])
+        self.assertIn("State:          Running", await self.runner.run("multipass info vm1"))
+
+    async def test_exec_fails_on_missing_or_stopped_vm(self):
+        with self.assertRaises(CommandExecutionError):
+            await self.runner.run("multipass exec vm1 -- true")
+        await self.runner.run("multipass launch -n vm1")
+        await self.runner.run("multipass stop vm1")
+
+        with self.assertRaises(CommandExecutionError):
+            await self.runner.run("multipass exec vm1 -- true")
+
+    async def test_swarm_needs_docker_and_the_worker_token(self):
+        for name in ("manager", "worker"):
+            await self.runner.run(f"multipass launch -n {name}")
+        with self.assertRaises(CommandExecutionError):
+            await self.runner.run("multipass exec manager -- sudo docker swarm init")
+
+        for name in ("manager", "worker"):
+            await self.runner.run(f"multipass exec {name} -- sudo apt install -y docker-ce docker-ce-cli")
+        await self.runner.run("multipass exec manager -- sudo docker swarm init")
+        facts = ManagerFacts.parse(await self.runner.run(
+            "multipass exec manager -- bash -c 'echo \"__TSW_FACT__ ip $(hostname -I)\"'"))
+        await self.runner.run(f"multipass exec worker -- sudo docker swarm join --token {facts.worker_token} "
+                              f"{facts.ip}:2377")
+
+        self.assertEqual(["manager", "worker"], self.simulation.swarm_nodes)
+        self.assertEqual("active", self.simulation.vms["worker"].swarm)
+
+    async def test_failure_rate_fails_the_command(self):
+        runner = FakeMultipass(SimulationProfile(failure_rates={"launch": 1.0}, seed=1)).runner()
+
+        with self.assertRaises(CommandExecutionError):
+            await runner.run("multipass launch -n vm1")
+
+    async def test_latency_is_scaled(self):
+        simulation = FakeMultipass(SimulationProfile(latencies={"list": Latency(mean=1.0)}, time_scale=0.01))
+
+        await simulation.runner().run("multipass list")
+
+        self.assertAlmostEqual(0.01, simulation.simulated_seconds)
+        self.assertEqual({"list": 1}, simulation.operations)
+
+    async def test_factory_and_probes_use_the_configured_runner(self):
+        CommandRunnerFactory.configure(self.simulation.runner)
+        await CommandRunnerFactory().get_runner(CommandRunnerType.STREAM).run("multipass launch -n vm1")
+
+        self.assertTrue(await VmProbes.ssh_reachable("vm1").check())
+        self.assertFalse(await VmProbes.docker_socket_up("vm1").check())
+
+    async def test_docker_reads_daemon_json_when_it_starts(self):
+        CommandRunnerFactory.configure(self.simulation.runner)
+        mirror = VmProbes.registry_mirror_loaded("vm1", "http://10.42.0.2:5000")
+        await self.runner.run("multipass launch -n vm1")
+        await self.runner.run("multipass exec vm1 -- sudo apt install -y docker-ce docker-ce-cli")
+        await self.runner.run("multipass exec vm1 -- sudo sh -c 'mkdir -p /etc/docker && echo "
+                              "\"{\\\"registry-mirrors\\\": [\\\"http://10.42.0.2:5000\\\"]}\" "
+                              "> /etc/docker/daemon.json'")
+        self.assertFalse(await mirror.check())
+
+        await self.runner.run("multipass restart vm1")
+
+        self.assertTrue(await mirror.check())
+
+
+class TestSwarmBenchmark(unittest.TestCase):
+    def test_brings_up_a_simulated_swarm(self):
+        result = run_scenario(3, SimulationProfile.instant())
+
+        self.assertEqual([], result.failed)
+        self.assertEqual(0, result.failed_commands)
+        self.assertGreater(result.commands, 0)
+
+    def test_failed_commands_are_reported(self):
+        result = run_scenario(2, SimulationProfile(failure_rates={"launch": 1.0}, seed=0))
+
+        self.assertGreaterEqual(result.failed_commands, 2)
+        self.assertIn("launch:swarm-worker-1", result.failed)
+        # The stages after the launch are skipped
+        self.assertIn("swarm-join:swarm-worker-1", result.failed)
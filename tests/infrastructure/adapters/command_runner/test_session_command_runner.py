@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+from domain.command.remote_command import RemoteCommand
+from infrastructure.adapters.command_runner.remote_shell_session import RemoteShellSession
+from infrastructure.adapters.command_runner.session_command_runner import SessionPortCommandRunner
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+
+LOCAL_SHELL = ["bash", "--noprofile", "--norc"]
+
+
+class TestRemoteCommand(unittest.TestCase):
+    def test_parse_multipass_exec(self):
+        remote_command = RemoteCommand.parse("multipass exec swarm-manager -- sudo sh -c 'apt update -y'")
+
+        self.assertEqual(remote_command.vm_instance, "swarm-manager")
+        self.assertEqual(remote_command.remote, "sudo sh -c 'apt update -y'")
+
+    def test_parse_host_command(self):
+        self.assertIsNone(RemoteCommand.parse("multipass launch -n swarm-manager"))
+
+
+class TestSessionCommandRunner(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = RemoteShellSession("vm1", shell_command=LOCAL_SHELL)
+        patcher = patch.object(SessionPortCommandRunner, "get_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.runner = SessionPortCommandRunner()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+
+    async def test_commands_share_one_shell(self):
+        # $$ is the pid of the session shell, also inside the subshell of each command
+        first = await self.runner.run("multipass exec vm1 -- echo $$")
+        second = await self.runner.run("multipass exec vm1 -- echo $$")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.runner.status["result"], "Success")
+
+    async def test_failing_command_raises_with_exit_code(self):
+        with self.assertRaises(CommandExecutionError) as context:
+            await self.runner.run("multipass exec vm1 -- sh -c 'echo broken >&2; exit 3'")
+
+        self.assertEqual(context.exception.returnCode, 3)
+        self.assertIn("broken", context.exception.stderr)
+
+        # The session survives a failing command
+        self.assertEqual(await self.runner.run("multipass exec vm1 -- echo alive"), "alive")
+
+    async def test_output_without_final_newline(self):
+        self.assertEqual(await self.runner.run("multipass exec vm1 -- printf foo", timeout=5), "foo")
+        self.assertEqual(await self.runner.run("multipass exec vm1 -- echo bar"), "bar")
+
+    async def test_empty_lines_of_the_output_are_kept(self):
+        self.assertEqual(await self.session.execute("printf 'a\\n\\nb\\n\\n'"), (0, "a\n\nb\n"))
+        self.assertEqual(await self.session.execute("true"), (0, ""))
+
+    async def test_timeout_closes_session(self):
+        with self.assertRaises(CommandExecutionError) as context:
+            await self.runner.run("multipass exec vm1 -- sleep 5", timeout=1)
+
+        self.assertEqual(context.exception.returnCode, -1)
+        self.assertFalse(self.session.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
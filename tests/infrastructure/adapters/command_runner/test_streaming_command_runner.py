@@ -0,0 +1,43 @@
+import unittest
+
+from infrastructure.adapters.command_runner.streaming_command_runner import StreamingPortCommandRunner
+from infrastructure.adapters.exceptions.exception_command_execution import CommandExecutionError
+
+
+class TestStreamingCommandRunner(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.command_runner = StreamingPortCommandRunner(capture_lines=3)
+        self.lines = []
+        self.command_runner.add_output_listener(self.lines.append)
+
+    async def test_lines_are_forwarded_and_tail_is_bounded(self):
+        result = await self.command_runner.run("for i in 1 2 3 4 5; do echo line$i; done")
+
+        self.assertEqual(self.lines, ["line1", "line2", "line3", "line4", "line5"])
+        self.assertEqual(result, "line3\nline4\nline5")
+        self.assertEqual(self.command_runner.status["result"], "Success")
+
+    async def test_stream_yields_both_pipes(self):
+        lines = [line async for line in self.command_runner.stream("echo out; echo err >&2")]
+
+        self.assertCountEqual(lines, [("stdout", "out"), ("stderr", "err")])
+        self.assertEqual(self.command_runner.return_code, 0)
+
+    async def test_failing_command_raises_with_stderr(self):
+        with self.assertRaises(CommandExecutionError) as context:
+            await self.command_runner.run("echo partial; echo broken >&2; exit 2")
+
+        self.assertEqual(context.exception.returnCode, 2)
+        self.assertEqual(context.exception.stdout, "partial")
+        self.assertEqual(context.exception.stderr, "broken")
+
+    async def test_timeout_kills_process(self):
+        with self.assertRaises(CommandExecutionError) as context:
+            await self.command_runner.run("echo started; sleep 5", timeout=1)
+
+        self.assertEqual(context.exception.returnCode, -1)
+        self.assertEqual(self.lines, ["started"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from infrastructure.adapters.file_management.parsed_file_cache import ParsedFileCache
+
+
+class TestParsedFileCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "data.yaml"
+        self.path.write_text("one")
+        self.cache = ParsedFileCache()
+        self.parse = MagicMock(side_effect=lambda path: path.read_text())
+
+    def test_unchanged_file_is_parsed_once(self):
+        self.assertEqual(self.cache.get(self.path, self.parse), "one")
+        self.assertEqual(self.cache.get(self.path, self.parse), "one")
+
+        self.parse.assert_called_once()
+
+    def test_changed_file_is_parsed_again(self):
+        self.cache.get(self.path, self.parse)
+        self.path.write_text("three")
+
+        self.assertEqual(self.cache.get(self.path, self.parse), "three")
+
+    def test_replaced_file_with_same_mtime_is_parsed_again(self):
+        self.cache.get(self.path, self.parse)
+        stat = os.stat(self.path)
+        replacement = self.path.with_name("new.yaml")
+        replacement.write_text("two")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, self.path)
+
+        self.assertEqual(self.cache.get(self.path, self.parse), "two")
+
+    def test_invalidate(self):
+        self.cache.get(self.path, self.parse)
+        self.cache.invalidate(self.path)
+        self.cache.get(self.path, self.parse)
+
+        self.assertEqual(self.parse.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
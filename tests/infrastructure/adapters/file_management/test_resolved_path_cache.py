@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from infrastructure.adapters.file_management.resolved_path_cache import ResolvedPathCache
+
+
+class TestResolvedPathCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.first = Path(directory.name) / "config"
+        self.second = Path(directory.name) / "config" / "multipass"
+        self.second.mkdir(parents=True)
+        self.search_paths = [str(self.first), str(self.second)]
+        (self.second / "vms.yaml").write_text("vms: []")
+        self.cache = ResolvedPathCache()
+
+    def resolve(self, filename: str = "vms.yaml"):
+        return self.cache.resolve("cwd", filename, self.search_paths)
+
+    def test_unchanged_directories_are_not_probed_again(self):
+        self.assertEqual(self.resolve(), str(self.second / "vms.yaml"))
+
+        with patch.object(Path, "is_file", side_effect=AssertionError("probed")):
+            self.assertEqual(self.resolve(), str(self.second / "vms.yaml"))
+
+    def test_file_created_in_earlier_directory_shadows_the_cached_one(self):
+        self.resolve()
+        (self.first / "vms.yaml").write_text("vms: []")
+        self.touch_later(self.first)
+
+        self.assertEqual(self.resolve(), str(self.first / "vms.yaml"))
+
+    def test_deleted_file_is_not_returned(self):
+        self.resolve()
+        (self.second / "vms.yaml").unlink()
+        self.touch_later(self.second)
+
+        self.assertIsNone(self.resolve())
+
+    def test_invalidate_drops_the_entry(self):
+        mtime = os.stat(self.first).st_mtime_ns
+        self.resolve()
+        (self.first / "vms.yaml").write_text("vms: []")
+        # Unchanged directory time, as on a file system with coarse timestamps
+        os.utime(self.first, ns=(mtime, mtime))
+        self.assertEqual(self.resolve(), str(self.second / "vms.yaml"))
+
+        self.cache.invalidate("vms.yaml")
+
+        self.assertEqual(self.resolve(), str(self.first / "vms.yaml"))
+
+    def test_search_paths_are_built_once_per_working_directory(self):
+        calls = []
+
+        def build(cwd):
+            calls.append(cwd)
+            return [cwd]
+
+        self.cache.search_paths("a", build)
+        self.cache.search_paths("a", build)
+        self.cache.search_paths("b", build)
+
+        self.assertEqual(calls, ["a", "b"])
+
+    @staticmethod
+    def touch_later(directory: Path):
+        """Moves the directory time forward, the test may run within the timestamp granularity."""
+        mtime = os.stat(directory).st_mtime_ns + 1_000_000_000
+        os.utime(directory, ns=(mtime, mtime))
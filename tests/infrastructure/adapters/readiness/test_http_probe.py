@@ -0,0 +1,49 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from infrastructure.adapters.readiness.http_probe import HttpProbe
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 200 if self.path == "/" else 404
+        self.send_response(status)
+        self.end_headers()
+        self.wfile.write(b"Portainer")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpProbe(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("127.0.0.1", 0), Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    async def test_ready_with_expected_status_and_text(self):
+        self.assertTrue(await HttpProbe(self.url, contains="Portainer").check())
+
+    async def test_not_ready_with_other_status(self):
+        self.assertFalse(await HttpProbe(f"{self.url}/missing").check())
+
+    async def test_not_ready_without_expected_text(self):
+        self.assertFalse(await HttpProbe(self.url, contains="Registry").check())
+
+    async def test_not_ready_if_nothing_listens(self):
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        url = f"http://127.0.0.1:{server.server_port}"
+        server.server_close()
+
+        self.assertFalse(await HttpProbe(url, timeout=1).check())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from ruamel.yaml import YAML
+
+from domain.cache.package_cache import PackageCache
+from domain.network.ip_value import IpValue
+from domain.network.network import Network
+from infrastructure.adapters.repositories.cloud_init_repository_yaml import (CLOUD_CONFIG_HEADER,
+                                                                             DAEMON_CONFIG_PATH, NETPLAN_PATH,
+                                                                             PortCloudInitRepositoryYaml)
+
+TEMPLATE = Path(__file__).parents[4] / "docker" / "config" / "multipass" / "cloud_init_template.yaml"
+
+
+class TestPortCloudInitRepositoryYaml(unittest.TestCase):
+    def setUp(self):
+        self.file_manager = MagicMock()
+        self.file_manager.load.side_effect = lambda path: TEMPLATE.read_text()
+        for target in ("infrastructure.adapters.repositories.cloud_init_repository_yaml.infra_core_container.resolve",
+                       "infrastructure.adapters.repositories.netplan_repository.infra_core_container.resolve"):
+            patcher = patch(target, return_value=self.file_manager)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.repository = PortCloudInitRepositoryYaml()
+
+    def test_template_installs_docker(self):
+        user_data = self.repository.create()
+
+        self.assertIn("docker-ce", user_data["packages"])
+        self.assertEqual(user_data["runcmd"], ["usermod -aG docker ubuntu"])
+        self.assertNotIn("write_files", user_data)
+
+    def test_static_network_is_applied_first(self):
+        network = Network(vm_instance="swarm-manager", ip_address=IpValue(ip_address="192.168.1.2"),
+                          gateway=IpValue(ip_address="192.168.1.1"))
+
+        user_data = self.repository.create(network=network)
+
+        netplan = YAML(typ="safe").load(user_data["write_files"][0]["content"])
+        self.assertEqual(user_data["write_files"][0]["path"], NETPLAN_PATH)
+        self.assertEqual(netplan["network"]["ethernets"]["ens3"]["addresses"], ["192.168.1.2/24"])
+        self.assertEqual(user_data["runcmd"][0], "netplan apply")
+
+    def test_package_cache(self):
+        user_data = self.repository.create(cache=PackageCache(host="192.168.1.2"))
+
+        self.assertEqual(user_data["apt"]["proxy"], "http://192.168.1.2:3142")
+        self.assertIn("http://192.168.1.2:3142/HTTPS///download.docker.com/linux/ubuntu",
+                      user_data["apt"]["sources"]["docker.list"]["source"])
+        daemon_config = next(entry for entry in user_data["write_files"] if entry["path"] == DAEMON_CONFIG_PATH)
+        self.assertIn("http://192.168.1.2:5000", daemon_config["content"])
+
+    def test_saved_user_data_starts_with_cloud_config_header(self):
+        self.repository.save("swarm-worker-1", self.repository.create())
+
+        path = self.file_manager.save.call_args.kwargs["path"]
+        content = self.file_manager.save.call_args.kwargs["data"]
+        self.assertEqual(path.name, PortCloudInitRepositoryYaml.file_name("swarm-worker-1"))
+        self.assertTrue(content.startswith(CLOUD_CONFIG_HEADER))
+        self.assertEqual(YAML(typ="safe").load(content)["packages"], self.repository.create()["packages"])
+
+
+if __name__ == "__main__":
+    unittest.main()
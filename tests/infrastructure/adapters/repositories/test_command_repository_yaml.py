@@ -0,0 +1,30 @@
+import os
+import unittest
+
+import yaml
+
+from benchmarks.swarm_benchmark import CONFIG_DIR
+from domain.command.command_runner_type_enum import CommandRunnerType
+
+# Commands running for minutes, their output is streamed instead of buffered until they finished
+LONG_RUNNING = {
+    "command_multipass_init_repository_yaml.yaml": [1],
+    "command_multipass_cloud_init_launch_yaml.yaml": [1, 2],
+    "command_multipass_golden_image_launch_yaml.yaml": [1],
+    "command_multipass_clone_repository_yaml.yaml": [1],
+}
+
+
+class TestCommandRepositoryYaml(unittest.TestCase):
+    def test_long_running_commands_use_the_stream_runner(self):
+        for filename, indexes in LONG_RUNNING.items():
+            with open(os.path.join(CONFIG_DIR, "multipass", filename)) as file:
+                commands = {command["index"]: command for command in yaml.safe_load(file)["commands"]}
+            for index in indexes:
+                with self.subTest(filename=filename, index=index):
+                    self.assertEqual(CommandRunnerType.STREAM,
+                                     CommandRunnerType.get_enum_from_value(commands[index]["runner"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from domain.multipass.vm_entity import VmEntity
+from domain.multipass.vm_type import VmType
+from infrastructure.adapters.file_management.parsed_file_cache import ParsedFileCache
+from infrastructure.adapters.repositories.vm_repository_yaml import PortVmRepositoryYaml
+
+VMS_YAML = """vms:
+  - vm_instance: "swarm-manager"
+    vm_type: "manager"
+    memory: "4G"
+  - vm_instance: "swarm-worker-1"
+    vm_type: "worker"
+"""
+
+
+class TestPortVmRepositoryYaml(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "vms_repository.yaml"
+        self.path.write_text(VMS_YAML)
+
+        self.file_manager = MagicMock()
+        self.file_manager.locate.return_value = self.path
+        self.file_manager.load.side_effect = lambda path: self.path.read_text()
+        self.file_manager.save.side_effect = lambda path, data: self.path.write_text(data)
+
+        for patcher in (
+                patch("infrastructure.adapters.repositories.vm_repository_yaml.infra_core_container.resolve",
+                      return_value=self.file_manager),
+                patch.object(PortVmRepositoryYaml, "_cache", ParsedFileCache())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_instances_share_one_parsed_inventory(self):
+        first = PortVmRepositoryYaml()
+        second = PortVmRepositoryYaml()
+
+        self.assertIs(first.inventory, second.inventory)
+        self.assertEqual(first.find_vm_instances_by_type(VmType.WORKER), ["swarm-worker-1"])
+        self.assertEqual(second.get_vm_by_name("swarm-manager").memory, "4G")
+        self.assertEqual(self.file_manager.load.call_count, 1)
+
+    def test_save_invalidates_the_inventory(self):
+        repository = PortVmRepositoryYaml()
+        inventory = repository.inventory
+
+        repository.save()
+
+        self.assertIsNot(repository.inventory, inventory)
+        self.assertEqual(len(repository.get_all_vms()), 2)
+
+    def test_add_update_remove_keep_the_indexes_current(self):
+        repository = PortVmRepositoryYaml()
+
+        repository.add_vm(VmEntity(vm_instance="swarm-worker-2", vm_type=VmType.WORKER))
+        repository.update_vm(VmEntity(vm_instance="swarm-manager", vm_type=VmType.MANAGER, memory="8G"))
+        repository.remove_vm("swarm-worker-1")
+
+        self.assertEqual(repository.find_vm_instances_by_type(VmType.WORKER), ["swarm-worker-2"])
+        self.assertEqual(repository.get_vm_by_name("swarm-manager").memory, "8G")
+        self.assertIsNone(repository.get_vm_by_name("swarm-worker-1"))
+        # The written file holds the same VMs, readers get the stored inventory without parsing again
+        self.assertEqual(PortVmRepositoryYaml().get_all_vms(), repository.get_all_vms())
+        self.assertEqual(self.file_manager.load.call_count, 2)  # inventory and the builder for the changes
+
+    def test_remove_unknown_vm_raises(self):
+        with self.assertRaises(ValueError):
+            PortVmRepositoryYaml().remove_vm("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import json
+import os
+import tempfile
+import unittest
+
+from domain.timing.command_timing import CommandTiming
+from domain.timing.stage_timing import StageTiming
+from domain.timing.timing_recorder import TimingRecorder
+from infrastructure.adapters.timing.chrome_trace_writer import ChromeTraceWriter
+
+
+class TestChromeTraceWriter(unittest.TestCase):
+    def setUp(self):
+        self.recorder = TimingRecorder()
+        self.recorder.record_stage(StageTiming(key="launch:worker", stage="launch", vm_instance="worker",
+                                               started=100.0, ended=102.0))
+        self.recorder.record_command(CommandTiming(vm_instance="worker", stage="launch", description="Launch worker",
+                                                   command="multipass launch", queued=100.0, started=100.5,
+                                                   spawned=100.501, ended=101.5, exit_code=0, output_bytes=12))
+
+    def test_stages_and_commands_are_complete_events_on_the_vm_thread(self):
+        events = ChromeTraceWriter(self.recorder).to_dict()["traceEvents"]
+
+        threads = {event["args"]["name"]: event["tid"] for event in events if event["name"] == "thread_name"}
+        complete = {event["cat"]: event for event in events if event["ph"] == "X"}
+        self.assertEqual((complete["stage"]["ts"], complete["stage"]["dur"]), (0.0, 2_000_000.0))
+        self.assertEqual((complete["command"]["ts"], complete["command"]["dur"]), (500_000.0, 1_000_000.0))
+        self.assertEqual(complete["command"]["tid"], threads["worker"])
+        self.assertEqual(complete["command"]["args"]["spawn_latency_ms"], 1.0)
+        self.assertEqual(complete["command"]["args"]["wait_ms"], 500.0)
+
+    def test_save_writes_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = ChromeTraceWriter(self.recorder).save(os.path.join(directory, "logs", "trace.json"))
+
+            self.assertIn("traceEvents", json.loads(path.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    unittest.main()
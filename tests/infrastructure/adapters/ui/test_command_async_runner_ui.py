@@ -0,0 +1,117 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from application.ports.ui.port_ui import PortUI
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from infrastructure.adapters.exceptions.exception_command_retry import CommandRetriesExhaustedError
+from infrastructure.adapters.exceptions.exception_commands_failed import CommandsFailedError
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
+from infrastructure.adapters.ui.command_sync_runner_ui import SyncCommandRunnerUI
+from infrastructure.adapters.ui.factory_ui import FactoryUI
+
+
+class RecordingUI(PortUI):
+    def start(self):
+        pass
+
+
+class TestAsyncCommandRunnerUI(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.running = {"now": 0, "peak": 0}
+
+    def _command_list(self, instances, run):
+        command_list = {}
+        for vm in instances:
+            runner = MagicMock(spec=PortCommandRunner)
+            runner.run = AsyncMock(side_effect=run)
+            runner.status = {"current_step": "Executing command", "result": "Success"}
+            command_list[vm] = {1: ExecutableCommandEntity(index=1, vm_instance_name=vm, description="join",
+                                                           command=f"join {vm}", runner=runner)}
+        return command_list
+
+    async def _tracked(self, command, timeout=120):
+        self.running["now"] += 1
+        self.running["peak"] = max(self.running["peak"], self.running["now"])
+        await asyncio.sleep(0.01)
+        self.running["now"] -= 1
+        return command
+
+    async def test_parallelism_is_bounded(self):
+        instances = [f"worker-{i}" for i in range(6)]
+        runner_ui = AsyncCommandRunnerUI(self._command_list(instances, self._tracked), ui=RecordingUI(instances),
+                                         max_parallel=2)
+
+        results = await runner_ui.run()
+
+        self.assertEqual(self.running["peak"], 2)
+        self.assertEqual(results, [{1: f"join {vm}"} for vm in instances])
+
+    async def test_failed_vm_is_retried(self):
+        failures = {"worker-1": 2}
+
+        async def flaky(command, timeout=120):
+            vm = command.split()[1]
+            if failures.get(vm, 0) > 0:
+                failures[vm] -= 1
+                raise RuntimeError("join failed")
+            return command
+
+        instances = ["worker-1", "worker-2"]
+        command_list = self._command_list(instances, flaky)
+        runner_ui = AsyncCommandRunnerUI(command_list, ui=RecordingUI(instances), attempts=3, retry_delay=0)
+
+        results = await runner_ui.run()
+
+        self.assertEqual(results, [{1: "join worker-1"}, {1: "join worker-2"}])
+        self.assertEqual(command_list["worker-1"][1].runner.run.await_count, 3)
+        self.assertEqual(command_list["worker-2"][1].runner.run.await_count, 1)
+
+    async def test_exhausted_retries_are_reported(self):
+        async def broken(command, timeout=120):
+            raise RuntimeError("join failed")
+
+        runner_ui = AsyncCommandRunnerUI(self._command_list(["worker-1"], broken), ui=RecordingUI(["worker-1"]),
+                                         attempts=2, retry_delay=0)
+
+        results = await runner_ui.run()
+
+        self.assertIsInstance(results[0], CommandRetriesExhaustedError)
+        self.assertEqual(results[0].failed_keys, [1])
+
+    async def test_failed_commands_raise_for_the_stage(self):
+        async def launch(command, timeout=120):
+            if command == "join worker-2":
+                raise RuntimeError("launch failed")
+            return command
+
+        instances = ["worker-1", "worker-2"]
+        runner_ui = AsyncCommandRunnerUI(self._command_list(instances, launch), ui=RecordingUI(instances))
+
+        results = await runner_ui.run()
+
+        self.assertEqual(runner_ui.failures(results), {"worker-2": [1]})
+        with self.assertRaises(CommandsFailedError) as raised:
+            runner_ui.raise_for_failures(results)
+        self.assertEqual(raised.exception.failures, {"worker-2": [1]})
+
+    async def test_owned_ui_is_closed(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        FactoryUI.configure(headless=True, progress_file=os.path.join(directory.name, "progress.jsonl"))
+        self.addCleanup(FactoryUI.configure)
+
+        for runner_class in (AsyncCommandRunnerUI, SyncCommandRunnerUI):
+            runner_ui = runner_class(self._command_list(["worker-1"], self._tracked))
+            await runner_ui.run()
+
+            self.assertTrue(runner_ui.owns_ui)
+            self.assertTrue(runner_ui.ui.closed.is_set())
+            self.assertTrue(runner_ui.ui.stream.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
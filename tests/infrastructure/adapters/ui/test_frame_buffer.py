@@ -0,0 +1,34 @@
+import unittest
+
+from infrastructure.adapters.ui.frame_buffer import CellChange, FrameBuffer
+
+
+class TestFrameBuffer(unittest.TestCase):
+    def setUp(self):
+        self.buffer = FrameBuffer()
+        self.buffer.diff({(0, 0): ("manager", 1), (2, 0): ("Step: Installing docker", 0)})
+
+    def test_first_frame_draws_every_cell(self):
+        self.assertEqual(len(FrameBuffer().diff({(0, 0): ("a", 0), (0, 20): ("b", 0)})), 2)
+
+    def test_unchanged_frame_draws_nothing(self):
+        self.assertEqual(self.buffer.diff({(0, 0): ("manager", 1), (2, 0): ("Step: Installing docker", 0)}), [])
+
+    def test_shorter_text_blanks_the_rest_of_the_previous_text(self):
+        changes = self.buffer.diff({(0, 0): ("manager", 1), (2, 0): ("Step: Done", 0)})
+
+        self.assertEqual(changes, [CellChange(2, 0, "Step: Done", 0, 13)])
+
+    def test_removed_cell_is_blanked(self):
+        changes = self.buffer.diff({(0, 0): ("manager", 1)})
+
+        self.assertEqual(changes, [CellChange(2, 0, "", 0, 23)])
+
+    def test_invalidate_draws_every_cell_again(self):
+        self.buffer.invalidate()
+
+        self.assertEqual(len(self.buffer.diff({(0, 0): ("manager", 1)})), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
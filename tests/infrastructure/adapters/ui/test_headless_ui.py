@@ -0,0 +1,82 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from domain.command.command_executer.status_event import StatusEvent
+from infrastructure.adapters.ui.factory_ui import FactoryUI
+from infrastructure.adapters.ui.headless_ui import HeadlessUI
+from infrastructure.adapters.ui.ui_session import UiSession
+
+
+class TestHeadlessUI(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.ui = HeadlessUI(["manager"], stream=self.stream)
+
+    def _lines(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    async def test_status_transitions_are_written_as_json_lines(self):
+        self.ui.publish(StatusEvent(instance="manager", task="Install", step="apt", result="Running...", timestamp=10.0))
+        self.ui.publish(StatusEvent(instance="manager", task="Install", step="apt", result="Success", timestamp=12.5))
+        self.ui.update_status("unknown", task="ignored", step="")
+
+        first, second = self._lines()
+        self.assertEqual({k: first[k] for k in ("event", "stage", "vm", "task", "step", "result", "duration_ms")},
+                         {"event": "status", "stage": "", "vm": "manager", "task": "Install", "step": "apt",
+                          "result": "Running...", "duration_ms": None})
+        self.assertEqual(second["result"], "Success")
+        self.assertEqual(second["duration_ms"], 2500.0)
+        self.assertIn("timestamp", second)
+        self.assertTrue(self.ui.events.empty())
+
+    async def test_stage_end_carries_the_stage_duration(self):
+        self.ui.publish(StatusEvent(instance="manager", stage="launch", timestamp=1.0))
+        self.ui.publish(StatusEvent(instance="manager", task="Launch", step="multipass launch", timestamp=2.0))
+        self.ui.publish(StatusEvent(instance="manager", stage="", timestamp=31.0))
+
+        lines = self._lines()
+        self.assertEqual([(line["event"], line["stage"]) for line in lines],
+                         [("stage-start", "launch"), ("status", "launch"), ("stage-end", "launch")])
+        self.assertEqual(lines[2]["duration_ms"], 30000.0)
+
+    async def test_session_needs_no_render_thread(self):
+        with patch("application.ports.ui.port_ui.ThreadPoolExecutor") as executor:
+            async with UiSession.open(self.ui):
+                self.ui.update_status("manager", task="Join", step="swarm", result="Success")
+
+        executor.assert_not_called()
+        self.assertEqual(len(self._lines()), 1)
+
+    async def test_output_file_is_appended(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "progress.jsonl")
+            for task in ("first run", "second run"):
+                ui = HeadlessUI(["manager"], output=path)
+                ui.update_status("manager", task=task, step="")
+                ui.close()
+
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual([json.loads(line)["task"] for line in file], ["first run", "second run"])
+
+
+class TestFactoryUI(unittest.TestCase):
+    def tearDown(self):
+        FactoryUI.configure()
+
+    def test_headless_without_tty(self):
+        with patch("sys.stdout.isatty", return_value=False):
+            self.assertIsInstance(FactoryUI().get_ui(instances=["manager"]), HeadlessUI)
+
+    def test_configured_terminal_ui_wins(self):
+        FactoryUI.configure(headless=False)
+
+        with patch("sys.stdout.isatty", return_value=False):
+            self.assertNotIsInstance(FactoryUI().get_ui(instances=["manager"]), HeadlessUI)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -152,3 +152,36 @@ class TestLinuxUI(unittest.TestCase):
 
         # Assert the desired string exists
         assert any("All instances completed" in call for call in calls)
+
+
+class TestLinuxUIRedraw(unittest.TestCase):
+    @patch("infrastructure.adapters.ui.linux_ui.curses.curs_set")
+    def test_only_changed_cells_are_redrawn(self, mock_curs_set):
+        ui = LinuxUI(["Instance1", "Instance2"], persistent=True)
+        mock_stdscr = MagicMock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        frames = []
+
+        def next_frame(started):
+            frames.append(mock_stdscr.addstr.call_args_list[:])
+            mock_stdscr.addstr.reset_mock()
+            if len(frames) == 1:
+                ui.update_status("Instance2", task="Task2", step="Installing", result="Running...")
+            elif len(frames) == 2:
+                # Nothing changed, e.g. a wake-up after the idle timeout
+                pass
+            else:
+                ui.close()
+
+        with patch.object(ui, "_wait_for_next_frame", side_effect=next_frame):
+            ui._draw_ui(mock_stdscr)
+
+        # Header, stage and three status lines per instance
+        self.assertEqual(len(frames[0]), 10)
+        self.assertEqual([c.args[:3] for c in frames[1]],
+                         [(2, 40, "Task: Task2"), (2, 51, " " * 6), (3, 40, "Step: Installing"),
+                          (3, 56, " " * 5), (4, 40, "Status: Running...")])
+        self.assertEqual(frames[2], [])
+        # The frame without changes is not sent to the terminal, the closing one is
+        self.assertEqual(mock_stdscr.refresh.call_count, 3)
+        mock_stdscr.clear.assert_called_once()
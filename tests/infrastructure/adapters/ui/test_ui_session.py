@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.ports.commands.port_command_runner import PortCommandRunner
+from application.ports.ui.port_ui import PortUI
+from domain.command.command_executer.excecuteable_commands import ExecutableCommandEntity
+from infrastructure.adapters.ui.command_async_runner_ui import AsyncCommandRunnerUI
+from infrastructure.adapters.ui.ui_session import UiSession
+
+
+class SessionUI(PortUI):
+    def __init__(self, instances):
+        super().__init__(instances, persistent=True)
+        self.starts = 0
+        self.stages_seen = []
+
+    def start(self):
+        self.starts += 1
+        while not self.is_finished():
+            for event in self.wait_for_events(timeout=0.05):
+                if event.stage is not None:
+                    self.stages_seen.append((event.instance, event.stage))
+
+
+class TestUiSession(unittest.IsolatedAsyncioTestCase):
+    def _command_list(self, vm):
+        runner = MagicMock(spec=PortCommandRunner)
+        runner.run = AsyncMock(return_value="ok")
+        runner.status = {"current_step": "Executing command", "result": "Success"}
+        return {vm: {1: ExecutableCommandEntity(index=1, vm_instance_name=vm, description="install",
+                                                command=f"install {vm}", runner=runner)}}
+
+    async def test_runners_attach_to_the_open_session(self):
+        ui = SessionUI(["manager"])
+
+        async with UiSession.open(ui):
+            await AsyncCommandRunnerUI(self._command_list("manager"), stage="launch").run()
+            await AsyncCommandRunnerUI(self._command_list("manager"), stage="docker-install").run()
+
+        self.assertEqual(ui.starts, 1)
+        self.assertIsNone(UiSession.current())
+        self.assertEqual(ui.stages_seen, [("manager", "launch"), ("manager", ""),
+                                          ("manager", "docker-install"), ("manager", "")])
+
+    async def test_attach_adds_unknown_instances(self):
+        ui = SessionUI(["manager"])
+
+        ui.attach(["tsw-golden-image"], "golden-image")
+        ui.update_status("tsw-golden-image", task="Launch", step="Running", result="Running...")
+
+        self.assertEqual(ui.instances, ["manager", "tsw-golden-image"])
+        self.assertEqual(ui.stage_of("tsw-golden-image"), "golden-image")
+        self.assertEqual(ui.status["tsw-golden-image"]["current_task"], "Launch")
+
+    async def test_detach_keeps_a_stage_entered_meanwhile(self):
+        ui = SessionUI(["worker"])
+
+        ui.attach(["worker"], "restart-docker")
+        ui.attach(["worker"], "swarm-join")
+        ui.detach(["worker"], "restart-docker")
+
+        self.assertEqual(ui.stage_of("worker"), "swarm-join")
+
+
+if __name__ == "__main__":
+    unittest.main()
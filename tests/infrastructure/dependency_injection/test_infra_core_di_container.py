@@ -0,0 +1,70 @@
+import inspect
+import unittest
+from unittest.mock import patch
+
+from infrastructure.dependency_injection.infra_core_di_annotations import inject
+from infrastructure.dependency_injection.infra_core_di_container import infra_core_container
+from infrastructure.dependency_injection.infra_core_di_lifetime import Lifetime
+
+
+class Clock:
+    pass
+
+
+class Reader:
+    def __init__(self, clock: Clock):
+        self.clock = clock
+
+
+class Writer:
+    @inject
+    def __init__(self, filename: str, clock: Clock):
+        self.filename = filename
+        self.clock = clock
+
+
+class TestInfraCoreContainer(unittest.TestCase):
+    def setUp(self):
+        infra_core_container.register(Clock, lifetime=Lifetime.SINGLETON)
+        infra_core_container.register(Reader)
+
+    def tearDown(self):
+        for class_type in (Clock, Reader):
+            infra_core_container.services.pop(class_type, None)
+            infra_core_container.lifetimes.pop(class_type, None)
+            infra_core_container.singletons.pop(class_type, None)
+        infra_core_container.plans = {}
+        infra_core_container.injection_plans = {}
+
+    def test_signature_is_inspected_once_per_class(self):
+        with patch("infrastructure.dependency_injection.infra_core_di_resolution_plan.inspect.signature",
+                   wraps=inspect.signature) as signature:
+            infra_core_container.resolve(Reader)
+            infra_core_container.resolve(Reader)
+
+        self.assertEqual(signature.call_count, 2)  # Reader and Clock
+
+    def test_singleton_is_created_once_and_transient_per_resolve(self):
+        first, second = infra_core_container.resolve(Reader), infra_core_container.resolve(Reader)
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.clock, second.clock)
+
+    def test_registered_instance_is_returned(self):
+        clock = Clock()
+        infra_core_container.register(Clock, clock)
+
+        self.assertIs(infra_core_container.resolve(Reader).clock, clock)
+
+    def test_registration_replaces_the_singleton(self):
+        before = infra_core_container.resolve(Clock)
+        infra_core_container.register(Clock, lifetime=Lifetime.SINGLETON)
+
+        self.assertIsNot(infra_core_container.resolve(Clock), before)
+
+    def test_inject_fills_only_missing_dependencies(self):
+        clock = Clock()
+
+        self.assertIs(Writer("a.yaml").clock, infra_core_container.resolve(Clock))
+        self.assertIs(Writer("a.yaml", clock).clock, clock)
+        self.assertIs(Writer("a.yaml", clock=clock).clock, clock)